@@ -1,5 +1,17 @@
-import requests
+import hashlib
 import math
+import os
+import sys
+from threading import Lock
+import numpy as np
+
+# Add project root to Python path
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+if project_root not in sys.path:
+    sys.path.append(project_root)
+
+from core.Backends import GetHttpClient
+from core.GitHub import GetGitHubClient, GitHubAPIError
 from sentence_transformers import SentenceTransformer, util
 
 #############################################
@@ -11,13 +23,26 @@ GEMINI_API_ENDPOINT = "https://api.gemini.example.com/v1/generate"  # Replace wi
 GEMINI_API_KEY = "GOOGLE_API_KEY"  # Replace with your key
 GEMINI_TEMPERATURE = 0.3  # Lower temperature for more deterministic responses
 
-# GitHub API settings
-GITHUB_API_TOKEN = "GITHUB_API_KEY"  # Replace with your GitHub token
-GITHUB_API_ENDPOINT = "https://api.github.com"
-
 # Normalization factor for project scoring
 NORM_FACTOR = 100  # Adjust this value to calibrate the raw scores into a 0-100 scale
 
+# requests-compatible client; SMARTHIRE_BACKEND=record/replay swaps in the cassette-backed one
+http = GetHttpClient()
+
+# Shared pooled, paginated GitHub client; GITHUB_API_TOKEN and GITHUB_API_ENDPOINT come from .env
+github = GetGitHubClient()
+
+# Repo descriptions are encoded in batches of this size by one encode() call
+ENCODE_BATCH_SIZE = 64
+
+# Job description embeddings by (id of the model, sha256 of the text); a job
+# description is scored against many candidates, so it is encoded once per
+# process. Entries hold a reference to their model, so its id cannot be reused
+# by another model while the entry exists.
+MAX_CACHED_JOB_EMBEDDINGS = 128
+_job_embeddings = {}
+_job_embeddings_lock = Lock()
+
 #############################################
 # HELPER FUNCTIONS
 #############################################
@@ -39,37 +64,65 @@ def compute_text_similarity(text1, text2, model):
     similarity = util.pytorch_cos_sim(embeddings[0], embeddings[1])
     return similarity.item()
 
+def encode_job_description(job_description, model):
+    """
+    Return the normalized embedding of job_description, encoding it only the
+    first time it is seen with this model.
+    """
+    key = (id(model), hashlib.sha256(job_description.encode("utf-8")).hexdigest())
+    with _job_embeddings_lock:
+        cached = _job_embeddings.get(key)
+    if cached is not None:
+        return cached[1]
+
+    embedding = model.encode([job_description], convert_to_numpy=True, normalize_embeddings=True)[0]
+    with _job_embeddings_lock:
+        if len(_job_embeddings) >= MAX_CACHED_JOB_EMBEDDINGS:
+            _job_embeddings.pop(next(iter(_job_embeddings)))
+        _job_embeddings[key] = (model, embedding)
+    return embedding
+
+def compute_similarities(descriptions, job_description, model):
+    """
+    Cosine similarity of every description to the job description.
+    All descriptions go through a single batched encode() and the
+    similarities are one matrix-vector product.
+    """
+    if not descriptions:
+        return []
+    job_embedding = encode_job_description(job_description, model)
+    embeddings = model.encode(descriptions, batch_size=ENCODE_BATCH_SIZE,
+                              convert_to_numpy=True, normalize_embeddings=True)
+    return (np.asarray(embeddings) @ job_embedding).tolist()
+
 def get_github_repos(username):
     """
     Retrieve public repositories for the given GitHub username.
     Returns a list of repositories (as JSON dictionaries).
     """
-    headers = {
-        "Authorization": f"token {GITHUB_API_TOKEN}"
-    }
-    repos_url = f"{GITHUB_API_ENDPOINT}/users/{username}/repos"
-    response = requests.get(repos_url, headers=headers)
-    if response.status_code == 200:
-        return response.json()
-    else:
-        print(f"GitHub API Error {response.status_code}: {response.text}")
+    try:
+        return github.get_all(f"users/{username}/repos")
+    except GitHubAPIError as e:
+        print(f"GitHub API Error {e.status_code}: {e.text}")
         return []
 
-def score_repository(repo, job_description, model):
+def score_repository(repo, job_description, model, similarity_factor=None):
     """
     Calculate a score for a single repository.
     The formula is:
         repo_score = (2 * stars + 1.5 * forks + 1 * watchers) * similarity_factor
+    Pass similarity_factor when it was already computed in a batch.
     """
     stars = repo.get("stargazers_count", 0)
     forks = repo.get("forks_count", 0)
     watchers = repo.get("watchers_count", 0)
     description = repo.get("description") or ""
     
-    if description.strip():
-        similarity_factor = compute_text_similarity(description, job_description, model)
-    else:
-        similarity_factor = 0.5  # default value if no description is provided
+    if similarity_factor is None:
+        if description.strip():
+            similarity_factor = compute_text_similarity(description, job_description, model)
+        else:
+            similarity_factor = 0.5  # default value if no description is provided
     
     raw_score = (2 * stars + 1.5 * forks + 1 * watchers) * similarity_factor
     return raw_score, similarity_factor, stars, forks, watchers, description
@@ -84,9 +137,17 @@ def score_github_projects(username, job_description, model):
     repos = get_github_repos(username)
     total_raw_score = 0
     details = []
-    
-    for repo in repos:
-        repo_score, sim_factor, stars, forks, watchers, description = score_repository(repo, job_description, model)
+
+    # One forward pass for all described repos instead of one per repo
+    described = [i for i, repo in enumerate(repos) if (repo.get("description") or "").strip()]
+    similarities = dict(zip(described, compute_similarities(
+        [repos[i]["description"] for i in described], job_description, model
+    )))
+
+    for i, repo in enumerate(repos):
+        repo_score, sim_factor, stars, forks, watchers, description = score_repository(
+            repo, job_description, model, similarity_factor=similarities.get(i, 0.5)
+        )
         total_raw_score += repo_score
         details.append({
             "name": repo.get("name"),
@@ -123,7 +184,7 @@ def call_gemini_api(prompt, temperature=GEMINI_TEMPERATURE):
     }
     
     try:
-        response = requests.post(
+        response = http.post(
             f"{GEMINI_API_ENDPOINT}?key={GEMINI_API_KEY}",
             headers=headers,
             json=payload
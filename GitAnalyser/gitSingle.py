@@ -1,31 +1,38 @@
-import re
-import requests
 import base64
+import os
+import sys
 
-# GitHub API settings
-GITHUB_API_TOKEN = "insert_key"  # Replace with your GitHub token
-GITHUB_API_ENDPOINT = "https://api.github.com"
+# Add project root to Python path
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+if project_root not in sys.path:
+    sys.path.append(project_root)
+
+from core.GitHub import GetGitHubClient, GitHubAPIError, CrawlLinkedRepos, ExtractRepoLinks
+
+# Shared pooled, paginated client; GITHUB_API_TOKEN and GITHUB_API_ENDPOINT come
+# from .env, SMARTHIRE_BACKEND=record/replay swaps in the cassette-backed transport
+github = GetGitHubClient()
+
+# Linked repositories are followed this many links away from the evaluated repo,
+# with at most LINK_CRAWL_MAX_REQUESTS GitHub calls per evaluation
+LINK_CRAWL_DEPTH = 2
+LINK_CRAWL_MAX_REQUESTS = 100
 
 def fetch_user_repos(username):
     """
     Fetch all public repositories for the given username.
     """
-    headers = {"Authorization": f"token {GITHUB_API_TOKEN}"}
-    url = f"{GITHUB_API_ENDPOINT}/users/{username}/repos"
-    response = requests.get(url, headers=headers)
-    if response.status_code == 200:
-        return response.json()
-    else:
-        print(f"Error fetching repositories: {response.status_code} - {response.text}")
+    try:
+        return github.get_all(f"users/{username}/repos")
+    except GitHubAPIError as e:
+        print(f"Error fetching repositories: {e.status_code} - {e.text}")
         return []
 
 def fetch_repo_details(owner, repo_name):
     """
     Fetch details of a specific repository.
     """
-    headers = {"Authorization": f"token {GITHUB_API_TOKEN}"}
-    url = f"{GITHUB_API_ENDPOINT}/repos/{owner}/{repo_name}"
-    response = requests.get(url, headers=headers)
+    response = github.get(f"repos/{owner}/{repo_name}")
     if response.status_code == 200:
         return response.json()
     elif response.status_code == 404:
@@ -38,24 +45,17 @@ def fetch_repo_commits(owner, repo_name, username):
     """
     Fetch commit history for a repository and filter by the candidate's username.
     """
-    headers = {"Authorization": f"token {GITHUB_API_TOKEN}"}
-    url = f"{GITHUB_API_ENDPOINT}/repos/{owner}/{repo_name}/commits?author={username}"
-    response = requests.get(url, headers=headers)
-    if response.status_code == 200:
-        return response.json()
-    else:
-        print(f"Error fetching commits: {response.status_code} - {response.text}")
+    try:
+        return github.get_all(f"repos/{owner}/{repo_name}/commits", params={"author": username})
+    except GitHubAPIError as e:
+        print(f"Error fetching commits: {e.status_code} - {e.text}")
         return []
 
-import base64
-
 def fetch_readme(owner, repo_name):
     """
     Fetch the README.md content for a repository and decode it from Base64.
     """
-    headers = {"Authorization": f"token {GITHUB_API_TOKEN}"}
-    url = f"{GITHUB_API_ENDPOINT}/repos/{owner}/{repo_name}/contents/README.md"
-    response = requests.get(url, headers=headers)
+    response = github.get(f"repos/{owner}/{repo_name}/contents/README.md")
     if response.status_code == 200:
         readme_data = response.json()
         encoded_content = readme_data.get("content", "No content available")
@@ -71,13 +71,6 @@ def fetch_readme(owner, repo_name):
         print(f"Error fetching README.md: {response.status_code} - {response.text}")
         return "Error fetching README.md"
 
-def extract_github_links(text):
-    """
-    Extract GitHub repository links from a given text.
-    """
-    pattern = r"https:\/\/github\.com\/[a-zA-Z0-9\-_]+\/[a-zA-Z0-9\-_]+"
-    return re.findall(pattern, text)
-
 def fetch_repo_details_from_url(repo_url):
     """
     Fetch repository details using a GitHub URL.
@@ -124,17 +117,21 @@ if __name__ == "__main__":
 
         # Step 5: Extract and Process Linked Repositories
         description = repo_details.get("description", "") or ""  # Ensure description is a string
-        description_links = extract_github_links(description)
-        readme_links = extract_github_links(readme_content or "")  # Ensure README content is a string
-        all_links = set(description_links + readme_links)
+        # Any link form (http, www, no scheme, .git, /tree/...) normalized to owner/repo
+        all_links = set(ExtractRepoLinks(description) + ExtractRepoLinks(readme_content or ""))
 
         print(f"\n--- Linked Repositories Found: {len(all_links)} ---")
-        for link in all_links:
-            print(f"\nProcessing linked repository: {link}")
-            linked_repo_details = fetch_repo_details_from_url(link)
-            if "error" not in linked_repo_details:
+        # Linked repos and the repos they link to, fetched level by level in parallel
+        graph = CrawlLinkedRepos(sorted(all_links), root=f"{github_username}/{best_repo_name}", client=github,
+                                 max_depth=LINK_CRAWL_DEPTH, max_requests=LINK_CRAWL_MAX_REQUESTS)
+        for name, node in graph["nodes"].items():
+            print(f"\nProcessing linked repository: {node['url']} (depth {node['depth']})")
+            if "error" not in node:
+                linked_repo_details = node["details"]
                 print(f"Linked Repo: {linked_repo_details.get('name')}")
                 print(f"Description: {linked_repo_details.get('description', 'No description provided')}")
                 print(f"Size: {linked_repo_details.get('size', 'Unknown')} KB")
             else:
-                print(f"Error processing linked repository: {linked_repo_details['error']}")
+                print(f"Error processing linked repository: {node['error']}")
+        if graph["budget_exhausted"]:
+            print(f"\nStopped after {graph['requests']} GitHub requests; some linked repositories were not fetched.")
@@ -0,0 +1,102 @@
+#IMPORT IN ACTUAL
+
+import os
+from threading import Lock
+from dotenv import load_dotenv
+from core.Backends.Cassette import Cassette
+from core.Backends.Simulation import SimulatedNetwork
+
+# The backend implementations import llama_index / requests, so they are
+# only imported once a client is actually built.
+
+load_dotenv()
+
+LIVE = "live"
+RECORD = "record"
+REPLAY = "replay"
+
+DEFAULT_CASSETTE = os.path.join(os.path.dirname(__file__), "../../testing/cassettes/pipeline.jsonl")
+
+_cassette = None
+_network = None
+_state_lock = Lock()
+
+
+def GetBackendMode() -> str:
+    """SMARTHIRE_BACKEND: live (default), record or replay."""
+    mode = os.getenv("SMARTHIRE_BACKEND", LIVE).strip().lower()
+    if mode not in (LIVE, RECORD, REPLAY):
+        raise ValueError(f"Unknown SMARTHIRE_BACKEND: {mode}")
+    return mode
+
+
+def IsStrictReplay() -> bool:
+    return os.getenv("SMARTHIRE_REPLAY_STRICT", "False").lower() == "true"
+
+
+def GetCassette() -> Cassette:
+    global _cassette
+    with _state_lock:
+        if _cassette is None:
+            _cassette = Cassette(os.getenv("SMARTHIRE_CASSETTE", DEFAULT_CASSETTE))
+        return _cassette
+
+
+def GetSimulatedNetwork() -> SimulatedNetwork:
+    """Replay latency, jitter and 429 rate from SMARTHIRE_REPLAY_* settings."""
+    global _network
+    with _state_lock:
+        if _network is None:
+            _network = SimulatedNetwork(
+                latency_ms=float(os.getenv("SMARTHIRE_REPLAY_LATENCY_MS", "0")),
+                jitter_ms=float(os.getenv("SMARTHIRE_REPLAY_JITTER_MS", "0")),
+                rate_limit_rate=float(os.getenv("SMARTHIRE_REPLAY_429_RATE", "0")),
+                seed=int(os.getenv("SMARTHIRE_REPLAY_SEED", "0"))
+            )
+        return _network
+
+
+def ResetBackends(cassette=None, network=None):
+    """Swap in a cassette / simulated network, mainly for benchmarks."""
+    global _cassette, _network
+    with _state_lock:
+        _cassette = cassette
+        _network = network
+
+
+def WrapLLM(create_llm, model_name="gemini"):
+    """Build the LLM for the current backend mode; create_llm is only called when a real client is needed."""
+    mode = GetBackendMode()
+    if mode == REPLAY:
+        from core.Backends.LLMBackends import ReplayLLM
+        return ReplayLLM(GetCassette(), GetSimulatedNetwork(), model_name=model_name, strict=IsStrictReplay())
+    if mode == RECORD:
+        from core.Backends.LLMBackends import RecordingLLM
+        return RecordingLLM(create_llm(), GetCassette(), model_name=model_name)
+    return create_llm()
+
+
+def WrapEmbedding(create_embedding, model_name):
+    mode = GetBackendMode()
+    if mode == REPLAY:
+        from core.Backends.EmbeddingBackends import ReplayEmbedding
+        return ReplayEmbedding(GetCassette(), GetSimulatedNetwork(), model_name=model_name, strict=IsStrictReplay())
+    if mode == RECORD:
+        from core.Backends.EmbeddingBackends import RecordingEmbedding
+        return RecordingEmbedding(create_embedding(), GetCassette())
+    return create_embedding()
+
+
+def GetHttpClient(session=None):
+    """Object with requests-style get/post for the current backend mode."""
+    mode = GetBackendMode()
+    if mode == REPLAY:
+        from core.Backends.HttpBackends import ReplayHttpClient
+        return ReplayHttpClient(GetCassette(), GetSimulatedNetwork(), strict=IsStrictReplay())
+    if mode == RECORD:
+        from core.Backends.HttpBackends import RecordingHttpClient
+        return RecordingHttpClient(GetCassette(), session=session)
+    if session is not None:
+        return session
+    import requests
+    return requests
@@ -0,0 +1,46 @@
+#IMPORT IN ACTUAL
+
+import hashlib
+import json
+import os
+from threading import Lock
+
+
+def RequestKey(kind, *parts) -> str:
+    """Stable key for a request, independent of dict ordering."""
+    payload = json.dumps([kind] + list(parts), sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class Cassette:
+    """
+    Append-only JSONL file of recorded responses.
+    Each line is {"kind", "key", "response"}; later lines win on duplicate keys.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.entries = {}
+        self.lock = Lock()
+        if os.path.exists(path):
+            with open(path, "r") as file:
+                for line in file:
+                    line = line.strip()
+                    if not line:
+                        continue
+                    entry = json.loads(line)
+                    self.entries[entry["key"]] = entry["response"]
+
+    def get(self, key):
+        return self.entries.get(key)
+
+    def record(self, kind, key, response):
+        with self.lock:
+            self.entries[key] = response
+            directory = os.path.dirname(os.path.abspath(self.path))
+            os.makedirs(directory, exist_ok=True)
+            with open(self.path, "a") as file:
+                file.write(json.dumps({"kind": kind, "key": key, "response": response}) + "\n")
+
+    def __len__(self):
+        return len(self.entries)
@@ -0,0 +1,147 @@
+#IMPORT IN ACTUAL
+
+import hashlib
+import re
+from typing import Any, List
+import numpy as np
+from llama_index.core.base.embeddings.base import BaseEmbedding
+from llama_index.core.bridge.pydantic import PrivateAttr
+from core.Backends.Cassette import RequestKey
+
+# Matches the Gemini embedding-001 vector size
+DEFAULT_EMBED_DIM = 768
+
+
+def EmbeddingRequestKey(model_name, task, text) -> str:
+    return RequestKey("embedding", model_name, task, text)
+
+
+def HashingVector(text: str, dim: int = DEFAULT_EMBED_DIM) -> List[float]:
+    """
+    Deterministic bag-of-words vector: every token and token bigram is hashed
+    into one of dim signed buckets, then the vector is L2-normalized.
+    Texts sharing words end up close under cosine similarity.
+    """
+    tokens = re.findall(r"\w+", text.lower())
+    features = tokens + [f"{a} {b}" for a, b in zip(tokens, tokens[1:])]
+    vector = np.zeros(dim, dtype=np.float32)
+    for feature in features:
+        digest = hashlib.blake2b(feature.encode("utf-8"), digest_size=8).digest()
+        bucket = int.from_bytes(digest[:4], "little") % dim
+        vector[bucket] += 1.0 if digest[4] & 1 else -1.0
+    norm = np.linalg.norm(vector)
+    if norm > 0:
+        vector /= norm
+    return vector.tolist()
+
+
+class HashEmbedding(BaseEmbedding):
+    """Dependency-free, offline embedding model built on HashingVector."""
+
+    embed_dim: int = DEFAULT_EMBED_DIM
+
+    def __init__(self, embed_dim: int = DEFAULT_EMBED_DIM, model_name: str = "hash", **kwargs: Any):
+        super().__init__(embed_dim=embed_dim, model_name=model_name, **kwargs)
+
+    @classmethod
+    def class_name(cls) -> str:
+        return "HashEmbedding"
+
+    def _get_query_embedding(self, query: str) -> List[float]:
+        return HashingVector(query, self.embed_dim)
+
+    def _get_text_embedding(self, text: str) -> List[float]:
+        return HashingVector(text, self.embed_dim)
+
+    def _get_text_embeddings(self, texts: List[str]) -> List[List[float]]:
+        return [HashingVector(text, self.embed_dim) for text in texts]
+
+    async def _aget_query_embedding(self, query: str) -> List[float]:
+        return self._get_query_embedding(query)
+
+
+class RecordingEmbedding(BaseEmbedding):
+    """Passes embedding calls to the real model and records every vector in the cassette."""
+
+    _embed_model: Any = PrivateAttr()
+    _cassette: Any = PrivateAttr()
+
+    def __init__(self, embed_model, cassette, **kwargs: Any):
+        super().__init__(
+            model_name=embed_model.model_name,
+            embed_batch_size=embed_model.embed_batch_size,
+            **kwargs
+        )
+        self._embed_model = embed_model
+        self._cassette = cassette
+
+    @classmethod
+    def class_name(cls) -> str:
+        return "RecordingEmbedding"
+
+    def _get_query_embedding(self, query: str) -> List[float]:
+        embedding = self._embed_model._get_query_embedding(query)
+        self._cassette.record("embedding", EmbeddingRequestKey(self.model_name, "query", query), embedding)
+        return embedding
+
+    def _get_text_embedding(self, text: str) -> List[float]:
+        return self._get_text_embeddings([text])[0]
+
+    def _get_text_embeddings(self, texts: List[str]) -> List[List[float]]:
+        embeddings = self._embed_model._get_text_embeddings(texts)
+        for text, embedding in zip(texts, embeddings):
+            self._cassette.record("embedding", EmbeddingRequestKey(self.model_name, "text", text), embedding)
+        return embeddings
+
+    async def _aget_query_embedding(self, query: str) -> List[float]:
+        return self._get_query_embedding(query)
+
+
+class ReplayEmbedding(BaseEmbedding):
+    """
+    Serves recorded vectors with one simulated round trip per text, batches
+    included, as GeminiEmbedding sends one request per text.
+    Unrecorded texts get a HashingVector unless strict is set.
+    """
+
+    embed_dim: int = DEFAULT_EMBED_DIM
+    strict: bool = False
+    _cassette: Any = PrivateAttr()
+    _network: Any = PrivateAttr()
+    _recorded_model_name: str = PrivateAttr()
+
+    def __init__(self, cassette, network, model_name, embed_dim=DEFAULT_EMBED_DIM, strict=False, **kwargs: Any):
+        # Distinct name so replayed vectors never mix with real ones in the ingestion cache
+        super().__init__(model_name=f"replay:{model_name}", embed_dim=embed_dim, strict=strict, **kwargs)
+        self._cassette = cassette
+        self._network = network
+        self._recorded_model_name = model_name
+
+    @classmethod
+    def class_name(cls) -> str:
+        return "ReplayEmbedding"
+
+    def _lookup(self, task, text):
+        recorded = self._cassette.get(EmbeddingRequestKey(self._recorded_model_name, task, text))
+        if recorded is not None:
+            return recorded
+        if self.strict:
+            raise KeyError(f"No recorded embedding for text: {text[:80]}")
+        return HashingVector(text, self.embed_dim)
+
+    def _get_query_embedding(self, query: str) -> List[float]:
+        self._network.call()
+        return self._lookup("query", query)
+
+    def _get_text_embedding(self, text: str) -> List[float]:
+        return self._get_text_embeddings([text])[0]
+
+    def _get_text_embeddings(self, texts: List[str]) -> List[List[float]]:
+        embeddings = []
+        for text in texts:
+            self._network.call()
+            embeddings.append(self._lookup("text", text))
+        return embeddings
+
+    async def _aget_query_embedding(self, query: str) -> List[float]:
+        return self._get_query_embedding(query)
@@ -0,0 +1,112 @@
+#IMPORT IN ACTUAL
+
+import hashlib
+import json
+import re
+from typing import Any
+from llama_index.core.bridge.pydantic import PrivateAttr
+from llama_index.core.llms import CustomLLM, CompletionResponse, CompletionResponseGen, LLMMetadata
+from llama_index.core.llms.callbacks import llm_completion_callback
+from core.Backends.Cassette import RequestKey
+
+
+def LLMRequestKey(model_name, prompt) -> str:
+    return RequestKey("llm", model_name, prompt)
+
+
+def _stable_fraction(text) -> float:
+    return int(hashlib.sha256(text.encode("utf-8")).hexdigest()[:8], 16) / 0xFFFFFFFF
+
+
+def SimulatedCompletion(prompt: str) -> str:
+    """
+    Deterministic stand-in answer for prompts that were never recorded, shaped
+    like what the scorers and the classifier parse.
+    """
+    fraction = _stable_fraction(prompt)
+
+    if "Answer with True or False only" in prompt:
+        return "True" if fraction >= 0.5 else "False"
+    if "Return only the numerical value" in prompt:
+        return str(round(fraction * 10, 1))
+    if '"justification"' in prompt:
+        return json.dumps({"score": round(fraction * 100, 1), "justification": "Simulated evaluation."})
+    if "**Input Parameters:**" in prompt:
+        numbered = re.findall(r'^\s*(\d+)\. "(.*)"\s*$', prompt, re.MULTILINE)
+        return json.dumps({number: _simulated_category(parameter) for number, parameter in numbered})
+    if "'Quantitative','Boolean' or 'Textual'" in prompt:
+        match = re.search(r'\*\*Input Parameter:\*\*\s*"(.*?)"', prompt)
+        return _simulated_category(match.group(1) if match else "")
+    return "Simulated response."
+
+
+def _simulated_category(parameter):
+    parameter = parameter.lower()
+    if parameter.startswith(("has", "knows", "is ")):
+        return "Boolean"
+    if any(word in parameter for word in ("years", "number", "gpa", "count", "cgpa")):
+        return "Quantitative"
+    return "Textual"
+
+
+class RecordingLLM(CustomLLM):
+    """Passes every completion to the real LLM and records the answer in the cassette."""
+
+    model_name: str = "gemini"
+    _llm: Any = PrivateAttr()
+    _cassette: Any = PrivateAttr()
+
+    def __init__(self, llm, cassette, model_name="gemini", **kwargs: Any):
+        super().__init__(model_name=model_name, **kwargs)
+        self._llm = llm
+        self._cassette = cassette
+
+    @property
+    def metadata(self) -> LLMMetadata:
+        return LLMMetadata(model_name=self.model_name, is_chat_model=False)
+
+    @llm_completion_callback()
+    def complete(self, prompt: str, formatted: bool = False, **kwargs: Any) -> CompletionResponse:
+        response = self._llm.complete(prompt, formatted=formatted, **kwargs)
+        self._cassette.record("llm", LLMRequestKey(self.model_name, prompt), {"text": response.text})
+        return response
+
+    @llm_completion_callback()
+    def stream_complete(self, prompt: str, formatted: bool = False, **kwargs: Any) -> CompletionResponseGen:
+        yield self.complete(prompt, formatted=formatted, **kwargs)
+
+
+class ReplayLLM(CustomLLM):
+    """
+    Answers completions from the cassette, with simulated network latency and
+    429s. Unrecorded prompts get a deterministic SimulatedCompletion unless
+    strict is set.
+    """
+
+    model_name: str = "gemini"
+    strict: bool = False
+    _cassette: Any = PrivateAttr()
+    _network: Any = PrivateAttr()
+
+    def __init__(self, cassette, network, model_name="gemini", strict=False, **kwargs: Any):
+        super().__init__(model_name=model_name, strict=strict, **kwargs)
+        self._cassette = cassette
+        self._network = network
+
+    @property
+    def metadata(self) -> LLMMetadata:
+        return LLMMetadata(model_name=self.model_name, is_chat_model=False)
+
+    @llm_completion_callback()
+    def complete(self, prompt: str, formatted: bool = False, **kwargs: Any) -> CompletionResponse:
+        self._network.call()
+        recorded = self._cassette.get(LLMRequestKey(self.model_name, prompt))
+        if recorded is not None:
+            return CompletionResponse(text=recorded["text"])
+        if self.strict:
+            raise KeyError(f"No recorded completion for prompt: {prompt[:80]}")
+        return CompletionResponse(text=SimulatedCompletion(prompt))
+
+    @llm_completion_callback()
+    def stream_complete(self, prompt: str, formatted: bool = False, **kwargs: Any) -> CompletionResponseGen:
+        yield self.complete(prompt, formatted=formatted, **kwargs)
@@ -0,0 +1,48 @@
+#IMPORT IN ACTUAL
+
+import random
+import time
+from threading import Lock
+
+
+class SimulatedRateLimitError(Exception):
+    """Raised by replay backends to mimic an HTTP 429 / quota exhausted response."""
+    status_code = 429
+
+
+class SimulatedNetwork:
+    """
+    Latency, jitter and 429 injection shared by all replay backends.
+    Seeded so a benchmark run is reproducible.
+    """
+
+    def __init__(self, latency_ms=0.0, jitter_ms=0.0, rate_limit_rate=0.0, seed=0):
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+        self.rate_limit_rate = rate_limit_rate
+        self.random = random.Random(seed)
+        self.lock = Lock()
+        self.calls = 0
+        self.rate_limited = 0
+
+    def round_trip(self) -> bool:
+        """Sleep for one simulated round trip; returns False if it should be answered with a 429."""
+        with self.lock:
+            self.calls += 1
+            delay_ms = self.latency_ms + self.random.uniform(-self.jitter_ms, self.jitter_ms)
+            limited = self.random.random() < self.rate_limit_rate
+            if limited:
+                self.rate_limited += 1
+
+        if delay_ms > 0:
+            time.sleep(delay_ms / 1000)
+        return not limited
+
+    def call(self):
+        """Like round_trip, but raises SimulatedRateLimitError instead of returning False."""
+        if not self.round_trip():
+            raise SimulatedRateLimitError("429 Resource has been exhausted (simulated)")
+
+    def stats(self):
+        with self.lock:
+            return {"calls": self.calls, "rate_limited": self.rate_limited}
@@ -0,0 +1,22 @@
+from .BackendConfig import (
+    GetBackendMode,
+    GetCassette,
+    GetSimulatedNetwork,
+    ResetBackends,
+    WrapLLM,
+    WrapEmbedding,
+    GetHttpClient
+)
+from .Simulation import SimulatedNetwork, SimulatedRateLimitError
+
+__all__ = [
+    'GetBackendMode',
+    'GetCassette',
+    'GetSimulatedNetwork',
+    'ResetBackends',
+    'WrapLLM',
+    'WrapEmbedding',
+    'GetHttpClient',
+    'SimulatedNetwork',
+    'SimulatedRateLimitError'
+]
@@ -0,0 +1,218 @@
+#IMPORT IN ACTUAL
+
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from threading import Lock
+from dotenv import load_dotenv
+from core.Backends import GetHttpClient
+from core.GitHub.ResponseCache import AuthScope, GetGitHubResponseCache, ResponseKey
+from interfaces.utils.RateLimiter import GetRateLimiter
+
+load_dotenv()
+
+GITHUB_API_ENDPOINT = os.getenv("GITHUB_API_ENDPOINT", "https://api.github.com")
+PER_PAGE = 100
+MAX_WORKERS = 8
+REQUEST_TIMEOUT = 30
+# Longest we sleep for a rate-limit reset before handing the 403/429 back to the caller
+MAX_RATE_LIMIT_WAIT = 300
+
+
+class GitHubAPIError(Exception):
+    def __init__(self, response):
+        self.response = response
+        self.status_code = response.status_code
+        self.text = response.text
+        super().__init__(f"GitHub API error {response.status_code}: {response.text[:200]}")
+
+
+def _new_session(pool_size):
+    import requests
+    from requests.adapters import HTTPAdapter
+    session = requests.Session()
+    # Keep one keep-alive connection per worker instead of a new TLS handshake per call
+    adapter = HTTPAdapter(pool_connections=4, pool_maxsize=pool_size)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+class GitHubClient:
+    """
+    Shared GitHub REST client.
+
+    - Requests go through one pooled keep-alive session (or the record/replay
+      client, see core.Backends.GetHttpClient).
+    - get_all() follows Link rel="next" pagination, PER_PAGE items a page.
+    - map() fans calls out over at most max_workers threads.
+    - X-RateLimit-Remaining / X-RateLimit-Reset from every response are
+      tracked: once the quota is spent, calls wait for the reset, and a
+      rate-limited 403/429 is retried once after Retry-After or the reset.
+      Every call also takes a token from the "github" RateLimiter.
+    - Successful GETs are kept in the GitHubResponseCache (GITHUB_CACHE_DB),
+      partitioned by token: fresh entries are served without a request,
+      stale ones are revalidated with If-None-Match / If-Modified-Since.
+
+    base_url can point at a local stub server, see testing/GitHubStubServer.py.
+    """
+
+    def __init__(self, token=None, base_url=GITHUB_API_ENDPOINT, max_workers=MAX_WORKERS,
+                 session=None, max_rate_limit_wait=MAX_RATE_LIMIT_WAIT, cache=None, use_cache=True):
+        self.token = token
+        self.scope = AuthScope(token)
+        if cache is None and use_cache:
+            try:
+                cache = GetGitHubResponseCache()
+            except Exception as e:
+                print(f"Error opening GitHub response cache: {e}")
+        self.cache = cache if use_cache else None
+        self.base_url = base_url.rstrip("/")
+        self.max_workers = max_workers
+        self.max_rate_limit_wait = max_rate_limit_wait
+        self.http = GetHttpClient(session=session or _new_session(max_workers))
+        self.rate_limiter = GetRateLimiter("github")
+        self.lock = Lock()
+        self.remaining = None
+        self.reset_at = None
+
+    def url_for(self, path):
+        if path.startswith("http://") or path.startswith("https://"):
+            return path
+        return f"{self.base_url}/{path.lstrip('/')}"
+
+    def _headers(self, headers=None):
+        merged = {"Accept": "application/vnd.github+json", "User-Agent": "SmartHire-GitAnalyser"}
+        if self.token:
+            merged["Authorization"] = f"token {self.token}"
+        merged.update(headers or {})
+        return merged
+
+    def _update_quota(self, response):
+        remaining = response.headers.get("X-RateLimit-Remaining")
+        if remaining is None:
+            return
+        reset = response.headers.get("X-RateLimit-Reset")
+        with self.lock:
+            self.remaining = int(remaining)
+            self.reset_at = float(reset) if reset else None
+
+    def _wait_for_quota(self):
+        with self.lock:
+            exhausted = self.remaining is not None and self.remaining <= 0
+            reset_at = self.reset_at
+        if exhausted and reset_at:
+            wait = reset_at - time.time()
+            if 0 < wait <= self.max_rate_limit_wait:
+                time.sleep(wait)
+        # Conditional requests too: a 304 is free, but a changed resource comes back as a 200 that is not
+        self.rate_limiter.wait_if_needed()
+
+    def _retry_delay(self, response):
+        """Seconds to wait before retrying a rate-limited response, or None if it is not one."""
+        if response.status_code not in (403, 429):
+            return None
+        retry_after = response.headers.get("Retry-After")
+        if retry_after:
+            return float(retry_after)
+        reset = response.headers.get("X-RateLimit-Reset")
+        if response.headers.get("X-RateLimit-Remaining") == "0" and reset:
+            return max(0.0, float(reset) - time.time())
+        return None
+
+    def _fetch(self, url, params, headers):
+        for attempt in range(2):
+            self._wait_for_quota()
+            response = self.http.get(url, params=params, headers=self._headers(headers), timeout=REQUEST_TIMEOUT)
+            self._update_quota(response)
+            delay = self._retry_delay(response)
+            if attempt == 0 and delay is not None and delay <= self.max_rate_limit_wait:
+                time.sleep(delay)
+                continue
+            return response
+
+    def get(self, path, params=None, headers=None):
+        """GET a path or absolute URL; returns the response, whatever its status."""
+        url = self.url_for(path)
+        # Requests with their own headers may ask for a different representation, don't cache them
+        if self.cache is None or headers:
+            return self._fetch(url, params, headers)
+
+        key = ResponseKey(self.scope, url, params)
+        try:
+            cached, fresh, validators = self.cache.lookup(key)
+        except Exception as e:
+            print(f"Error reading GitHub response cache: {e}")
+            return self._fetch(url, params, headers)
+        if cached is not None and fresh:
+            self.cache.count("fresh_hits", 1)
+            return cached
+
+        response = self._fetch(url, params, validators)
+        try:
+            if response.status_code == 304 and cached is not None:
+                self.cache.count("revalidated", 1)
+                self.cache.touch(key, url)
+                return cached
+            self.cache.count("misses", 1)
+            if response.status_code == 200:
+                self.cache.store(key, url, response)
+        except Exception as e:
+            print(f"Error writing GitHub response cache: {e}")
+        return cached if response.status_code == 304 and cached is not None else response
+
+    def get_json(self, path, params=None):
+        """GET and decode JSON, raising GitHubAPIError on a non-2xx status."""
+        response = self.get(path, params=params)
+        if response.status_code >= 300:
+            raise GitHubAPIError(response)
+        return response.json()
+
+    def get_all(self, path, params=None, max_pages=None):
+        """Every item of a paginated list endpoint, following the Link header."""
+        params = dict(params or {})
+        params.setdefault("per_page", PER_PAGE)
+        items = []
+        url, pages = path, 0
+        while url and (max_pages is None or pages < max_pages):
+            response = self.get(url, params=params)
+            if response.status_code >= 300:
+                raise GitHubAPIError(response)
+            items.extend(response.json())
+            pages += 1
+            url = response.links.get("next", {}).get("url")
+            # The next link already carries the query string
+            params = None
+        return items
+
+    def map(self, fn, items, max_workers=None):
+        """fn over items on at most max_workers (default: the pool size) threads, results in input order."""
+        items = list(items)
+        workers = min(max_workers or self.max_workers, len(items))
+        if workers <= 1:
+            return [fn(item) for item in items]
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(fn, items))
+
+    def quota(self):
+        with self.lock:
+            return {"remaining": self.remaining, "reset_at": self.reset_at}
+
+
+_clients = {}
+_clients_lock = Lock()
+
+
+def GetGitHubClient(token=None, base_url=None):
+    """
+    Process-wide client per (token, base_url), so every caller shares one
+    connection pool and one view of the rate limit. token defaults to
+    GITHUB_API_TOKEN from the environment.
+    """
+    token = token or os.getenv("GITHUB_API_TOKEN")
+    base_url = base_url or GITHUB_API_ENDPOINT
+    with _clients_lock:
+        key = (token, base_url)
+        if key not in _clients:
+            _clients[key] = GitHubClient(token=token, base_url=base_url)
+        return _clients[key]
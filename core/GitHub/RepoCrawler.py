@@ -0,0 +1,182 @@
+#IMPORT IN ACTUAL
+
+import base64
+import re
+from threading import Lock
+from core.GitHub.GitHubClient import GetGitHubClient
+
+MAX_DEPTH = 2
+MAX_CONCURRENCY = 8
+MAX_REQUESTS = 200
+
+REPO_URL_PATTERN = re.compile(
+    r"(?:https?://)?(?:www\.)?github\.com/([A-Za-z0-9][A-Za-z0-9-]{0,38})/([A-Za-z0-9._-]+)",
+    re.IGNORECASE
+)
+# github.com/<first segment>/... pages that are not repositories
+NON_REPO_OWNERS = {
+    "about", "apps", "collections", "contact", "enterprise", "events", "explore", "features", "login",
+    "marketplace", "notifications", "orgs", "pricing", "settings", "sponsors", "topics", "trending",
+}
+
+
+def NormalizeRepoUrl(url):
+    """
+    "owner/repo", lowercased, for any github.com repository link
+    (http or https, www, ".git", trailing paths, query or fragment), or None.
+    """
+    match = REPO_URL_PATTERN.search(url or "")
+    if not match:
+        return None
+    owner, repo = match.group(1).lower(), match.group(2).lower()
+    # Sentence punctuation after the link, then a clone URL suffix
+    repo = repo.rstrip(".")
+    if repo.endswith(".git"):
+        repo = repo[:-4]
+    if owner in NON_REPO_OWNERS or not repo or repo in (".", ".."):
+        return None
+    return f"{owner}/{repo}"
+
+
+def _repo_name(value):
+    """NormalizeRepoUrl for a URL or a bare "owner/repo"."""
+    return NormalizeRepoUrl(value if "github.com" in value.lower() else f"github.com/{value}")
+
+
+def ExtractRepoLinks(text):
+    """Normalized repository names linked from text, de-duplicated, in order of appearance."""
+    names = {}
+    for match in REPO_URL_PATTERN.finditer(text or ""):
+        name = NormalizeRepoUrl(match.group(0))
+        if name:
+            names.setdefault(name, None)
+    return list(names)
+
+
+class RepoCrawler:
+    """
+    Breadth-first walk of repositories linked from descriptions and READMEs.
+
+    Each level is fetched in parallel (at most max_concurrency requests in
+    flight) through the shared GitHubClient. A repository is fetched once
+    however many times or however it is linked, and no more than
+    max_requests API calls are made per crawl; repositories beyond the
+    budget are recorded as skipped. READMEs are only fetched for
+    repositories whose links will still be followed (depth < max_depth).
+    """
+
+    def __init__(self, client=None, max_depth=MAX_DEPTH, max_concurrency=MAX_CONCURRENCY, max_requests=MAX_REQUESTS):
+        self.client = client or GetGitHubClient()
+        self.max_depth = max_depth
+        self.max_concurrency = max_concurrency
+        self.max_requests = max_requests
+        self.lock = Lock()
+        self.requests = 0
+        self.budget_exhausted = False
+
+    def _take_request(self):
+        with self.lock:
+            if self.requests >= self.max_requests:
+                self.budget_exhausted = True
+                return False
+            self.requests += 1
+            return True
+
+    def _readme(self, name):
+        if not self._take_request():
+            return None
+        response = self.client.get(f"repos/{name}/contents/README.md")
+        if response.status_code != 200:
+            return ""
+        content = response.json().get("content") or ""
+        try:
+            return base64.b64decode(content).decode("utf-8", errors="replace")
+        except Exception as e:
+            print(f"Error decoding README.md for {name}: {e}")
+            return ""
+
+    def _visit(self, item):
+        name, depth = item
+        node = {"name": name, "url": f"https://github.com/{name}", "depth": depth, "details": None, "links": []}
+        if not self._take_request():
+            node["error"] = "Request budget exhausted"
+            return node
+        try:
+            response = self.client.get(f"repos/{name}")
+            if response.status_code == 404:
+                node["error"] = "Repository not found."
+                return node
+            if response.status_code != 200:
+                node["error"] = f"GitHub API error {response.status_code}"
+                return node
+            details = response.json()
+            node["details"] = details
+            if depth < self.max_depth:
+                readme = self._readme(name) or ""
+                node["links"] = ExtractRepoLinks(f"{details.get('description') or ''}\n{readme}")
+        except Exception as e:
+            print(f"Error crawling repository {name}: {e}")
+            node["error"] = str(e)
+        return node
+
+    def crawl(self, seeds, root=None):
+        """
+        Crawl from seeds (URLs or "owner/repo"); root, if given, is the
+        already-fetched repository the seeds were linked from. Seeds are at
+        depth 1. Returns
+        {"root", "nodes": {name: node}, "edges": [(from, to)], "requests", "budget_exhausted"}
+        where a node has name, url, depth, details (the repo JSON or None),
+        links and, on failure, error.
+        """
+        self.requests = 0
+        self.budget_exhausted = False
+        root = _repo_name(root) if root else None
+        visited = {root} if root else set()
+        nodes = {}
+        edges = []
+
+        level = []
+        for seed in seeds:
+            name = _repo_name(seed)
+            if not name:
+                continue
+            if root and name != root:
+                edges.append((root, name))
+            if name not in visited:
+                visited.add(name)
+                level.append(name)
+
+        depth = 1
+        while level and depth <= self.max_depth:
+            results = self.client.map(self._visit, [(name, depth) for name in level], max_workers=self.max_concurrency)
+            next_level = []
+            for node in results:
+                nodes[node["name"]] = node
+                full_name = ((node["details"] or {}).get("full_name") or "").lower()
+                if full_name and full_name != node["name"]:
+                    # Renamed or transferred repository, links to either name are the same repo
+                    visited.add(full_name)
+                for link in node["links"]:
+                    if link in (node["name"], full_name):
+                        continue
+                    edges.append((node["name"], link))
+                    if link not in visited:
+                        visited.add(link)
+                        next_level.append(link)
+            level = next_level
+            depth += 1
+
+        return {
+            "root": root,
+            "nodes": nodes,
+            "edges": edges,
+            "requests": self.requests,
+            "budget_exhausted": self.budget_exhausted,
+        }
+
+
+def CrawlLinkedRepos(seeds, root=None, client=None, max_depth=MAX_DEPTH, max_concurrency=MAX_CONCURRENCY,
+                     max_requests=MAX_REQUESTS):
+    """One-off RepoCrawler(...).crawl(seeds, root); see RepoCrawler for the result layout."""
+    crawler = RepoCrawler(client=client, max_depth=max_depth, max_concurrency=max_concurrency, max_requests=max_requests)
+    return crawler.crawl(seeds, root=root)
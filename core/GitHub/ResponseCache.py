@@ -0,0 +1,193 @@
+#IMPORT IN ACTUAL
+
+import hashlib
+import json
+import os
+import re
+import threading
+import time
+import zlib
+from threading import Lock
+from urllib.parse import urlencode
+from dotenv import load_dotenv
+
+load_dotenv()
+
+DEFAULT_GITHUB_CACHE_DB = os.path.join(os.path.dirname(__file__), '../cache/github.sqlite3')
+MAX_GITHUB_CACHE_BYTES = 64 * 1024 * 1024
+# Inserts between size checks; eviction trims the cache to 90% of max_bytes
+EVICTION_CHECK_INTERVAL = 200
+
+# Seconds a cached response is served without asking GitHub; after that it is
+# revalidated with If-None-Match / If-Modified-Since (a 304 costs no quota)
+ENDPOINT_TTLS = [
+    ("readme", re.compile(r"/repos/[^/]+/[^/]+/(?:readme|contents/readme[^/]*)$", re.IGNORECASE), 24 * 3600),
+    ("commits", re.compile(r"/repos/[^/]+/[^/]+/commits$"), 3600),
+    ("repo_list", re.compile(r"/(?:users|orgs)/[^/]+/repos$"), 6 * 3600),
+    ("repo", re.compile(r"/repos/[^/]+/[^/]+$"), 6 * 3600),
+]
+DEFAULT_TTL = 600
+# Response headers kept with the body; pagination needs Link
+KEPT_HEADERS = ("content-type", "etag", "last-modified", "link")
+
+
+def EndpointTTL(url):
+    """(endpoint type, TTL seconds) for a GitHub API URL."""
+    path = url.split("?", 1)[0].rstrip("/")
+    for endpoint, pattern, ttl in ENDPOINT_TTLS:
+        if pattern.search(path):
+            return endpoint, ttl
+    return "other", DEFAULT_TTL
+
+
+def AuthScope(token):
+    """Cache partition for a token: responses depend on who asks (private repos), the token itself is never stored."""
+    if not token:
+        return "anonymous"
+    return hashlib.sha256(token.encode("utf-8")).hexdigest()[:16]
+
+
+def ResponseKey(scope, url, params=None):
+    query = urlencode(sorted((params or {}).items()))
+    full_url = f"{url}{'&' if '?' in url else '?'}{query}" if query else url
+    return hashlib.sha256(f"{scope}\n{full_url}".encode("utf-8")).digest()
+
+
+class GitHubResponseCache:
+    """
+    SQLite cache of successful GitHub GET responses keyed by (auth scope, URL
+    with query).
+
+    Entries younger than their endpoint TTL (ENDPOINT_TTLS) are served
+    directly. Older entries are kept and revalidated: lookup() returns their
+    ETag / Last-Modified, and a 304 extends them for another TTL. Bodies are
+    zlib-compressed; past max_bytes the least recently used entries are
+    deleted. Safe to share between threads and processes.
+    """
+
+    def __init__(self, path, max_bytes=MAX_GITHUB_CACHE_BYTES):
+        self.path = path
+        self.max_bytes = max_bytes
+        self.local = threading.local()
+        self.lock = Lock()
+        self.inserts_since_check = EVICTION_CHECK_INTERVAL
+        self.counters = {"fresh_hits": 0, "revalidated": 0, "misses": 0, "stored": 0, "evicted": 0}
+
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        conn = self._connect()
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS responses ("
+            "key BLOB PRIMARY KEY, url TEXT NOT NULL, endpoint TEXT NOT NULL, status INTEGER NOT NULL, "
+            "headers TEXT NOT NULL, body BLOB NOT NULL, etag TEXT, last_modified TEXT, "
+            "expires_at REAL NOT NULL, last_used REAL NOT NULL)"
+        )
+        conn.execute("CREATE INDEX IF NOT EXISTS responses_last_used ON responses (last_used)")
+
+    def _connect(self):
+        conn = getattr(self.local, "conn", None)
+        if conn is None:
+            import sqlite3
+            conn = sqlite3.connect(self.path, timeout=30, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self.local.conn = conn
+        return conn
+
+    def lookup(self, key):
+        """
+        (response, fresh, validators) for a cached key, or (None, False, {}).
+        validators are the conditional request headers to send when not fresh.
+        """
+        row = self._connect().execute(
+            "SELECT url, status, headers, body, etag, last_modified, expires_at FROM responses WHERE key = ?", (key,)
+        ).fetchone()
+        if row is None:
+            return None, False, {}
+        url, status, headers, body, etag, last_modified, expires_at = row
+        validators = {}
+        if etag:
+            validators["If-None-Match"] = etag
+        if last_modified:
+            validators["If-Modified-Since"] = last_modified
+        return self._response(url, status, headers, body), time.time() < expires_at, validators
+
+    def _response(self, url, status, headers, body):
+        from core.Backends.HttpBackends import ReplayResponse
+        return ReplayResponse(status, zlib.decompress(body).decode("utf-8"), json.loads(headers), url)
+
+    def touch(self, key, url):
+        """Mark a cached entry as used; after a 304 it is fresh for another TTL."""
+        now = time.time()
+        _, ttl = EndpointTTL(url)
+        self._connect().execute(
+            "UPDATE responses SET expires_at = ?, last_used = ? WHERE key = ?", (now + ttl, now, key)
+        )
+
+    def store(self, key, url, response):
+        headers = {name: response.headers[name] for name in KEPT_HEADERS if name in response.headers}
+        endpoint, ttl = EndpointTTL(url)
+        now = time.time()
+        body = zlib.compress(response.text.encode("utf-8"))
+        self._connect().execute(
+            "INSERT OR REPLACE INTO responses (key, url, endpoint, status, headers, body, etag, last_modified, "
+            "expires_at, last_used) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            (key, url, endpoint, response.status_code, json.dumps(headers), body,
+             headers.get("etag"), headers.get("last-modified"), now + ttl, now)
+        )
+        self.count("stored", 1)
+        with self.lock:
+            self.inserts_since_check += 1
+            check = self.inserts_since_check >= EVICTION_CHECK_INTERVAL
+            if check:
+                self.inserts_since_check = 0
+        if check:
+            self.evict()
+
+    def evict(self):
+        """Delete least recently used responses until the cache is under 90% of max_bytes."""
+        conn = self._connect()
+        count, total_bytes = conn.execute("SELECT COUNT(*), COALESCE(SUM(LENGTH(body)), 0) FROM responses").fetchone()
+        if total_bytes <= self.max_bytes or not count:
+            return
+        excess = int(count - (0.9 * self.max_bytes) / (total_bytes / count))
+        conn.execute(
+            "DELETE FROM responses WHERE rowid IN (SELECT rowid FROM responses ORDER BY last_used LIMIT ?)",
+            (excess,)
+        )
+        self.count("evicted", excess)
+
+    def clear(self):
+        self._connect().execute("DELETE FROM responses")
+
+    def count(self, counter, amount):
+        with self.lock:
+            self.counters[counter] += amount
+
+    def stats(self):
+        """Counters since start-up; quota_saved is how many requests did not cost GitHub quota."""
+        with self.lock:
+            stats = dict(self.counters)
+        lookups = stats["fresh_hits"] + stats["revalidated"] + stats["misses"]
+        stats["quota_saved"] = stats["fresh_hits"] + stats["revalidated"]
+        stats["hit_rate"] = stats["quota_saved"] / lookups if lookups else 0.0
+        return stats
+
+
+_cache = None
+_cache_lock = Lock()
+
+
+def GetGitHubResponseCache():
+    """
+    Process-wide GitHubResponseCache at GITHUB_CACHE_DB (default
+    core/cache/github.sqlite3), or None when GITHUB_CACHE_DB is set empty.
+    """
+    global _cache
+    path = os.getenv("GITHUB_CACHE_DB", DEFAULT_GITHUB_CACHE_DB)
+    if not path:
+        return None
+    with _cache_lock:
+        if _cache is None or _cache.path != path:
+            max_mb = os.getenv("GITHUB_CACHE_MAX_MB")
+            _cache = GitHubResponseCache(path, max_bytes=int(float(max_mb) * 1024 * 1024) if max_mb else MAX_GITHUB_CACHE_BYTES)
+        return _cache
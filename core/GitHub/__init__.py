@@ -0,0 +1,7 @@
+from .GitHubClient import GitHubClient, GitHubAPIError, GetGitHubClient
+from .ResponseCache import GitHubResponseCache, GetGitHubResponseCache
+from .RepoCrawler import RepoCrawler, CrawlLinkedRepos, NormalizeRepoUrl, ExtractRepoLinks
+
+__all__ = ['GitHubClient', 'GitHubAPIError', 'GetGitHubClient',
+           'GitHubResponseCache', 'GetGitHubResponseCache',
+           'RepoCrawler', 'CrawlLinkedRepos', 'NormalizeRepoUrl', 'ExtractRepoLinks']
@@ -0,0 +1,90 @@
+#IMPORT IN ACTUAL
+
+# Lazily-initialized registry of model and embedding clients. Nothing here
+# imports the Gemini SDK or llama_index until a client is first requested,
+# which keeps worker cold starts cheap.
+
+from threading import Lock
+from core.Backends import WrapLLM, WrapEmbedding
+
+_clients = {}
+_clients_lock = Lock()
+
+
+def _pooled(key, create_client):
+    with _clients_lock:
+        client = _clients.get(key)
+        if client is None:
+            client = create_client()
+            _clients[key] = client
+        return client
+
+
+def _create_gemini(api_key, model_kwargs):
+    from llama_index.llms.gemini import Gemini
+    return Gemini(api_key=api_key, **model_kwargs)
+
+
+def _create_gemini_embedding(model_name):
+    from llama_index.embeddings.gemini import GeminiEmbedding
+    return GeminiEmbedding(model_name=model_name)
+
+
+def GetLLMClient(api_key, **model_kwargs):
+    """
+    Return the process-wide Gemini client for this api key and configuration,
+    creating it on first use. Clients are safe to share between threads.
+    SMARTHIRE_BACKEND=record/replay swaps in the recording or offline client.
+    """
+    key = ("llm", api_key, tuple(sorted((name, repr(value)) for name, value in model_kwargs.items())))
+    model_name = model_kwargs.get("model") or model_kwargs.get("models") or "gemini"
+    return _pooled(key, lambda: WrapLLM(lambda: _create_gemini(api_key, model_kwargs), model_name=model_name))
+
+
+def _create_cached_embedding(model_name):
+    from core.ModelInitializers.EmbeddingCache import WrapEmbeddingCache
+    from core.ModelInitializers.RateLimitedEmbedding import RateLimitedEmbedding
+    from interfaces.utils.RateLimiter import GetRateLimiter
+    # Only cache misses reach the limiter, one token per Gemini request
+    embed_model = WrapEmbedding(lambda: _create_gemini_embedding(model_name), model_name)
+    return WrapEmbeddingCache(RateLimitedEmbedding(embed_model, GetRateLimiter("gemini_embedding")))
+
+
+def _create_local_embedding(model_name, runtime):
+    from core.ModelInitializers.EmbeddingCache import WrapEmbeddingCache
+    from core.ModelInitializers.LocalEmbedding import CreateLocalEmbedding, KeywordEmbedding
+    embed_model = CreateLocalEmbedding(model_name, runtime=runtime)
+    # Hashing is cheaper than a cache lookup
+    return embed_model if isinstance(embed_model, KeywordEmbedding) else WrapEmbeddingCache(embed_model)
+
+
+def _create_keyword_embedding(model_name, runtime):
+    from core.ModelInitializers.LocalEmbedding import KeywordEmbedding
+    return KeywordEmbedding()
+
+
+# Embedding backend -> factory(model_name, runtime)
+EMBEDDING_BACKENDS = {
+    "gemini": lambda model_name, runtime: _create_cached_embedding(model_name),
+    "local": _create_local_embedding,
+    "keyword": _create_keyword_embedding,
+}
+
+
+def GetEmbeddingClient(model_name, backend="gemini", runtime="torch"):
+    """
+    Return the process-wide embedding client for model_name on backend:
+    "gemini" (API, behind the cross-resume embedding cache unless
+    EMBEDDING_CACHE_DB is set empty), "local" (sentence-transformers on the
+    CPU, runtime "torch" or "onnx", falling back to keyword hashing) or
+    "keyword" (dependency-free hashing vectorizer).
+    """
+    if backend not in EMBEDDING_BACKENDS:
+        raise ValueError(f"Unknown embedding backend: {backend}")
+    return _pooled(("embedding", backend, model_name, runtime),
+                   lambda: EMBEDDING_BACKENDS[backend](model_name, runtime))
+
+
+def ClearClients():
+    with _clients_lock:
+        _clients.clear()
@@ -1,45 +1,87 @@
-#IMPORT IN ACTUAL 
+#IMPORT IN ACTUAL
 
 from llama_index.core import Document, SimpleDirectoryReader
+import io
 import tempfile
 import os
 from PyPDF2 import PdfReader
-import re
-import time
-from tenacity import retry, stop_after_attempt, wait_exponential
-from interfaces.utils.RateLimiter import RateLimiter
-import hashlib
-import pickle
-import os
-
+from core.ModelInitializers.IngestionCache import HashFileBytes, ingestion_cache
 
-# Rate limiter for API requests
-rate_limiter = RateLimiter(max_requests=50, window_size=60)
+# Document metadata kept out of embedding and LLM text; only page_label is
+# left in, as SimpleDirectoryReader's PDF reader did
+EXCLUDED_METADATA_KEYS = ["file_name", "file_type", "file_size", "file_hash"]
 
 def get_cache_path(file_hash):
-    cache_dir = os.path.join(os.path.dirname(__file__), '../cache')
-    os.makedirs(cache_dir, exist_ok=True)
-    return os.path.join(cache_dir, f"{file_hash}.pickle")
-
-@retry(
-    stop=stop_after_attempt(3),
-    wait=wait_exponential(multiplier=1, min=4, max=10)
-)
+    return ingestion_cache.path_for(file_hash)
+
+def GetDocumentHash(documents):
+    """Return the upload hash LoadDocument stamped on the documents, if any."""
+    for doc in documents or []:
+        file_hash = doc.metadata.get("file_hash")
+        if file_hash:
+            return file_hash
+    return None
+
+def _page_document(text, page_label, metadata):
+    doc = Document(text=text, metadata={"page_label": page_label, **metadata})
+    doc.excluded_embed_metadata_keys.extend(EXCLUDED_METADATA_KEYS)
+    doc.excluded_llm_metadata_keys.extend(EXCLUDED_METADATA_KEYS)
+    return doc
+
+def IterPdfDocuments(stream, metadata=None):
+    """
+    Yield one Document per PDF page, parsed straight from a binary stream
+    (an upload, BytesIO or open file) with no copy to disk. Pages are read
+    as the generator advances.
+    """
+    metadata = metadata or {}
+    reader = PdfReader(stream)
+    for index, page in enumerate(reader.pages):
+        yield _page_document(page.extract_text() or "", str(index + 1), metadata)
+
+def _load_from_temp_file(file_bytes, metadata):
+    """Fallback for PDFs PyPDF2 cannot read from memory: a private temp file through SimpleDirectoryReader."""
+    fd, path = tempfile.mkstemp(suffix=".pdf")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(file_bytes)
+        documents = SimpleDirectoryReader(input_files=[path]).load_data()
+    finally:
+        os.remove(path)
+    return [_page_document(doc.text, doc.metadata.get("page_label", str(index + 1)), metadata)
+            for index, doc in enumerate(documents)]
+
 def LoadDocument(uploaded_file):
     """Load and process uploaded document."""
     try:
-        # Save uploaded file temporarily
-        with open(f"temp_upload.pdf", "wb") as f:
-            f.write(uploaded_file.getbuffer())
-            
-        # Load using SimpleDirectoryReader
-        documents = SimpleDirectoryReader(input_files=["temp_upload.pdf"]).load_data()
-        
-        
-        import os
-        os.remove("temp_upload.pdf")
-        
+        # A view of the upload's buffer, not a copy; hashing and parsing both read it in place
+        file_bytes = uploaded_file.getbuffer()
+        file_hash = HashFileBytes(file_bytes)
+
+        # Resubmitted resumes are served from the cache without re-parsing
+        cached_documents = ingestion_cache.get_documents(file_hash)
+        if cached_documents is not None:
+            return cached_documents
+
+        metadata = {
+            "file_name": getattr(uploaded_file, "name", None) or f"{file_hash[:16]}.pdf",
+            "file_type": "application/pdf",
+            "file_size": len(file_bytes),
+            "file_hash": file_hash,
+        }
+        # Streamlit uploads are BytesIO subclasses and can be read directly
+        stream = uploaded_file if isinstance(uploaded_file, io.BufferedIOBase) and uploaded_file.seekable() \
+            else io.BytesIO(file_bytes)
+        try:
+            stream.seek(0)
+            documents = list(IterPdfDocuments(stream, metadata))
+        except Exception as e:
+            print(f"Error parsing PDF in memory, retrying from a temporary file: {e}")
+            documents = _load_from_temp_file(file_bytes, metadata)
+
+        ingestion_cache.put_documents(file_hash, documents)
+
         return documents
     except Exception as e:
         print(f"Error loading document: {e}")
-        return None
\ No newline at end of file
+        return None
@@ -1,22 +1,133 @@
-#IMPORT IN ACTUAL 
+#IMPORT IN ACTUAL
 
+import os
+import re
+import shutil
+import tempfile
 from llama_index.core import VectorStoreIndex
-from llama_index.core import Settings
 from llama_index.core import StorageContext, load_index_from_storage
-from llama_index.embeddings.gemini import GeminiEmbedding
-
-def DownloadGeminiEmbedding(model, documents):
-    # Load the Gemini embedding model
-    gemini_embed_model = GeminiEmbedding(model_name="models/embedding-001")
-    
-    # Set the model and embedding model in the settings
-    Settings.llm = model
-    Settings.embed_model = gemini_embed_model 
-    Settings.chunk_size = 70  #lower chunk size for extracting minute details
-    Settings.chunk_overlap = 10
-
-    index = VectorStoreIndex.from_documents(documents)
-    index.storage_context.persist()
-
-    query_engine = index.as_query_engine()
-    return query_engine
\ No newline at end of file
+from llama_index.core.schema import MetadataMode
+from dotenv import load_dotenv
+from core.ModelInitializers.DataIngestion import GetDocumentHash
+from core.ModelInitializers.IngestionCache import ingestion_cache
+from core.ModelInitializers.ClientPool import GetEmbeddingClient
+from core.ModelInitializers.ResumeChunker import ResumeNodeParser
+from core.ModelInitializers.Retrieval import BuildBatchQueryEngine
+from core.ModelInitializers.VectorStore import MemmapVectorStore
+
+load_dotenv()
+
+EMBED_MODEL_NAME = "models/embedding-001"
+
+# Per-deployment embedding backend: gemini (default), local or keyword, see ClientPool.GetEmbeddingClient
+EMBEDDING_BACKEND = os.getenv("EMBEDDING_BACKEND", "gemini").lower()
+LOCAL_EMBED_MODEL = os.getenv("LOCAL_EMBED_MODEL", "all-MiniLM-L6-v2")
+LOCAL_EMBED_RUNTIME = os.getenv("LOCAL_EMBED_RUNTIME", "torch").lower()
+
+# Optional root for persisted indexes, one sub-directory per resume hash.
+# Unset means every request keeps its index in memory only.
+INDEX_PERSIST_DIR = os.getenv("INDEX_PERSIST_DIR")
+
+def GetIndexEmbedding(backend=None):
+    """Embedding model for resume indexes on the configured EMBEDDING_BACKEND."""
+    backend = backend or EMBEDDING_BACKEND
+    if backend == "gemini":
+        return GetEmbeddingClient(EMBED_MODEL_NAME)
+    return GetEmbeddingClient(LOCAL_EMBED_MODEL, backend=backend, runtime=LOCAL_EMBED_RUNTIME)
+
+def DownloadGeminiEmbedding(model, documents, persist_root=INDEX_PERSIST_DIR):
+    # Load the embedding model of the configured backend (Gemini unless EMBEDDING_BACKEND says otherwise)
+    embed_model = GetIndexEmbedding()
+
+    # Models and chunking are passed per index, nothing is set on the global Settings
+    nodes = LoadEmbeddedNodes(documents, embed_model)
+
+    file_hash = GetDocumentHash(documents)
+    if persist_root and file_hash:
+        PersistIndex(nodes, GetIndexPersistDir(file_hash, persist_root, embed_model.model_name), embed_model=embed_model)
+
+    # Retrieval runs over the in-memory nodes, see Retrieval.BatchRetriever;
+    # parameter questions are embedded up front and ranked together by ScoringEngine
+    query_engine = BuildBatchQueryEngine(nodes, embed_model, model)
+    return query_engine
+
+def GetIndexPersistDir(file_hash, persist_root, model_name=EMBED_MODEL_NAME):
+    # Indexes built with another embedding model live in their own folder, vectors are not comparable
+    if model_name == EMBED_MODEL_NAME:
+        return os.path.join(persist_root, file_hash)
+    return os.path.join(persist_root, re.sub(r"[^A-Za-z0-9_.-]+", "_", model_name), file_hash)
+
+def PersistIndex(nodes, persist_dir, embed_model=None):
+    """
+    Persist an index of the nodes to persist_dir unless one is already there.
+    The index is written to a private temp directory and renamed into place,
+    so concurrent requests for the same resume never see a partial index.
+    """
+    if os.path.isdir(persist_dir):
+        return
+
+    parent_dir = os.path.dirname(os.path.abspath(persist_dir))
+    os.makedirs(parent_dir, exist_ok=True)
+    temp_dir = tempfile.mkdtemp(dir=parent_dir, prefix=".tmp-")
+    try:
+        storage_context = StorageContext.from_defaults(vector_store=MemmapVectorStore())
+        index = VectorStoreIndex(nodes, storage_context=storage_context, embed_model=embed_model)
+        index.storage_context.persist(persist_dir=temp_dir)
+        os.rename(temp_dir, persist_dir)
+    except OSError:
+        # Another request persisted the same resume first
+        if not os.path.isdir(persist_dir):
+            raise
+    finally:
+        shutil.rmtree(temp_dir, ignore_errors=True)
+
+def LoadPersistedIndex(persist_dir, embed_model=None):
+    """Reload an index persisted by DownloadGeminiEmbedding, memory-mapping its embeddings."""
+    storage_context = StorageContext.from_defaults(
+        persist_dir=persist_dir,
+        vector_store=MemmapVectorStore.from_persist_dir(persist_dir)
+    )
+    return load_index_from_storage(storage_context, embed_model=embed_model or GetIndexEmbedding())
+
+_node_parser = None
+
+def GetNodeParser():
+    """Shared ResumeNodeParser, created on first use."""
+    global _node_parser
+    if _node_parser is None:
+        _node_parser = ResumeNodeParser()
+    return _node_parser
+
+def LoadEmbeddedNodes(documents, embed_model, node_parser=None):
+    """
+    Chunk the documents (ResumeNodeParser unless node_parser is given) and
+    attach embeddings to every node.
+    Nodes of a previously seen upload are served from the ingestion cache,
+    so a resubmitted resume makes no embedding API calls.
+    """
+    node_parser = node_parser or GetNodeParser()
+    file_hash = GetDocumentHash(documents)
+    nodes_key = f"{embed_model.model_name}:{NodeParserKey(node_parser)}"
+
+    if file_hash:
+        cached_nodes = ingestion_cache.get_nodes(file_hash, nodes_key)
+        if cached_nodes is not None:
+            return cached_nodes
+
+    nodes = node_parser.get_nodes_from_documents(documents)
+    embeddings = embed_model.get_text_embedding_batch(
+        [node.get_content(metadata_mode=MetadataMode.EMBED) for node in nodes]
+    )
+    for node, embedding in zip(nodes, embeddings):
+        node.embedding = embedding
+
+    if file_hash:
+        ingestion_cache.put_nodes(file_hash, nodes_key, nodes)
+    return nodes
+
+def NodeParserKey(node_parser):
+    """Cache key part describing how nodes were chunked."""
+    cache_key = getattr(node_parser, "cache_key", None)
+    if cache_key:
+        return cache_key
+    return f"{node_parser.class_name()}:{getattr(node_parser, 'chunk_size', '')}:{getattr(node_parser, 'chunk_overlap', '')}"
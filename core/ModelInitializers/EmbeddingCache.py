@@ -0,0 +1,244 @@
+#IMPORT IN ACTUAL
+
+import hashlib
+import os
+import threading
+import time
+from typing import Any, Dict, List
+import numpy as np
+from dotenv import load_dotenv
+from llama_index.core.base.embeddings.base import BaseEmbedding
+from llama_index.core.bridge.pydantic import PrivateAttr
+
+load_dotenv()
+
+DEFAULT_EMBEDDING_CACHE_DB = os.path.join(os.path.dirname(__file__), '../cache/embeddings.sqlite3')
+MAX_EMBEDDING_CACHE_BYTES = 256 * 1024 * 1024
+# Inserts between size checks; eviction trims the store to 90% of max_bytes
+EVICTION_CHECK_INTERVAL = 500
+
+
+def NormalizeChunkText(text: str) -> str:
+    """Whitespace differences from PDF extraction should not cause a cache miss."""
+    return " ".join(text.split())
+
+
+def ChunkTextHash(text: str) -> bytes:
+    return hashlib.sha256(NormalizeChunkText(text).encode("utf-8")).digest()
+
+
+class EmbeddingStore:
+    """
+    SQLite store of float32 embedding vectors keyed by (model, task, text hash).
+
+    Vectors are stored as raw float32 blobs (3 KB for a 768-dim vector).
+    last_used is refreshed on every hit, and once the vectors take more than
+    max_bytes the least recently used rows are deleted. Safe to share between
+    threads and processes.
+    """
+
+    def __init__(self, path, max_bytes=MAX_EMBEDDING_CACHE_BYTES):
+        self.path = path
+        self.max_bytes = max_bytes
+        self.local = threading.local()
+        self.lock = threading.Lock()
+        self.inserts_since_check = EVICTION_CHECK_INTERVAL
+        self.counters = {"requested": 0, "hits": 0, "batch_duplicates": 0, "misses": 0, "evicted": 0}
+
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        conn = self._connect()
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS embeddings ("
+            "model TEXT NOT NULL, task TEXT NOT NULL, text_hash BLOB NOT NULL, "
+            "vector BLOB NOT NULL, last_used REAL NOT NULL, "
+            "PRIMARY KEY (model, task, text_hash))"
+        )
+        conn.execute("CREATE INDEX IF NOT EXISTS embeddings_last_used ON embeddings (last_used)")
+
+    def _connect(self):
+        conn = getattr(self.local, "conn", None)
+        if conn is None:
+            import sqlite3
+            conn = sqlite3.connect(self.path, timeout=30, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self.local.conn = conn
+        return conn
+
+    def get_many(self, model, task, text_hashes) -> Dict[bytes, List[float]]:
+        """Return {text_hash: vector} for the hashes that are stored, refreshing their last use."""
+        if not text_hashes:
+            return {}
+        conn = self._connect()
+        found = {}
+        # Stay well below SQLite's bound-parameter limit
+        for start in range(0, len(text_hashes), 500):
+            batch = text_hashes[start:start + 500]
+            placeholders = ",".join("?" * len(batch))
+            rows = conn.execute(
+                f"SELECT text_hash, vector FROM embeddings WHERE model = ? AND task = ? AND text_hash IN ({placeholders})",
+                (model, task, *batch)
+            ).fetchall()
+            found.update((text_hash, np.frombuffer(vector, dtype=np.float32).tolist()) for text_hash, vector in rows)
+        if found:
+            now = time.time()
+            conn.executemany(
+                "UPDATE embeddings SET last_used = ? WHERE model = ? AND task = ? AND text_hash = ?",
+                [(now, model, task, text_hash) for text_hash in found]
+            )
+        return found
+
+    def put_many(self, model, task, vectors: Dict[bytes, List[float]]):
+        if not vectors:
+            return
+        now = time.time()
+        conn = self._connect()
+        conn.executemany(
+            "INSERT OR REPLACE INTO embeddings (model, task, text_hash, vector, last_used) VALUES (?, ?, ?, ?, ?)",
+            [(model, task, text_hash, np.asarray(vector, dtype=np.float32).tobytes(), now)
+             for text_hash, vector in vectors.items()]
+        )
+        with self.lock:
+            self.inserts_since_check += len(vectors)
+            check = self.inserts_since_check >= EVICTION_CHECK_INTERVAL
+            if check:
+                self.inserts_since_check = 0
+        if check:
+            self.evict()
+
+    def evict(self):
+        """Delete least recently used vectors until the store is under 90% of max_bytes."""
+        conn = self._connect()
+        count, total_bytes = conn.execute("SELECT COUNT(*), COALESCE(SUM(LENGTH(vector)), 0) FROM embeddings").fetchone()
+        if total_bytes <= self.max_bytes or not count:
+            return
+        excess = int(count - (0.9 * self.max_bytes) / (total_bytes / count))
+        conn.execute(
+            "DELETE FROM embeddings WHERE rowid IN (SELECT rowid FROM embeddings ORDER BY last_used LIMIT ?)",
+            (excess,)
+        )
+        self.count("evicted", excess)
+
+    def clear(self):
+        self._connect().execute("DELETE FROM embeddings")
+
+    def count(self, counter, amount):
+        with self.lock:
+            self.counters[counter] += amount
+
+    def stats(self) -> Dict[str, Any]:
+        """Counters since start-up; saved_calls is how many texts were not sent to the model."""
+        with self.lock:
+            stats = dict(self.counters)
+        stats["saved_calls"] = stats["hits"] + stats["batch_duplicates"]
+        stats["hit_rate"] = stats["saved_calls"] / stats["requested"] if stats["requested"] else 0.0
+        return stats
+
+
+class CachedEmbedding(BaseEmbedding):
+    """
+    Embedding model wrapper that serves repeated chunks from an EmbeddingStore.
+
+    A batch is de-duplicated on normalized text before anything is sent, then
+    only the texts missing from the store go to the wrapped model, in one
+    batch. Keys include the wrapped model's name and whether the text was
+    embedded as a document or as a query.
+    """
+
+    _embed_model: Any = PrivateAttr()
+    _store: Any = PrivateAttr()
+
+    def __init__(self, embed_model, store, **kwargs: Any):
+        super().__init__(
+            model_name=embed_model.model_name,
+            embed_batch_size=embed_model.embed_batch_size,
+            **kwargs
+        )
+        self._embed_model = embed_model
+        self._store = store
+
+    @classmethod
+    def class_name(cls) -> str:
+        return "CachedEmbedding"
+
+    @property
+    def store(self):
+        return self._store
+
+    def _embed(self, texts: List[str], task: str) -> List[List[float]]:
+        text_hashes = [ChunkTextHash(text) for text in texts]
+        # First occurrence of every distinct chunk, in order
+        unique = {}
+        for text_hash, text in zip(text_hashes, texts):
+            unique.setdefault(text_hash, text)
+
+        try:
+            vectors = self._store.get_many(self.model_name, task, list(unique))
+        except Exception as e:
+            print(f"Error reading embedding cache: {e}")
+            vectors = {}
+
+        missing = [text_hash for text_hash in unique if text_hash not in vectors]
+        if missing:
+            if task == "query":
+                embedded = [self._embed_model.get_query_embedding(unique[text_hash]) for text_hash in missing]
+            else:
+                embedded = self._embed_model.get_text_embedding_batch([unique[text_hash] for text_hash in missing])
+            new_vectors = dict(zip(missing, embedded))
+            vectors.update(new_vectors)
+            try:
+                self._store.put_many(self.model_name, task, new_vectors)
+            except Exception as e:
+                print(f"Error writing embedding cache: {e}")
+
+        self._store.count("requested", len(texts))
+        self._store.count("batch_duplicates", len(texts) - len(unique))
+        self._store.count("hits", len(unique) - len(missing))
+        self._store.count("misses", len(missing))
+        return [vectors[text_hash] for text_hash in text_hashes]
+
+    def get_text_embedding_batch(self, texts: List[str], show_progress: bool = False, **kwargs: Any) -> List[List[float]]:
+        # De-duplicate across the whole list, the wrapped model does its own batching
+        return self._embed(list(texts), "text")
+
+    def _get_text_embedding(self, text: str) -> List[float]:
+        return self._embed([text], "text")[0]
+
+    def _get_text_embeddings(self, texts: List[str]) -> List[List[float]]:
+        return self._embed(texts, "text")
+
+    def _get_query_embedding(self, query: str) -> List[float]:
+        return self._embed([query], "query")[0]
+
+    async def _aget_query_embedding(self, query: str) -> List[float]:
+        return self._get_query_embedding(query)
+
+
+_store = None
+_store_lock = threading.Lock()
+
+
+def GetEmbeddingStore():
+    """
+    Process-wide EmbeddingStore at EMBEDDING_CACHE_DB (default
+    core/cache/embeddings.sqlite3), or None when EMBEDDING_CACHE_DB is set empty.
+    """
+    global _store
+    path = os.getenv("EMBEDDING_CACHE_DB", DEFAULT_EMBEDDING_CACHE_DB)
+    if not path:
+        return None
+    with _store_lock:
+        if _store is None or _store.path != path:
+            max_mb = os.getenv("EMBEDDING_CACHE_MAX_MB")
+            _store = EmbeddingStore(path, max_bytes=int(float(max_mb) * 1024 * 1024) if max_mb else MAX_EMBEDDING_CACHE_BYTES)
+        return _store
+
+
+def WrapEmbeddingCache(embed_model):
+    """Put the shared embedding cache in front of embed_model, if the cache is enabled."""
+    try:
+        store = GetEmbeddingStore()
+    except Exception as e:
+        print(f"Error opening embedding cache: {e}")
+        return embed_model
+    return CachedEmbedding(embed_model, store) if store is not None else embed_model
@@ -0,0 +1,148 @@
+#IMPORT IN ACTUAL
+
+import hashlib
+import os
+import pickle
+import tempfile
+import time
+from threading import Lock
+
+# Bump whenever the layout of a cache entry (or of the pickled llama_index
+# objects inside it) changes, so stale entries are dropped instead of loaded.
+CACHE_FORMAT_VERSION = 1
+
+CACHE_DIR = os.path.join(os.path.dirname(__file__), '../cache')
+MAX_CACHE_BYTES = 256 * 1024 * 1024
+
+
+def HashFileBytes(data) -> str:
+    """Return the SHA-256 hex digest of the uploaded file contents."""
+    return hashlib.sha256(data).hexdigest()
+
+
+class IngestionCache:
+    """
+    On-disk cache of parsed resumes keyed by the SHA-256 of the uploaded bytes.
+
+    Each entry is a single pickle holding the parsed Documents and, per
+    embedding configuration, the chunked nodes with their embeddings attached.
+    Entries are evicted least-recently-used first once the directory grows
+    past max_bytes; the file mtime doubles as the last-access time.
+    """
+
+    def __init__(self, cache_dir=CACHE_DIR, max_bytes=MAX_CACHE_BYTES, version=CACHE_FORMAT_VERSION):
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        self.version = version
+        self.lock = Lock()
+
+    def path_for(self, file_hash):
+        os.makedirs(self.cache_dir, exist_ok=True)
+        return os.path.join(self.cache_dir, f"{file_hash}.pickle")
+
+    def get(self, file_hash):
+        """Return the cache entry for file_hash, or None on a miss or stale entry."""
+        path = self.path_for(file_hash)
+        try:
+            with open(path, 'rb') as file:
+                entry = pickle.load(file)
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            print(f"Error reading cache entry {file_hash}: {e}")
+            self._remove(path)
+            return None
+
+        if not isinstance(entry, dict) or entry.get("version") != self.version:
+            self._remove(path)
+            return None
+
+        self._touch(path)
+        return entry
+
+    def put(self, file_hash, **fields):
+        """Merge fields into the entry for file_hash and write it atomically."""
+        with self.lock:
+            entry = self.get(file_hash) or {"version": self.version}
+            for key, value in fields.items():
+                if isinstance(value, dict) and isinstance(entry.get(key), dict):
+                    entry[key].update(value)
+                else:
+                    entry[key] = value
+
+            path = self.path_for(file_hash)
+            fd, temp_path = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+            try:
+                with os.fdopen(fd, 'wb') as file:
+                    pickle.dump(entry, file, protocol=pickle.HIGHEST_PROTOCOL)
+                os.replace(temp_path, path)
+            except Exception as e:
+                # A failed cache write must never fail the ingestion itself
+                print(f"Error writing cache entry {file_hash}: {e}")
+                self._remove(temp_path)
+                return
+
+            self.evict()
+
+    def get_documents(self, file_hash):
+        entry = self.get(file_hash)
+        return entry.get("documents") if entry else None
+
+    def put_documents(self, file_hash, documents):
+        self.put(file_hash, documents=documents)
+
+    def get_nodes(self, file_hash, nodes_key):
+        """Return cached embedded nodes for the given embedding/chunking configuration."""
+        entry = self.get(file_hash)
+        if not entry:
+            return None
+        return entry.get("nodes", {}).get(nodes_key)
+
+    def put_nodes(self, file_hash, nodes_key, nodes):
+        self.put(file_hash, nodes={nodes_key: nodes})
+
+    def evict(self):
+        """Delete least-recently-used entries until the cache fits in max_bytes."""
+        entries = []
+        total_bytes = 0
+        for name in os.listdir(self.cache_dir):
+            if not name.endswith(".pickle"):
+                continue
+            path = os.path.join(self.cache_dir, name)
+            try:
+                stat = os.stat(path)
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+            total_bytes += stat.st_size
+
+        entries.sort()
+        while total_bytes > self.max_bytes and entries:
+            _, size, path = entries.pop(0)
+            self._remove(path)
+            total_bytes -= size
+
+    def clear(self):
+        with self.lock:
+            if not os.path.isdir(self.cache_dir):
+                return
+            for name in os.listdir(self.cache_dir):
+                if name.endswith(".pickle"):
+                    self._remove(os.path.join(self.cache_dir, name))
+
+    def _touch(self, path):
+        try:
+            now = time.time()
+            os.utime(path, (now, now))
+        except OSError:
+            pass
+
+    def _remove(self, path):
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+
+
+# Shared cache used by LoadDocument and DownloadGeminiEmbedding
+ingestion_cache = IngestionCache()
@@ -0,0 +1,124 @@
+#IMPORT IN ACTUAL
+
+import hashlib
+import math
+import re
+from collections import Counter
+from threading import Lock
+from typing import Any, List
+import numpy as np
+from llama_index.core.base.embeddings.base import BaseEmbedding
+from llama_index.core.bridge.pydantic import PrivateAttr
+
+DEFAULT_LOCAL_MODEL_NAME = "all-MiniLM-L6-v2"
+DEFAULT_KEYWORD_DIM = 1024
+LOCAL_BATCH_SIZE = 32
+
+# Words that carry no signal for matching questions to resume chunks
+STOP_WORDS = frozenset("""
+a an and are as at be by candidate do does for from has have in is it of on only or return the their this to
+value was what which with answer true false numerical
+""".split())
+
+
+def KeywordVector(text: str, dim: int = DEFAULT_KEYWORD_DIM) -> List[float]:
+    """
+    Hashed TF vector over words and word bigrams with stop words removed and
+    sublinear (1 + log tf) weighting, L2-normalized. Needs no fitted
+    vocabulary, so vectors are stable across resumes and processes.
+    """
+    tokens = [token for token in re.findall(r"[a-z0-9][a-z0-9+#.]*", text.lower()) if token not in STOP_WORDS]
+    features = Counter(tokens + [f"{a} {b}" for a, b in zip(tokens, tokens[1:])])
+    vector = np.zeros(dim, dtype=np.float32)
+    for feature, count in features.items():
+        digest = hashlib.blake2b(feature.encode("utf-8"), digest_size=8).digest()
+        bucket = int.from_bytes(digest[:4], "little") % dim
+        vector[bucket] += (1.0 + math.log(count)) * (1.0 if digest[4] & 1 else -1.0)
+    norm = np.linalg.norm(vector)
+    if norm > 0:
+        vector /= norm
+    return vector.tolist()
+
+
+class KeywordEmbedding(BaseEmbedding):
+    """Dependency-free CPU embedding built on KeywordVector; the fallback when no local model loads."""
+
+    embed_dim: int = DEFAULT_KEYWORD_DIM
+
+    def __init__(self, embed_dim: int = DEFAULT_KEYWORD_DIM, **kwargs: Any):
+        super().__init__(embed_dim=embed_dim, model_name=f"keyword-hash:{embed_dim}", **kwargs)
+
+    @classmethod
+    def class_name(cls) -> str:
+        return "KeywordEmbedding"
+
+    def _get_query_embedding(self, query: str) -> List[float]:
+        return KeywordVector(query, self.embed_dim)
+
+    def _get_text_embedding(self, text: str) -> List[float]:
+        return KeywordVector(text, self.embed_dim)
+
+    def _get_text_embeddings(self, texts: List[str]) -> List[List[float]]:
+        return [KeywordVector(text, self.embed_dim) for text in texts]
+
+    async def _aget_query_embedding(self, query: str) -> List[float]:
+        return self._get_query_embedding(query)
+
+
+class LocalEmbedding(BaseEmbedding):
+    """
+    sentence-transformers model run on the CPU, optionally through its ONNX
+    runtime backend. Texts are encoded in batches of embed_batch_size with
+    normalized outputs; one encode runs at a time per model.
+    """
+
+    _model: Any = PrivateAttr()
+    _lock: Any = PrivateAttr()
+
+    def __init__(self, model_name: str = DEFAULT_LOCAL_MODEL_NAME, runtime: str = "torch",
+                 embed_batch_size: int = LOCAL_BATCH_SIZE, **kwargs: Any):
+        from sentence_transformers import SentenceTransformer
+
+        model_kwargs = {"device": "cpu"}
+        if runtime == "onnx":
+            model_kwargs["backend"] = "onnx"
+        model = SentenceTransformer(model_name, **model_kwargs)
+        suffix = ":onnx" if runtime == "onnx" else ""
+        super().__init__(model_name=f"local:{model_name}{suffix}", embed_batch_size=embed_batch_size, **kwargs)
+        self._model = model
+        self._lock = Lock()
+
+    @classmethod
+    def class_name(cls) -> str:
+        return "LocalEmbedding"
+
+    def _encode(self, texts: List[str]) -> List[List[float]]:
+        with self._lock:
+            vectors = self._model.encode(texts, batch_size=self.embed_batch_size,
+                                         normalize_embeddings=True, convert_to_numpy=True)
+        return vectors.tolist()
+
+    def get_text_embedding_batch(self, texts: List[str], show_progress: bool = False, **kwargs: Any) -> List[List[float]]:
+        # The model batches internally, one encode call covers the whole list
+        return self._encode(list(texts)) if texts else []
+
+    def _get_query_embedding(self, query: str) -> List[float]:
+        return self._encode([query])[0]
+
+    def _get_text_embedding(self, text: str) -> List[float]:
+        return self._encode([text])[0]
+
+    def _get_text_embeddings(self, texts: List[str]) -> List[List[float]]:
+        return self._encode(texts)
+
+    async def _aget_query_embedding(self, query: str) -> List[float]:
+        return self._get_query_embedding(query)
+
+
+def CreateLocalEmbedding(model_name=DEFAULT_LOCAL_MODEL_NAME, runtime="torch"):
+    """LocalEmbedding when sentence-transformers and the model weights are available, else KeywordEmbedding."""
+    try:
+        return LocalEmbedding(model_name=model_name, runtime=runtime)
+    except Exception as e:
+        print(f"Error loading local embedding model {model_name}, using keyword hashing instead: {e}")
+        return KeywordEmbedding()
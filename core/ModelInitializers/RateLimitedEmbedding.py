@@ -0,0 +1,50 @@
+#IMPORT IN ACTUAL
+
+import asyncio
+from typing import Any, List
+from llama_index.core.base.embeddings.base import BaseEmbedding
+from llama_index.core.bridge.pydantic import PrivateAttr
+
+
+class RateLimitedEmbedding(BaseEmbedding):
+    """
+    Embedding model wrapper taking one rate limiter token per text sent.
+
+    GeminiEmbedding issues one embed_content request per text, batches
+    included, so a batch of N chunks costs N tokens. Sits behind the
+    embedding cache, so cache hits cost nothing.
+    """
+
+    _embed_model: Any = PrivateAttr()
+    _rate_limiter: Any = PrivateAttr()
+
+    def __init__(self, embed_model, rate_limiter, **kwargs: Any):
+        super().__init__(
+            model_name=embed_model.model_name,
+            embed_batch_size=embed_model.embed_batch_size,
+            **kwargs
+        )
+        self._embed_model = embed_model
+        self._rate_limiter = rate_limiter
+
+    @classmethod
+    def class_name(cls) -> str:
+        return "RateLimitedEmbedding"
+
+    def _get_query_embedding(self, query: str) -> List[float]:
+        self._rate_limiter.wait_if_needed()
+        return self._embed_model._get_query_embedding(query)
+
+    def _get_text_embedding(self, text: str) -> List[float]:
+        self._rate_limiter.wait_if_needed()
+        return self._embed_model._get_text_embedding(text)
+
+    def _get_text_embeddings(self, texts: List[str]) -> List[List[float]]:
+        return [self._get_text_embedding(text) for text in texts]
+
+    # The limiter wait and the wrapped model's request both block, keep them off the event loop
+    async def _aget_query_embedding(self, query: str) -> List[float]:
+        return await asyncio.to_thread(self._get_query_embedding, query)
+
+    async def _aget_text_embedding(self, text: str) -> List[float]:
+        return await asyncio.to_thread(self._get_text_embedding, text)
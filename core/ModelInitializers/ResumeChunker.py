@@ -0,0 +1,113 @@
+#IMPORT IN ACTUAL
+
+import math
+from typing import Any, Callable, List, Sequence
+from llama_index.core.bridge.pydantic import Field, PrivateAttr
+from llama_index.core.node_parser import NodeParser, SentenceSplitter
+from llama_index.core.node_parser.node_utils import build_nodes_from_splits
+from llama_index.core.schema import BaseNode, MetadataMode
+from llama_index.core.utils import get_tokenizer
+from core.ModelInitializers.ResumeSections import HEADER_SECTION, SplitSections, SplitBlocks
+
+# Bumped whenever the chunking rules change, so cached nodes are rebuilt
+CHUNKER_VERSION = 1
+
+MIN_CHUNK_TOKENS = 128
+MAX_CHUNK_TOKENS = 384
+# Roughly how many lines or list items a chunk should hold, see ResumeNodeParser
+ITEMS_PER_CHUNK = 16
+
+
+class ResumeNodeParser(NodeParser):
+    """
+    Resume-aware node parser.
+
+    Text is split at detected section headings (Experience, Education,
+    Skills, Projects, ...), then packed into chunks by whole blocks (a title
+    with its bullet list), so lists are only broken up when a single block is
+    longer than max_chunk_tokens. Each section gets its own chunk budget from
+    its density: items_per_chunk times the mean item length, clamped to
+    [min_chunk_tokens, max_chunk_tokens] and evened out over the section.
+    Every node carries its section in metadata["section"].
+    """
+
+    min_chunk_tokens: int = Field(default=MIN_CHUNK_TOKENS, gt=0)
+    max_chunk_tokens: int = Field(default=MAX_CHUNK_TOKENS, gt=0)
+    items_per_chunk: int = Field(default=ITEMS_PER_CHUNK, gt=0)
+    _tokenizer: Callable = PrivateAttr()
+    _item_splitter: SentenceSplitter = PrivateAttr()
+
+    def __init__(self, tokenizer=None, **kwargs: Any):
+        super().__init__(**kwargs)
+        self._tokenizer = tokenizer or get_tokenizer()
+        # Only for single items longer than a whole chunk
+        self._item_splitter = SentenceSplitter(chunk_size=self.max_chunk_tokens, chunk_overlap=0,
+                                               tokenizer=self._tokenizer)
+
+    @classmethod
+    def class_name(cls) -> str:
+        return "ResumeNodeParser"
+
+    @property
+    def cache_key(self) -> str:
+        """Identifies the chunking configuration in ingestion cache keys."""
+        return f"resume-v{CHUNKER_VERSION}:{self.min_chunk_tokens}:{self.max_chunk_tokens}:{self.items_per_chunk}"
+
+    def _count_tokens(self, text):
+        return len(self._tokenizer(text))
+
+    def chunk_budget(self, item_tokens: List[int]) -> int:
+        """Target chunk size in tokens for a section whose items have these lengths."""
+        total = sum(item_tokens)
+        cap = self.items_per_chunk * total / max(1, len(item_tokens))
+        cap = min(self.max_chunk_tokens, max(self.min_chunk_tokens, cap))
+        # Even out the chunks rather than leaving a small remainder
+        return math.ceil(total / math.ceil(total / cap)) if total else int(cap)
+
+    def split_section(self, lines: List[str]) -> List[str]:
+        """Pack a section's blocks into chunks, breaking a block up only when it exceeds max_chunk_tokens."""
+        units = []
+        item_tokens = []
+        for block in SplitBlocks(lines):
+            tokens = [self._count_tokens(item) for item in block]
+            item_tokens.extend(tokens)
+            if sum(tokens) <= self.max_chunk_tokens:
+                units.append(("\n".join(block), sum(tokens)))
+                continue
+            for item, count in zip(block, tokens):
+                if count <= self.max_chunk_tokens:
+                    units.append((item, count))
+                else:
+                    units.extend((split, self._count_tokens(split)) for split in self._item_splitter.split_text(item))
+        if not units:
+            return []
+
+        budget = self.chunk_budget(item_tokens)
+        chunks = []
+        current, current_tokens = [], 0
+        for text, tokens in units:
+            # Start a new chunk unless at least half of this unit fits the budget
+            if current and (current_tokens + tokens > self.max_chunk_tokens or current_tokens + tokens / 2 > budget):
+                chunks.append("\n".join(current))
+                current, current_tokens = [], 0
+            current.append(text)
+            current_tokens += tokens
+        if current:
+            chunks.append("\n".join(current))
+        return chunks
+
+    def _parse_nodes(self, nodes: Sequence[BaseNode], show_progress: bool = False, **kwargs: Any) -> List[BaseNode]:
+        all_nodes = []
+        # PDF pages arrive as separate documents; a section running onto the next page keeps its name
+        section, source = HEADER_SECTION, None
+        for node in nodes:
+            node_source = node.metadata.get("file_hash") or node.metadata.get("file_name")
+            if node_source != source:
+                section, source = HEADER_SECTION, node_source
+
+            for section, lines in SplitSections(node.get_content(metadata_mode=MetadataMode.NONE), section):
+                section_nodes = build_nodes_from_splits(self.split_section(lines), node, id_func=self.id_func)
+                for section_node in section_nodes:
+                    section_node.metadata["section"] = section
+                all_nodes.extend(section_nodes)
+        return all_nodes
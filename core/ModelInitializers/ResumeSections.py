@@ -0,0 +1,114 @@
+#IMPORT IN ACTUAL
+
+# Plain-text resume structure shared by the chunker and the rule-based
+# extractors; no llama_index imports so the scorers stay cheap to import.
+
+import re
+from typing import List
+
+# Heading word -> canonical section; the last matching word of a heading wins,
+# so "Academic Projects" is Projects and "Technical Skills" is Skills
+SECTION_WORDS = {
+    "experience": "Experience", "employment": "Experience", "history": "Experience",
+    "internship": "Experience", "internships": "Experience",
+    "education": "Education", "academic": "Education", "academics": "Education", "qualifications": "Education",
+    "skills": "Skills", "technologies": "Skills", "competencies": "Skills", "tools": "Skills", "stack": "Skills",
+    "projects": "Projects", "project": "Projects",
+    "certifications": "Certifications", "certification": "Certifications", "licenses": "Certifications",
+    "courses": "Certifications", "coursework": "Certifications",
+    "achievements": "Achievements", "awards": "Achievements", "honors": "Achievements",
+    "accomplishments": "Achievements",
+    "summary": "Summary", "objective": "Summary", "profile": "Summary", "about": "Summary",
+    "publications": "Publications", "research": "Publications",
+}
+# Words that may qualify a section word in a heading ("Work Experience",
+# "Technical Skills"); a line with any other word is content, so job titles
+# like "Project Manager" or "Research Assistant" are never headings
+HEADING_MODIFIERS = {
+    "work", "professional", "technical", "relevant", "key", "core", "selected", "personal", "other",
+    "additional", "career", "academic", "and", "of", "me", "my", "areas", "area",
+}
+HEADER_SECTION = "Header"
+
+HEADING_PATTERN = re.compile(r"^\s*(?:[#*•\-]\s*)?([A-Za-z][A-Za-z &/]{2,40}?)\s*:?\s*$")
+BULLET_PATTERN = re.compile(r"^\s*(?:[-*•▪●◦‣–]|\d{1,2}[.)])\s+")
+
+
+def DetectSectionHeading(line: str):
+    """
+    Return the canonical section a heading line opens, or None for ordinary
+    lines. The whole line must be a heading: section words, optionally with
+    modifiers such as "Technical", and an optional colon.
+    """
+    match = HEADING_PATTERN.match(line)
+    if not match:
+        return None
+    words = match.group(1).lower().replace("/", " ").replace("&", " ").split()
+    if not words or len(words) > 4:
+        return None
+    if any(word not in SECTION_WORDS and word not in HEADING_MODIFIERS for word in words):
+        return None
+    for word in reversed(words):
+        if word in SECTION_WORDS:
+            return SECTION_WORDS[word]
+    return None
+
+
+def SplitSections(text: str, section: str = HEADER_SECTION):
+    """Split resume text into [(section, [line, ...])], starting in section."""
+    sections = [(section, [])]
+    for line in text.splitlines():
+        heading = DetectSectionHeading(line)
+        if heading:
+            sections.append((heading, [line.strip()]))
+        else:
+            sections[-1][1].append(line)
+    return [(name, lines) for name, lines in sections if any(line.strip() for line in lines)]
+
+
+def SplitItems(lines: List[str]) -> List[str]:
+    """
+    Group lines into items: a bullet with its wrapped continuation lines, or
+    a single plain line.
+    """
+    items = []
+    in_bullet = False
+    for line in lines:
+        if not line.strip():
+            in_bullet = False
+        elif BULLET_PATTERN.match(line):
+            items.append(line.rstrip())
+            in_bullet = True
+        elif in_bullet and (line[:1].isspace() or line.lstrip()[:1].islower()):
+            items[-1] += "\n" + line.rstrip()
+        else:
+            items.append(line.rstrip())
+            in_bullet = False
+    return items
+
+
+def SplitBlocks(lines: List[str]) -> List[List[str]]:
+    """
+    Group a section's lines into blocks of items: plain lead lines (a job or
+    degree title) followed by their bullet list. A block ends at a blank line
+    or at a plain line following a bullet list, so a list always stays in
+    one block.
+    """
+    blocks = []
+    paragraph = []
+    for line in lines + [""]:
+        if line.strip():
+            paragraph.append(line)
+            continue
+        current, seen_bullet = [], False
+        for item in SplitItems(paragraph):
+            is_bullet = bool(BULLET_PATTERN.match(item))
+            if current and seen_bullet and not is_bullet:
+                blocks.append(current)
+                current, seen_bullet = [], False
+            current.append(item)
+            seen_bullet = seen_bullet or is_bullet
+        if current:
+            blocks.append(current)
+        paragraph = []
+    return blocks
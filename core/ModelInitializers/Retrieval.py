@@ -0,0 +1,86 @@
+#IMPORT IN ACTUAL
+
+from threading import Lock
+from typing import List
+import numpy as np
+from llama_index.core.base.base_retriever import BaseRetriever
+from llama_index.core.query_engine import RetrieverQueryEngine
+from llama_index.core.schema import NodeWithScore, QueryBundle
+
+# Same default as index.as_query_engine()
+DEFAULT_SIMILARITY_TOP_K = 2
+
+
+def _normalize_rows(matrix):
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    norms[norms == 0] = 1.0
+    return matrix / norms
+
+
+def TopKIndices(similarities, top_k):
+    """Return the column indices of the top_k values of every row, best first."""
+    top_k = min(top_k, similarities.shape[1])
+    if top_k <= 0:
+        return np.empty((similarities.shape[0], 0), dtype=int)
+    candidates = np.argpartition(-similarities, top_k - 1, axis=1)[:, :top_k]
+    order = np.take_along_axis(similarities, candidates, axis=1).argsort(axis=1)[:, ::-1]
+    return np.take_along_axis(candidates, order, axis=1)
+
+
+class BatchRetriever(BaseRetriever):
+    """
+    Cosine top-k retriever over a single resume's embedded nodes.
+
+    prefetch() query-embeds every parameter question (the questions repeat for
+    every resume, so the embedding cache serves them after the first) and ranks
+    all of them against all chunks with one matrix multiply; later retrievals
+    for those questions are served from memory. Unknown questions fall back to
+    a single query embedding.
+    """
+
+    def __init__(self, nodes, embed_model, similarity_top_k=DEFAULT_SIMILARITY_TOP_K, **kwargs):
+        super().__init__(**kwargs)
+        self._nodes = list(nodes)
+        self._embed_model = embed_model
+        self._similarity_top_k = similarity_top_k
+        self._node_matrix = _normalize_rows(
+            np.asarray([node.embedding for node in self._nodes], dtype=np.float32)
+        ) if self._nodes else np.empty((0, 0), dtype=np.float32)
+        self._prefetched = {}
+        self._lock = Lock()
+
+    def prefetch(self, queries: List[str]) -> None:
+        """Retrieve the top-k context for every query, ranked in one matrix multiply."""
+        queries = [query for query in dict.fromkeys(queries) if query not in self._prefetched]
+        if not queries or not self._nodes:
+            return
+
+        # Query embeddings, like the per-question fallback in _retrieve
+        query_embeddings = [self._embed_model.get_query_embedding(query) for query in queries]
+        results = self._rank(np.asarray(query_embeddings, dtype=np.float32))
+        with self._lock:
+            self._prefetched.update(zip(queries, results))
+
+    def _rank(self, query_matrix):
+        similarities = _normalize_rows(query_matrix) @ self._node_matrix.T
+        top_indices = TopKIndices(similarities, self._similarity_top_k)
+        return [
+            [NodeWithScore(node=self._nodes[i], score=float(row_scores[i])) for i in row_indices]
+            for row_scores, row_indices in zip(similarities, top_indices)
+        ]
+
+    def _retrieve(self, query_bundle: QueryBundle) -> List[NodeWithScore]:
+        cached = self._prefetched.get(query_bundle.query_str)
+        if cached is not None:
+            return list(cached)
+        if not self._nodes:
+            return []
+
+        query_embedding = query_bundle.embedding or self._embed_model.get_query_embedding(query_bundle.query_str)
+        return self._rank(np.asarray([query_embedding], dtype=np.float32))[0]
+
+
+def BuildBatchQueryEngine(nodes, embed_model, llm, similarity_top_k=DEFAULT_SIMILARITY_TOP_K):
+    """Query engine answering from a BatchRetriever; call query_engine.retriever.prefetch(questions) first."""
+    retriever = BatchRetriever(nodes, embed_model, similarity_top_k=similarity_top_k)
+    return RetrieverQueryEngine.from_args(retriever, llm=llm)
@@ -0,0 +1,183 @@
+#IMPORT IN ACTUAL
+
+import json
+import os
+import tempfile
+from collections.abc import MutableMapping
+from typing import Any, Dict, List, Optional, Tuple
+import numpy as np
+from llama_index.core.vector_stores import SimpleVectorStore
+from llama_index.core.vector_stores.simple import SimpleVectorStoreData
+from llama_index.core.vector_stores.types import (
+    VectorStoreQuery,
+    VectorStoreQueryMode,
+    VectorStoreQueryResult
+)
+from llama_index.core.storage.storage_context import DEFAULT_PERSIST_DIR
+from llama_index.core.vector_stores.types import DEFAULT_PERSIST_FNAME
+
+MEMMAP_FORMAT_VERSION = 1
+
+
+def MemmapPaths(persist_path: str) -> Tuple[str, str]:
+    """Return the (.npy matrix, .ids.json sidecar) paths for a vector store persist path."""
+    base, _ = os.path.splitext(persist_path)
+    return base + ".npy", base + ".ids.json"
+
+
+class MemmapEmbeddingDict(MutableMapping):
+    """
+    Read-mostly mapping of node id -> embedding backed by a float32 matrix.
+
+    Rows of the (possibly memory-mapped) matrix are only touched when read.
+    Writes and deletes go to a small overlay so the file is never modified in place.
+    """
+
+    def __init__(self, ids=None, matrix=None):
+        self.ids = list(ids or [])
+        self.rows = {node_id: row for row, node_id in enumerate(self.ids)}
+        self.matrix = matrix if matrix is not None else np.empty((0, 0), dtype=np.float32)
+        self.overlay = {}
+        self.deleted = set()
+
+    def __getitem__(self, node_id):
+        if node_id in self.overlay:
+            return self.overlay[node_id]
+        if node_id in self.deleted or node_id not in self.rows:
+            raise KeyError(node_id)
+        return self.matrix[self.rows[node_id]].tolist()
+
+    def __setitem__(self, node_id, embedding):
+        self.overlay[node_id] = embedding
+        self.deleted.discard(node_id)
+
+    def __delitem__(self, node_id):
+        if node_id in self.overlay:
+            del self.overlay[node_id]
+            if node_id in self.rows:
+                self.deleted.add(node_id)
+        elif node_id in self.rows and node_id not in self.deleted:
+            self.deleted.add(node_id)
+        else:
+            raise KeyError(node_id)
+
+    def __iter__(self):
+        for node_id in self.ids:
+            if node_id not in self.deleted and node_id not in self.overlay:
+                yield node_id
+        yield from self.overlay
+
+    def __len__(self):
+        base = sum(1 for node_id in self.ids if node_id not in self.deleted and node_id not in self.overlay)
+        return base + len(self.overlay)
+
+    def as_matrix(self) -> Tuple[List[str], np.ndarray]:
+        """Return (ids, matrix), zero-copy when nothing was changed since loading."""
+        if not self.overlay and not self.deleted:
+            return self.ids, self.matrix
+        ids = list(self)
+        return ids, np.asarray([self[node_id] for node_id in ids], dtype=np.float32)
+
+
+class MemmapVectorStore(SimpleVectorStore):
+    """
+    SimpleVectorStore that persists embeddings as one contiguous float32 .npy
+    matrix and memory-maps it on load, instead of writing every float to JSON.
+
+    Node ids, ref doc ids and metadata go to a JSON sidecar next to the matrix.
+    Only local paths are supported.
+    """
+
+    def __init__(self, data: Optional[SimpleVectorStoreData] = None, fs=None, **kwargs: Any) -> None:
+        super().__init__(data=data, fs=fs, **kwargs)
+        if not isinstance(self.data.embedding_dict, MemmapEmbeddingDict):
+            embedding_dict = MemmapEmbeddingDict()
+            embedding_dict.update(self.data.embedding_dict)
+            self.data.embedding_dict = embedding_dict
+
+    @classmethod
+    def class_name(cls) -> str:
+        return "MemmapVectorStore"
+
+    def clear(self) -> None:
+        self.data = SimpleVectorStoreData()
+        self.data.embedding_dict = MemmapEmbeddingDict()
+
+    def _embedding_matrix(self) -> Tuple[List[str], np.ndarray]:
+        embedding_dict = self.data.embedding_dict
+        if isinstance(embedding_dict, MemmapEmbeddingDict):
+            return embedding_dict.as_matrix()
+        ids = list(embedding_dict)
+        return ids, np.asarray([embedding_dict[node_id] for node_id in ids], dtype=np.float32)
+
+    def query(self, query: VectorStoreQuery, **kwargs: Any) -> VectorStoreQueryResult:
+        """Cosine top-k over the whole matrix in one pass; other modes use the base implementation."""
+        if query.mode != VectorStoreQueryMode.DEFAULT or query.filters is not None or query.node_ids is not None:
+            return super().query(query, **kwargs)
+
+        ids, matrix = self._embedding_matrix()
+        if not ids:
+            return VectorStoreQueryResult(similarities=[], ids=[])
+
+        query_embedding = np.asarray(query.query_embedding, dtype=np.float32)
+        norms = np.linalg.norm(matrix, axis=1) * np.linalg.norm(query_embedding)
+        norms[norms == 0] = 1.0
+        similarities = (matrix @ query_embedding) / norms
+
+        top_k = min(query.similarity_top_k or len(ids), len(ids))
+        top = np.argpartition(-similarities, top_k - 1)[:top_k]
+        top = top[np.argsort(-similarities[top])]
+        return VectorStoreQueryResult(
+            similarities=[float(similarities[i]) for i in top],
+            ids=[ids[i] for i in top]
+        )
+
+    def to_dict(self, **kwargs: Any) -> Dict[str, Any]:
+        return {
+            "embedding_dict": {node_id: list(map(float, self.data.embedding_dict[node_id])) for node_id in self.data.embedding_dict},
+            "text_id_to_ref_doc_id": dict(self.data.text_id_to_ref_doc_id),
+            "metadata_dict": dict(self.data.metadata_dict)
+        }
+
+    def persist(self, persist_path: str = os.path.join(DEFAULT_PERSIST_DIR, DEFAULT_PERSIST_FNAME), fs=None) -> None:
+        """Write the .npy matrix and its sidecar; both are replaced atomically."""
+        matrix_path, sidecar_path = MemmapPaths(persist_path)
+        dirpath = os.path.dirname(matrix_path) or "."
+        os.makedirs(dirpath, exist_ok=True)
+
+        ids, matrix = self._embedding_matrix()
+        matrix = np.ascontiguousarray(matrix, dtype=np.float32)
+        sidecar = {
+            "version": MEMMAP_FORMAT_VERSION,
+            "ids": ids,
+            "text_id_to_ref_doc_id": {node_id: self.data.text_id_to_ref_doc_id.get(node_id, "None") for node_id in ids},
+            "metadata_dict": {node_id: self.data.metadata_dict[node_id] for node_id in ids if node_id in self.data.metadata_dict}
+        }
+
+        fd, temp_matrix = tempfile.mkstemp(dir=dirpath, suffix=".npy")
+        with os.fdopen(fd, "wb") as file:
+            np.save(file, matrix)
+        fd, temp_sidecar = tempfile.mkstemp(dir=dirpath, suffix=".json")
+        with os.fdopen(fd, "w") as file:
+            json.dump(sidecar, file, separators=(",", ":"))
+        os.replace(temp_matrix, matrix_path)
+        os.replace(temp_sidecar, sidecar_path)
+
+    @classmethod
+    def from_persist_path(cls, persist_path: str, fs=None) -> "MemmapVectorStore":
+        matrix_path, sidecar_path = MemmapPaths(persist_path)
+        if not os.path.exists(matrix_path) or not os.path.exists(sidecar_path):
+            raise ValueError(f"No existing {__name__} found at {persist_path}, skipping load.")
+
+        with open(sidecar_path, "r") as file:
+            sidecar = json.load(file)
+        if sidecar.get("version") != MEMMAP_FORMAT_VERSION:
+            raise ValueError(f"Unsupported vector store format version: {sidecar.get('version')}")
+
+        # An empty array cannot be memory-mapped
+        matrix = np.load(matrix_path, mmap_mode="r" if sidecar["ids"] else None)
+        store = cls()
+        store.data.embedding_dict = MemmapEmbeddingDict(sidecar["ids"], matrix)
+        store.data.text_id_to_ref_doc_id = sidecar["text_id_to_ref_doc_id"]
+        store.data.metadata_dict = sidecar["metadata_dict"]
+        return store
@@ -0,0 +1,314 @@
+#IMPORT IN ACTUAL
+
+import argparse
+import csv
+import io
+import json
+import os
+import sys
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+from threading import Lock
+from typing import Dict, Any
+
+# Add project root to Python path, for running this file directly
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..'))
+if project_root not in sys.path:
+    sys.path.append(project_root)
+
+from core.ModelInitializers.DataIngestion import LoadDocument
+from core.ModelInitializers.EmbeddingCache import GetEmbeddingStore
+from core.ModelInitializers.Embedding import DownloadGeminiEmbedding
+from core.ModelInitializers.IngestionCache import HashFileBytes
+from core.ModelInitializers.Model import LoadModel
+from core.Pipeline.NearDuplicates import GetNearDuplicateIndex
+from core.Pipeline.ScoreStore import GetScoreStore
+from core.ScoreCalculators.ScoringEngine import ScoreResume, ReusableScores
+from interfaces.utils.ParameterManager import ParameterManager
+
+PASSING_SCORE = 70.0
+MAX_RESUME_WORKERS = 4
+# Each resume already fans its parameters out over a thread pool, keep it small
+MAX_PARAMETER_WORKERS = 4
+
+
+def IterResumeFiles(directory):
+    """Yield PDF paths under directory lazily, in a stable order."""
+    for root, dirs, files in os.walk(directory):
+        dirs.sort()
+        for name in sorted(files):
+            if name.lower().endswith(".pdf"):
+                yield os.path.join(root, name)
+
+
+def ScoreResumeFile(path, model, parameter_details: Dict[str, Dict], file_bytes=None,
+                    passing_score=PASSING_SCORE, max_workers=MAX_PARAMETER_WORKERS,
+                    duplicate_index=None, score_store=None) -> Dict[str, Any]:
+    """
+    Run one resume from disk through ingestion, embedding and scoring.
+
+    With a duplicate_index, an upload that is a near-duplicate of an earlier
+    resume reuses that resume's LLM scores wherever its changed lines cannot
+    affect them; the resume is only embedded if something is left for the LLM.
+    Raw scores are kept in score_store, if given, for re-weighting later;
+    parameters that failed are not stored, and a retry of the same file only
+    evaluates those.
+    """
+    if file_bytes is None:
+        with open(path, "rb") as file:
+            file_bytes = file.read()
+    file_hash = HashFileBytes(file_bytes)
+
+    upload = io.BytesIO(file_bytes)
+    upload.name = os.path.basename(path)
+    documents = LoadDocument(upload)
+    if not documents:
+        raise ValueError("Could not process the resume")
+
+    resume_text = " ".join([doc.text for doc in documents])
+    match = None
+    reused_scores = {}
+    if score_store is not None:
+        # A retry of a resume that failed part-way keeps the scores it already got
+        try:
+            reused_scores = {name: details["raw_score"] for name, details in
+                             score_store.get_scores(file_hash, parameter_details).items()
+                             if details["source"] in ("llm", "reused")}
+        except Exception as e:
+            print(f"Error reading stored scores: {e}")
+    if duplicate_index is not None and len(reused_scores) < len(parameter_details):
+        try:
+            match = duplicate_index.find(resume_text, exclude=file_hash)
+        except Exception as e:
+            print(f"Error looking up near-duplicate resumes: {e}")
+        if match:
+            reused_scores = {**ReusableScores(parameter_details, match["scores"], match["changed_lines"]), **reused_scores}
+
+    result = ScoreResume(parameter_details, lambda: DownloadGeminiEmbedding(model, documents), resume_text,
+                         max_workers=max_workers, reused_scores=reused_scores)
+
+    # Only complete results are fingerprinted, so a failed parameter is never reused as a score
+    if duplicate_index is not None and result["scores"] and not result["errors"]:
+        try:
+            duplicate_index.add(file_hash, resume_text, {
+                name: {key: details[key] for key in ("raw_score", "source", "definition")}
+                for name, details in result["scores"].items()
+            })
+        except Exception as e:
+            print(f"Error recording resume fingerprint: {e}")
+    if score_store is not None and result["scores"]:
+        try:
+            score_store.put_scores(file_hash, result["scores"], label=path, text=resume_text)
+        except Exception as e:
+            print(f"Error storing scores: {e}")
+
+    final_score = result["final_score"]
+    record = {
+        "file": path,
+        "file_hash": file_hash,
+        "final_score": final_score,
+        "status": None if final_score is None else ("PASS" if final_score >= passing_score else "FAIL"),
+        "scores": {name: details["raw_score"] for name, details in result["scores"].items()},
+        "errors": result["errors"]
+    }
+    if match:
+        record["near_duplicate_of"] = match["resume_hash"]
+        record["similarity"] = round(match["similarity"], 3)
+        record["reused_scores"] = sorted(name for name, details in result["scores"].items() if details["source"] == "reused")
+    return record
+
+
+class Checkpoint:
+    """Append-only list of content hashes of resumes whose results are already written."""
+
+    def __init__(self, path):
+        self.path = path
+        self.completed = set()
+        if os.path.exists(path):
+            with open(path, "r") as file:
+                self.completed = {line.strip() for line in file if line.strip()}
+        self.file = open(path, "a")
+
+    def is_done(self, file_hash):
+        return file_hash in self.completed
+
+    def mark_done(self, file_hash):
+        self.completed.add(file_hash)
+        self.file.write(file_hash + "\n")
+        self.file.flush()
+        os.fsync(self.file.fileno())
+
+    def close(self):
+        self.file.close()
+
+
+class JsonlResultWriter:
+    def __init__(self, path):
+        self.file = open(path, "a")
+
+    def write(self, record):
+        self.file.write(json.dumps(record) + "\n")
+        self.file.flush()
+        os.fsync(self.file.fileno())
+
+    def close(self):
+        self.file.close()
+
+
+class CsvResultWriter:
+    def __init__(self, path, parameter_names):
+        write_header = not os.path.exists(path) or os.path.getsize(path) == 0
+        self.parameter_names = list(parameter_names)
+        self.file = open(path, "a", newline="")
+        self.writer = csv.writer(self.file)
+        if write_header:
+            self.writer.writerow(["file", "file_hash", "final_score", "status"] + self.parameter_names + ["errors"])
+
+    def write(self, record):
+        self.writer.writerow(
+            [record["file"], record["file_hash"], record["final_score"], record["status"]]
+            + [record["scores"].get(name) for name in self.parameter_names]
+            + [json.dumps(record["errors"]) if record["errors"] else ""]
+        )
+        self.file.flush()
+        os.fsync(self.file.fileno())
+
+    def close(self):
+        self.file.close()
+
+
+RESULT_FORMATS = ("jsonl", "csv")
+
+
+def OpenResultWriter(output_format, path, parameter_names):
+    """Result writer for output_format; CSV has one column per parameter."""
+    if output_format == "csv":
+        return CsvResultWriter(path, parameter_names)
+    return JsonlResultWriter(path)
+
+
+def RunBulkScreening(directory, output_path, output_format="jsonl", checkpoint_path=None,
+                     max_workers=MAX_RESUME_WORKERS, passing_score=PASSING_SCORE,
+                     parameter_details=None, model=None):
+    """
+    Score every PDF under directory and append one result per resume to output_path.
+
+    Finished resumes are recorded by content hash in a checkpoint file next to
+    the output, so re-running after a crash skips them. Failed resumes are
+    reported and left out of the checkpoint so the next run retries them.
+    Resumes that are edited copies of earlier ones (NEAR_DUPLICATE_DB) reuse
+    their unaffected scores. Returns a summary dict with scored / skipped /
+    failed / near_duplicates / reused_scores counts and, when the embedding
+    cache is enabled, its counters for this process.
+    """
+    if output_format not in RESULT_FORMATS:
+        raise ValueError(f"Unknown output format: {output_format}")
+
+    parameter_details = parameter_details if parameter_details is not None else ParameterManager().get_parameter_details()
+    if not parameter_details:
+        raise ValueError("No parameters configured. Please set up parameters in the Admin Section first.")
+    model = model or LoadModel()
+
+    checkpoint = Checkpoint(checkpoint_path or output_path + ".checkpoint")
+    writer = OpenResultWriter(output_format, output_path, parameter_details.keys())
+    write_lock = Lock()
+    summary = {"scored": 0, "skipped": 0, "failed": 0, "near_duplicates": 0, "reused_scores": 0}
+    try:
+        duplicate_index = GetNearDuplicateIndex()
+    except Exception as e:
+        print(f"Error opening near-duplicate index: {e}")
+        duplicate_index = None
+    try:
+        score_store = GetScoreStore()
+    except Exception as e:
+        print(f"Error opening score store: {e}")
+        score_store = None
+
+    def process(path, file_bytes, file_hash):
+        record = ScoreResumeFile(path, model, parameter_details, file_bytes=file_bytes, passing_score=passing_score,
+                                 duplicate_index=duplicate_index, score_store=score_store)
+        if record["errors"]:
+            # Not written or checkpointed, so the next run retries the failed parameters
+            raise RuntimeError(f"{len(record['errors'])} parameters failed: "
+                               + "; ".join(f"{name}: {error}" for name, error in record["errors"].items()))
+        with write_lock:
+            writer.write(record)
+            checkpoint.mark_done(file_hash)
+        return record
+
+    def collect(done, pending):
+        for future in done:
+            path = pending.pop(future)
+            try:
+                record = future.result()
+                summary["scored"] += 1
+                if "near_duplicate_of" in record:
+                    summary["near_duplicates"] += 1
+                    summary["reused_scores"] += len(record["reused_scores"])
+                print(f"Scored {path}: {record['final_score']}")
+            except Exception as e:
+                summary["failed"] += 1
+                print(f"Error scoring {path}: {e}")
+
+    pending = {}
+    in_flight = set()
+    try:
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            for path in IterResumeFiles(directory):
+                with open(path, "rb") as file:
+                    file_bytes = file.read()
+                file_hash = HashFileBytes(file_bytes)
+                if checkpoint.is_done(file_hash) or file_hash in in_flight:
+                    summary["skipped"] += 1
+                    continue
+
+                # Keep only a bounded window of resumes in memory
+                if len(pending) >= max_workers * 2:
+                    done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                    collect(done, pending)
+
+                in_flight.add(file_hash)
+                pending[executor.submit(process, path, file_bytes, file_hash)] = path
+
+            while pending:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                collect(done, pending)
+    finally:
+        writer.close()
+        checkpoint.close()
+
+    embedding_store = GetEmbeddingStore()
+    if embedding_store is not None:
+        summary["embedding_cache"] = embedding_store.stats()
+    return summary
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Score a folder of resumes without the Streamlit interface.")
+    parser.add_argument("directory", help="Folder containing PDF resumes (searched recursively)")
+    parser.add_argument("--output", required=True, help="Results file, appended to across runs")
+    parser.add_argument("--format", choices=RESULT_FORMATS, default="jsonl")
+    parser.add_argument("--checkpoint", help="Checkpoint file (default: <output>.checkpoint)")
+    parser.add_argument("--workers", type=int, default=MAX_RESUME_WORKERS, help="Resumes scored in parallel")
+    parser.add_argument("--passing-score", type=float, default=PASSING_SCORE)
+    args = parser.parse_args(argv)
+
+    summary = RunBulkScreening(
+        args.directory,
+        args.output,
+        output_format=args.format,
+        checkpoint_path=args.checkpoint,
+        max_workers=args.workers,
+        passing_score=args.passing_score
+    )
+    print(f"Scored: {summary['scored']}, skipped: {summary['skipped']}, failed: {summary['failed']}")
+    if summary["near_duplicates"]:
+        print(f"Near-duplicates: {summary['near_duplicates']} resumes reused {summary['reused_scores']} earlier scores")
+    if "embedding_cache" in summary:
+        cache = summary["embedding_cache"]
+        print(f"Embedding cache: {cache['saved_calls']} of {cache['requested']} embeddings served without a call "
+              f"({cache['hit_rate']:.0%}; {cache['hits']} cached, {cache['batch_duplicates']} duplicates in batch)")
+    return 1 if summary["failed"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,146 @@
+#IMPORT IN ACTUAL
+
+from typing import Any, Dict, Iterable, List, Optional, Sequence
+import numpy as np
+from core.Pipeline.ScoreStore import WeightedTotals
+from interfaces.utils.ParameterManager import AsScoringPlan
+
+# Boolean parameters score 100 or 0; anything at or above this counts as "yes"
+BOOLEAN_PASS_SCORE = 50.0
+
+
+class CandidateRanking:
+    """
+    A pool of candidates as a candidates x parameters float64 matrix of raw
+    scores (NaN where a candidate has no score), ranked by weighted total.
+    Parameters and weights come from a ScoringPlan (a {param_name: details}
+    mapping is compiled into one).
+
+    Totals, percentiles and filters are whole-array NumPy operations and
+    top-K uses a partial selection, so a pool of 100k candidates ranks in
+    milliseconds. Build one from the score store with from_score_store.
+    """
+
+    def __init__(self, candidate_ids: Sequence[str], parameter_details, matrix: np.ndarray):
+        self.plan = AsScoringPlan(parameter_details)
+        self.candidate_ids = list(candidate_ids)
+        self.names = list(self.plan.names)
+        self.details = self.plan.details
+        self.matrix = np.asarray(matrix, dtype=np.float64)
+        if self.matrix.shape != (len(self.candidate_ids), len(self.names)):
+            raise ValueError(f"Score matrix shape {self.matrix.shape} does not match "
+                             f"{len(self.candidate_ids)} candidates x {len(self.names)} parameters")
+        self.columns = {name: column for column, name in enumerate(self.names)}
+        self.weights = self.plan.weights
+        self._totals = None
+
+    @classmethod
+    def from_score_store(cls, score_store, parameter_details, model_id: Optional[str] = None):
+        """Every candidate in a ScoreStore, scored under the current parameter definitions."""
+        plan = AsScoringPlan(parameter_details)
+        resume_hashes, _, matrix = score_store.score_matrix(plan.details, model_id)
+        return cls(resume_hashes, plan, matrix)
+
+    def __len__(self):
+        return len(self.candidate_ids)
+
+    def _weight_vector(self, weights) -> np.ndarray:
+        if weights is None:
+            return self.weights
+        if isinstance(weights, dict):
+            return np.array([float(weights.get(name, self.weights[i])) for i, name in enumerate(self.names)])
+        return np.asarray(weights, dtype=np.float64)
+
+    def totals(self, weights=None) -> np.ndarray:
+        """
+        Weighted total per candidate (NaN if nothing was scored). weights may
+        be {param_name: weight}, a sequence in parameter order, or None for the
+        configured weights, whose totals are cached.
+        """
+        if weights is not None:
+            return WeightedTotals(self.matrix, self._weight_vector(weights))
+        if self._totals is None:
+            self._totals = WeightedTotals(self.matrix, self.weights)
+        return self._totals
+
+    def filter_mask(self, require: Iterable[str] = (), min_scores: Optional[Dict[str, float]] = None) -> np.ndarray:
+        """
+        Candidates passing the hard filters: every parameter in require
+        answered "yes" (boolean, BOOLEAN_PASS_SCORE or more) and every
+        min_scores entry met. A missing score fails the filter.
+        """
+        mask = np.ones(len(self.candidate_ids), dtype=bool)
+        thresholds = dict(min_scores or {})
+        for name in require:
+            thresholds[name] = max(thresholds.get(name, BOOLEAN_PASS_SCORE), BOOLEAN_PASS_SCORE)
+        for name, threshold in thresholds.items():
+            if name not in self.columns:
+                raise KeyError(f"Unknown parameter: {name}")
+            # NaN compares False, so unscored candidates are filtered out
+            mask &= self.matrix[:, self.columns[name]] >= threshold
+        return mask
+
+    def top_k(self, k: int, weights=None, require: Iterable[str] = (),
+              min_scores: Optional[Dict[str, float]] = None) -> List[Dict[str, Any]]:
+        """
+        The k best candidates passing the filters, best first, as
+        {"candidate", "rank", "total", "percentile"} (percentile of the total
+        within the whole pool). Ties keep pool order.
+        """
+        totals = self.totals(weights)
+        eligible = self.filter_mask(require, min_scores) & ~np.isnan(totals)
+        indices = np.flatnonzero(eligible)
+        if k <= 0 or indices.size == 0:
+            return []
+        if indices.size > k:
+            # O(n) partial selection of the k-th largest total, then sort only the k best;
+            # candidates tied with it are taken in pool order, not argpartition's order
+            scores = totals[indices]
+            kth = -np.partition(-scores, k - 1)[k - 1]
+            above = indices[scores > kth]
+            indices = np.concatenate((above, indices[scores == kth][:k - above.size]))
+        indices = indices[np.lexsort((indices, -totals[indices]))]
+
+        percentiles = self.total_percentiles(totals[indices], weights)
+        return [
+            {"candidate": self.candidate_ids[index], "rank": rank, "total": float(totals[index]),
+             "percentile": float(percentile)}
+            for rank, (index, percentile) in enumerate(zip(indices, percentiles), 1)
+        ]
+
+    def total_percentiles(self, scores, weights=None) -> np.ndarray:
+        """Percentage of the scored pool whose weighted total is at or below each of scores."""
+        totals = self.totals(weights)
+        pool = np.sort(totals[~np.isnan(totals)])
+        if pool.size == 0:
+            return np.full(np.shape(scores), np.nan)
+        return np.searchsorted(pool, scores, side="right") * 100.0 / pool.size
+
+    def percentile_ranks(self) -> np.ndarray:
+        """
+        Candidates x parameters matrix of per-parameter percentile ranks:
+        the percentage of candidates scored on that parameter whose raw score
+        is at or below the candidate's. NaN where the candidate has no score.
+        """
+        ranks = np.full(self.matrix.shape[::-1], np.nan)
+        # Work on contiguous parameter rows, and sort only the scored values (NaN slows argsort down)
+        for column, values in enumerate(np.ascontiguousarray(self.matrix.T)):
+            scored = np.flatnonzero(~np.isnan(values))
+            if scored.size == 0:
+                continue
+            order = np.argsort(values[scored])
+            pool = values[scored[order]]
+            # Tied scores share the position of the last of them
+            run_ends = np.flatnonzero(np.append(pool[1:] != pool[:-1], True))
+            at_or_below = np.repeat(run_ends + 1, np.diff(run_ends, prepend=-1))
+            ranks[column, scored[order]] = at_or_below * 100.0 / scored.size
+        return ranks.T
+
+    def parameter_percentiles(self, q: Sequence[float] = (25, 50, 75, 90)) -> Dict[str, Dict[float, float]]:
+        """{param_name: {q: score}}: the pool's raw-score distribution per parameter, ignoring missing scores."""
+        result = {}
+        for column, name in enumerate(self.names):
+            values = self.matrix[:, column]
+            values = values[~np.isnan(values)]
+            result[name] = {p: float(v) for p, v in zip(q, np.percentile(values, q))} if values.size else {}
+        return result
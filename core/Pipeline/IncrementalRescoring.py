@@ -0,0 +1,143 @@
+#IMPORT IN ACTUAL
+
+import argparse
+import sys
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from threading import Lock
+from typing import Dict, Any, Optional
+
+from llama_index.core import Document
+from core.ModelInitializers.Embedding import DownloadGeminiEmbedding
+from core.ModelInitializers.IngestionCache import ingestion_cache
+from core.ModelInitializers.Model import LoadModel
+from core.Pipeline.ScoreStore import GetScoreStore
+from core.ScoreCalculators.ScoringEngine import ScoreResume, CombineScores
+from interfaces.utils.ParameterManager import ParameterManager
+
+MAX_RESUME_WORKERS = 4
+MAX_PARAMETER_WORKERS = 4
+
+
+def _stored_resume(score_store, resume_hash):
+    """
+    (resume_text, documents) of a stored resume, or (None, None) if its
+    scores were stored without text (put_scores(text=None)).
+    """
+    text = score_store.get_text(resume_hash)
+    if text is None:
+        return None, None
+    # The cached upload keeps its page metadata for the index; the stored text is enough without it
+    return text, ingestion_cache.get_documents(resume_hash) or [Document(text=text)]
+
+
+def RescoreStoredResume(resume_hash, missing, parameter_details: Dict[str, Dict], score_store, load_model,
+                        max_workers=MAX_PARAMETER_WORKERS) -> Optional[Dict[str, Any]]:
+    """
+    Evaluate only the missing parameters of one stored resume and merge them
+    with its stored scores. Returns the merged ScoreResume-style result with
+    "evaluated" (parameters scored now), or None if no text was stored with its scores.
+    """
+    resume_text, documents = _stored_resume(score_store, resume_hash)
+    if resume_text is None:
+        return None
+
+    missing_details = {name: parameter_details[name] for name in missing}
+    result = ScoreResume(missing_details, lambda: DownloadGeminiEmbedding(load_model(), documents), resume_text,
+                         max_workers=max_workers)
+    if result["scores"]:
+        score_store.put_scores(resume_hash, result["scores"])
+
+    stored = score_store.get_scores(resume_hash, parameter_details)
+    combined = CombineScores(
+        parameter_details,
+        {name: details["raw_score"] for name, details in stored.items()},
+        {name: details["source"] for name, details in stored.items()}
+    )
+    combined["errors"] = result["errors"]
+    combined["evaluated"] = sorted(result["scores"])
+    return combined
+
+
+def RescoreStoredResumes(parameter_details=None, score_store=None, model=None, max_workers=MAX_RESUME_WORKERS,
+                         parameter_workers=MAX_PARAMETER_WORKERS, dry_run=False) -> Dict[str, Any]:
+    """
+    Bring every resume in the score store up to date with the current
+    parameters. Stored scores are keyed by parameter definition hash, so a
+    parameter that was added or edited has no score yet and is the only one
+    evaluated; unchanged and reweighted parameters keep their stored scores.
+    Adding one parameter to twenty costs one evaluation per resume.
+
+    Returns a summary with resumes / up_to_date / rescored / unavailable
+    (scores stored without their text) / failed counts, the number of
+    parameter evaluations, and final_scores {resume_hash: score} of the
+    rescored resumes. With dry_run only the evaluations needed are counted.
+    """
+    parameter_details = parameter_details if parameter_details is not None else ParameterManager().get_parameter_details()
+    score_store = score_store or GetScoreStore()
+    if score_store is None:
+        raise ValueError("The score store is disabled (SCORE_STORE_DB is empty)")
+
+    missing = score_store.missing_parameters(parameter_details)
+    resumes = score_store.count()
+    summary = {
+        "resumes": resumes,
+        "up_to_date": resumes - len(missing),
+        "rescored": 0, "unavailable": 0, "failed": 0,
+        "evaluations": sum(len(names) for names in missing.values()),
+        "final_scores": {}
+    }
+    if dry_run or not missing:
+        return summary
+
+    model_lock = Lock()
+    loaded = [model]
+
+    def load_model():
+        # Only loaded if some resume needs the query engine
+        with model_lock:
+            if loaded[0] is None:
+                loaded[0] = LoadModel()
+            return loaded[0]
+
+    evaluations = 0
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = {
+            executor.submit(RescoreStoredResume, resume_hash, names, parameter_details, score_store, load_model,
+                            parameter_workers): resume_hash
+            for resume_hash, names in missing.items()
+        }
+        for future in as_completed(futures):
+            resume_hash = futures[future]
+            try:
+                result = future.result()
+            except Exception as e:
+                summary["failed"] += 1
+                print(f"Error rescoring {resume_hash}: {e}")
+                continue
+            if result is None:
+                summary["unavailable"] += 1
+                continue
+            summary["rescored"] += 1
+            evaluations += len(result["evaluated"]) + len(result["errors"])
+            summary["final_scores"][resume_hash] = result["final_score"]
+    summary["evaluations"] = evaluations
+    return summary
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Score stored resumes on the parameters added or edited since they were scored.")
+    parser.add_argument("--workers", type=int, default=MAX_RESUME_WORKERS, help="Resumes rescored in parallel")
+    parser.add_argument("--dry-run", action="store_true", help="Only count the evaluations needed")
+    args = parser.parse_args(argv)
+
+    summary = RescoreStoredResumes(max_workers=args.workers, dry_run=args.dry_run)
+    print(f"Stored resumes: {summary['resumes']}, up to date: {summary['up_to_date']}, "
+          f"parameter evaluations {'needed' if args.dry_run else 'made'}: {summary['evaluations']}")
+    if not args.dry_run:
+        print(f"Rescored: {summary['rescored']}, unavailable: {summary['unavailable']}, failed: {summary['failed']}")
+    return 1 if summary["failed"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
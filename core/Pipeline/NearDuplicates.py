@@ -0,0 +1,246 @@
+#IMPORT IN ACTUAL
+
+import hashlib
+import json
+import os
+import re
+import threading
+import time
+from threading import Lock
+from typing import Any, Dict, List, Optional
+import numpy as np
+from dotenv import load_dotenv
+
+load_dotenv()
+
+DEFAULT_NEAR_DUPLICATE_DB = os.path.join(os.path.dirname(__file__), '../cache/near_duplicates.sqlite3')
+# Estimated Jaccard similarity of word 5-gram shingles above which an upload
+# counts as an edited copy of an earlier resume. One added bullet or a
+# changed date in a one-page resume stays well above 0.9.
+NEAR_DUPLICATE_THRESHOLD = 0.9
+
+SHINGLE_SIZE = 5
+NUM_PERMUTATIONS = 128
+# 16 bands of 8 rows: resumes at 0.9 similarity share a band with probability
+# > 0.99, unrelated resumes (< 0.3) almost never do
+LSH_BANDS = 16
+LSH_ROWS = NUM_PERMUTATIONS // LSH_BANDS
+
+# Fixed seed so signatures stay comparable across processes and runs
+_random = np.random.default_rng(20240117)
+_MULTIPLIERS = _random.integers(1, 2 ** 63, NUM_PERMUTATIONS, dtype=np.uint64) | np.uint64(1)
+_INCREMENTS = _random.integers(0, 2 ** 63, NUM_PERMUTATIONS, dtype=np.uint64)
+
+
+def ResumeTokens(text: str) -> List[str]:
+    return re.findall(r"[a-z0-9][a-z0-9+#.]*", text.lower())
+
+
+def _hash64(value: str) -> int:
+    return int.from_bytes(hashlib.blake2b(value.encode("utf-8"), digest_size=8).digest(), "little")
+
+
+def ShingleHashes(text: str, size: int = SHINGLE_SIZE) -> np.ndarray:
+    """64-bit hashes of the distinct word size-grams of text (the whole text if it is shorter)."""
+    tokens = ResumeTokens(text)
+    if len(tokens) < size:
+        shingles = {" ".join(tokens)} if tokens else set()
+    else:
+        shingles = {" ".join(tokens[i:i + size]) for i in range(len(tokens) - size + 1)}
+    return np.fromiter((_hash64(shingle) for shingle in shingles), dtype=np.uint64, count=len(shingles))
+
+
+def MinHashSignature(text: str) -> np.ndarray:
+    """
+    NUM_PERMUTATIONS 32-bit MinHash values, one multiply-shift hash per
+    permutation applied to all shingles at once.
+    """
+    hashes = ShingleHashes(text)
+    if hashes.size == 0:
+        return np.full(NUM_PERMUTATIONS, np.iinfo(np.uint32).max, dtype=np.uint32)
+    # uint64 arithmetic wraps, which is the "mod 2^64" of multiply-shift hashing
+    permuted = (_MULTIPLIERS[:, None] * hashes[None, :] + _INCREMENTS[:, None]) >> np.uint64(32)
+    return permuted.min(axis=1).astype(np.uint32)
+
+
+def EstimateSimilarity(signature_a: np.ndarray, signature_b: np.ndarray) -> float:
+    """Estimated Jaccard similarity: the share of permutations with the same minimum."""
+    return float(np.count_nonzero(signature_a == signature_b)) / len(signature_a)
+
+
+def _band_buckets(signature: np.ndarray) -> List[int]:
+    rows = signature.reshape(LSH_BANDS, LSH_ROWS)
+    return [int.from_bytes(hashlib.blake2b(band.tobytes(), digest_size=8).digest(), "little", signed=True)
+            for band in rows]
+
+
+def NormalizeLine(line: str) -> str:
+    return " ".join(ResumeTokens(line))
+
+
+def NormalizedLines(text: str) -> List[str]:
+    """Distinct normalized non-empty lines of text, in order."""
+    return list(dict.fromkeys(line for line in map(NormalizeLine, text.splitlines()) if line))
+
+
+def ChangedLines(text: str, previous_lines) -> List[str]:
+    """
+    Lines of text that were not in the earlier resume (added, or the new side
+    of an edit), followed by the earlier resume's normalized lines that are
+    gone (removed, or the old side of an edit). Both can change a score:
+    "5 years Python" edited to "5 years Java" touches Python and Java.
+    """
+    previous_lines = list(previous_lines)
+    previous_set = set(previous_lines)
+    current_lines = set()
+    changed = []
+    for line in text.splitlines():
+        normalized = NormalizeLine(line)
+        if not normalized:
+            continue
+        current_lines.add(normalized)
+        if normalized not in previous_set:
+            changed.append(line.strip())
+    changed += [line for line in previous_lines if line not in current_lines]
+    return changed
+
+
+class NearDuplicateIndex:
+    """
+    SQLite index of MinHash signatures of scored resumes, with LSH band
+    buckets so a lookup only compares against resumes that share a band.
+
+    Each resume is stored with its normalized lines and the per-parameter
+    scores it received, so a near-duplicate upload can reuse them and
+    re-score only what its changed lines could affect.
+    """
+
+    def __init__(self, path, threshold=NEAR_DUPLICATE_THRESHOLD):
+        self.path = path
+        self.threshold = threshold
+        self.local = threading.local()
+        self.lock = Lock()
+        self.counters = {"lookups": 0, "matches": 0}
+
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        conn = self._connect()
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS resumes ("
+            "resume_hash TEXT PRIMARY KEY, signature BLOB NOT NULL, lines TEXT NOT NULL, "
+            "scores TEXT NOT NULL, created REAL NOT NULL)"
+        )
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS lsh_buckets ("
+            "band INTEGER NOT NULL, bucket INTEGER NOT NULL, resume_hash TEXT NOT NULL, "
+            "PRIMARY KEY (band, bucket, resume_hash))"
+        )
+
+    def _connect(self):
+        conn = getattr(self.local, "conn", None)
+        if conn is None:
+            import sqlite3
+            conn = sqlite3.connect(self.path, timeout=30, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self.local.conn = conn
+        return conn
+
+    def add(self, resume_hash: str, text: str, scores: Dict[str, Any]):
+        """
+        Record a scored resume. scores is {param_name: {"raw_score", "source",
+        "definition"}}; an existing entry for the same resume is replaced.
+        """
+        signature = MinHashSignature(text)
+        conn = self._connect()
+        with self.lock:
+            conn.execute("BEGIN")
+            try:
+                conn.execute(
+                    "INSERT OR REPLACE INTO resumes (resume_hash, signature, lines, scores, created) "
+                    "VALUES (?, ?, ?, ?, ?)",
+                    (resume_hash, signature.tobytes(), json.dumps(NormalizedLines(text)), json.dumps(scores), time.time())
+                )
+                conn.executemany(
+                    "INSERT OR IGNORE INTO lsh_buckets (band, bucket, resume_hash) VALUES (?, ?, ?)",
+                    [(band, bucket, resume_hash) for band, bucket in enumerate(_band_buckets(signature))]
+                )
+                conn.execute("COMMIT")
+            except Exception:
+                conn.execute("ROLLBACK")
+                raise
+
+    def find(self, text: str, exclude: Optional[str] = None, threshold: Optional[float] = None) -> Optional[Dict[str, Any]]:
+        """
+        Most similar earlier resume at or above threshold, as
+        {"resume_hash", "similarity", "scores", "changed_lines"}, or None.
+        exclude skips one resume hash (usually the upload itself).
+        """
+        threshold = self.threshold if threshold is None else threshold
+        signature = MinHashSignature(text)
+        conn = self._connect()
+        buckets = _band_buckets(signature)
+        clauses = " OR ".join("(band = ? AND bucket = ?)" for _ in buckets)
+        candidates = {row[0] for row in conn.execute(
+            f"SELECT DISTINCT resume_hash FROM lsh_buckets WHERE {clauses}",
+            [value for pair in enumerate(buckets) for value in pair]
+        )}
+        candidates.discard(exclude)
+
+        best = None
+        for resume_hash in candidates:
+            row = conn.execute(
+                "SELECT signature, lines, scores FROM resumes WHERE resume_hash = ?", (resume_hash,)
+            ).fetchone()
+            if row is None:
+                continue
+            similarity = EstimateSimilarity(signature, np.frombuffer(row[0], dtype=np.uint32))
+            if similarity >= threshold and (best is None or similarity > best[0]):
+                best = (similarity, resume_hash, row[1], row[2])
+
+        self.count("lookups", 1)
+        if best is None:
+            return None
+        self.count("matches", 1)
+        similarity, resume_hash, lines, scores = best
+        return {
+            "resume_hash": resume_hash,
+            "similarity": similarity,
+            "scores": json.loads(scores),
+            "changed_lines": ChangedLines(text, json.loads(lines)),
+        }
+
+    def count(self, counter, amount):
+        with self.lock:
+            self.counters[counter] += amount
+
+    def stats(self) -> Dict[str, Any]:
+        with self.lock:
+            stats = dict(self.counters)
+        stats["resumes"] = self._connect().execute("SELECT COUNT(*) FROM resumes").fetchone()[0]
+        return stats
+
+    def clear(self):
+        conn = self._connect()
+        conn.execute("DELETE FROM lsh_buckets")
+        conn.execute("DELETE FROM resumes")
+
+
+_index = None
+_index_lock = Lock()
+
+
+def GetNearDuplicateIndex():
+    """
+    Process-wide NearDuplicateIndex at NEAR_DUPLICATE_DB (default
+    core/cache/near_duplicates.sqlite3), or None when NEAR_DUPLICATE_DB is set
+    empty. NEAR_DUPLICATE_THRESHOLD overrides the similarity threshold.
+    """
+    global _index
+    path = os.getenv("NEAR_DUPLICATE_DB", DEFAULT_NEAR_DUPLICATE_DB)
+    if not path:
+        return None
+    with _index_lock:
+        if _index is None or _index.path != path:
+            threshold = os.getenv("NEAR_DUPLICATE_THRESHOLD")
+            _index = NearDuplicateIndex(path, threshold=float(threshold) if threshold else NEAR_DUPLICATE_THRESHOLD)
+        return _index
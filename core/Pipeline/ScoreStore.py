@@ -0,0 +1,253 @@
+#IMPORT IN ACTUAL
+
+import math
+import os
+import threading
+import time
+import zlib
+from threading import Lock
+from typing import Any, Dict, List, Optional
+import numpy as np
+from dotenv import load_dotenv
+from interfaces.utils.ParameterManager import AsScoringPlan, ParameterDefinitionHash
+
+load_dotenv()
+
+DEFAULT_SCORE_STORE_DB = os.path.join(os.path.dirname(__file__), '../cache/scores.sqlite3')
+
+
+def ScoringModelId() -> str:
+    """
+    Identifies the models behind stored raw scores. Set SCORING_MODEL_ID
+    after changing a model so old scores are not mixed with new ones.
+    """
+    return os.getenv("SCORING_MODEL_ID") or f"gemini-1.5-pro;embedding={os.getenv('EMBEDDING_BACKEND', 'gemini')}"
+
+
+def WeightedTotals(matrix: np.ndarray, weights: np.ndarray) -> np.ndarray:
+    """
+    Final score per row of a candidates x parameters raw-score matrix, the way
+    ScoreResume combines them: weighted average over the parameters with a
+    positive weight that have a score (NaN marks a missing score). Rows with
+    nothing to average get NaN.
+    """
+    weights = np.where(weights > 0, weights, 0.0)
+    scored = ~np.isnan(matrix)
+    numerator = np.where(scored, matrix, 0.0) @ weights
+    denominator = scored @ weights
+    with np.errstate(invalid="ignore", divide="ignore"):
+        return np.where(denominator > 0, numerator / denominator, np.nan)
+
+
+class ScoreStore:
+    """
+    SQLite store of raw per-parameter scores keyed by (resume hash,
+    parameter definition hash, model id).
+
+    Weights are not stored: a raw score stays valid whatever weight its
+    parameter is given, so any weight vector can be applied to the stored
+    scores without calling the LLM (see weighted_totals). The matrix for a
+    parameter set is built with one query and kept in memory until the next
+    write.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.local = threading.local()
+        self.lock = Lock()
+        self.generation = 0
+        self.matrices = {}
+
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        conn = self._connect()
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS scores ("
+            "resume_hash TEXT NOT NULL, definition TEXT NOT NULL, model_id TEXT NOT NULL, "
+            "raw_score REAL NOT NULL, source TEXT, scored_at REAL NOT NULL, "
+            "PRIMARY KEY (resume_hash, definition, model_id))"
+        )
+        conn.execute("CREATE INDEX IF NOT EXISTS scores_definition ON scores (model_id, definition)")
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS resumes (resume_hash TEXT PRIMARY KEY, label TEXT, updated REAL NOT NULL, text BLOB)"
+        )
+
+    def _connect(self):
+        conn = getattr(self.local, "conn", None)
+        if conn is None:
+            import sqlite3
+            conn = sqlite3.connect(self.path, timeout=30, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self.local.conn = conn
+        return conn
+
+    def _changed(self):
+        with self.lock:
+            self.generation += 1
+            self.matrices.clear()
+
+    def put_scores(self, resume_hash: str, scores: Dict[str, Dict[str, Any]], model_id: Optional[str] = None,
+                   label: Optional[str] = None, text: Optional[str] = None):
+        """
+        Store ScoreResume's scores ({param_name: {"raw_score", "definition", "source", ...}}) for a resume,
+        alongside its text so parameters added later can be scored without the original file.
+        """
+        model_id = model_id or ScoringModelId()
+        now = time.time()
+        compressed = zlib.compress(text.encode("utf-8")) if text else None
+        # A parameter without a score (failed, or NaN) gets no row, so it reads back as missing
+        rows = [(resume_hash, details["definition"], model_id, float(details["raw_score"]), details.get("source"), now)
+                for details in scores.values()
+                if details.get("raw_score") is not None and not math.isnan(float(details["raw_score"]))]
+        conn = self._connect()
+        conn.execute("BEGIN")
+        try:
+            conn.executemany(
+                "INSERT OR REPLACE INTO scores (resume_hash, definition, model_id, raw_score, source, scored_at) "
+                "VALUES (?, ?, ?, ?, ?, ?)", rows
+            )
+            conn.execute(
+                "INSERT INTO resumes (resume_hash, label, updated, text) VALUES (?, ?, ?, ?) "
+                "ON CONFLICT(resume_hash) DO UPDATE SET label = COALESCE(excluded.label, label), "
+                "updated = excluded.updated, text = COALESCE(excluded.text, text)",
+                (resume_hash, label, now, compressed)
+            )
+            conn.execute("COMMIT")
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+        self._changed()
+
+    def get_scores(self, resume_hash: str, parameter_details: Dict[str, Dict],
+                   model_id: Optional[str] = None) -> Dict[str, Dict[str, Any]]:
+        """Stored {param_name: {"raw_score", "source", "definition"}} of one resume for the current definitions."""
+        model_id = model_id or ScoringModelId()
+        definitions = {ParameterDefinitionHash(details): name for name, details in parameter_details.items()}
+        rows = self._connect().execute(
+            "SELECT definition, raw_score, source FROM scores WHERE resume_hash = ? AND model_id = ?",
+            (resume_hash, model_id)
+        ).fetchall()
+        return {definitions[definition]: {"raw_score": raw_score, "source": source, "definition": definition}
+                for definition, raw_score, source in rows if definition in definitions}
+
+    def get_text(self, resume_hash: str) -> Optional[str]:
+        """Text of a stored resume, or None if it was stored without one."""
+        row = self._connect().execute("SELECT text FROM resumes WHERE resume_hash = ?", (resume_hash,)).fetchone()
+        return zlib.decompress(row[0]).decode("utf-8") if row and row[0] else None
+
+    def resume_hashes(self) -> List[str]:
+        return [row[0] for row in self._connect().execute("SELECT resume_hash FROM resumes ORDER BY resume_hash")]
+
+    def labels(self) -> Dict[str, str]:
+        return dict(self._connect().execute("SELECT resume_hash, label FROM resumes WHERE label IS NOT NULL"))
+
+    def score_matrix(self, parameter_details: Dict[str, Dict], model_id: Optional[str] = None):
+        """
+        (resume_hashes, param_names, matrix): raw scores of every stored resume
+        for the given parameters (a ScoringPlan or {param_name: details}),
+        float64 with NaN where a resume has no score for a parameter's current
+        definition. Cached until the next write; treat the arrays as read-only.
+        """
+        model_id = model_id or ScoringModelId()
+        names = list(parameter_details)
+        definitions = [ParameterDefinitionHash(parameter_details[name]) for name in names]
+        key = (model_id, tuple(definitions))
+        with self.lock:
+            cached = self.matrices.get(key)
+            generation = self.generation
+        if cached is not None:
+            return cached[0], names, cached[1]
+
+        conn = self._connect()
+        resume_hashes = [row[0] for row in conn.execute("SELECT resume_hash FROM resumes ORDER BY resume_hash")]
+        rows_by_hash = {resume_hash: i for i, resume_hash in enumerate(resume_hashes)}
+        # Two parameters with the same definition share one column of scores
+        columns_by_definition = {}
+        for column, definition in enumerate(definitions):
+            columns_by_definition.setdefault(definition, column)
+
+        matrix = np.full((len(resume_hashes), len(names)), np.nan)
+        placeholders = ",".join("?" * len(columns_by_definition))
+        if resume_hashes and placeholders:
+            rows = conn.execute(
+                f"SELECT resume_hash, definition, raw_score FROM scores WHERE model_id = ? AND definition IN ({placeholders})",
+                (model_id, *columns_by_definition)
+            ).fetchall()
+            if rows:
+                hashes, row_definitions, raw_scores = zip(*rows)
+                row_index = np.fromiter((rows_by_hash.get(resume_hash, -1) for resume_hash in hashes), np.int64, len(rows))
+                column_index = np.fromiter((columns_by_definition[definition] for definition in row_definitions),
+                                           np.int64, len(rows))
+                known = row_index >= 0
+                matrix[row_index[known], column_index[known]] = np.asarray(raw_scores, dtype=np.float64)[known]
+        for column, definition in enumerate(definitions):
+            if columns_by_definition[definition] != column:
+                matrix[:, column] = matrix[:, columns_by_definition[definition]]
+        matrix.setflags(write=False)
+
+        with self.lock:
+            # Only cache if nothing was written while the matrix was being read
+            if generation == self.generation:
+                self.matrices[key] = (resume_hashes, matrix)
+        return resume_hashes, names, matrix
+
+    def weighted_totals(self, parameter_details, weights=None, model_id: Optional[str] = None):
+        """
+        (resume_hashes, totals) for every stored resume under a weight vector:
+        weights may be {param_name: weight} (missing names keep their
+        configured weight) or a sequence in parameter order; by default the
+        configured weights. No LLM calls are made.
+        """
+        plan = AsScoringPlan(parameter_details)
+        resume_hashes, names, matrix = self.score_matrix(plan.details, model_id)
+        configured = plan.weights
+        if weights is None:
+            weight_vector = configured
+        elif isinstance(weights, dict):
+            weight_vector = np.array([float(weights.get(name, configured[i])) for i, name in enumerate(names)])
+        else:
+            weight_vector = np.asarray(weights, dtype=np.float64)
+        return resume_hashes, WeightedTotals(matrix, weight_vector)
+
+    def missing_parameters(self, parameter_details,
+                           model_id: Optional[str] = None) -> Dict[str, List[str]]:
+        """
+        {resume_hash: [param_name, ...]} of the weighted parameters each stored
+        resume has no score for under their current definition: parameters
+        added or edited since it was scored, or whose evaluation failed
+        (ScoreResume reports those in errors and they are never stored).
+        Resumes with nothing missing are left out.
+        """
+        plan = AsScoringPlan(parameter_details)
+        resume_hashes, names, matrix = self.score_matrix(plan.details, model_id)
+        missing = np.isnan(matrix) & (plan.weights > 0)
+        return {resume_hashes[row]: [names[column] for column in np.flatnonzero(missing[row])]
+                for row in np.flatnonzero(missing.any(axis=1))}
+
+    def count(self) -> int:
+        return self._connect().execute("SELECT COUNT(*) FROM resumes").fetchone()[0]
+
+    def clear(self):
+        conn = self._connect()
+        conn.execute("DELETE FROM scores")
+        conn.execute("DELETE FROM resumes")
+        self._changed()
+
+
+_store = None
+_store_lock = Lock()
+
+
+def GetScoreStore():
+    """
+    Process-wide ScoreStore at SCORE_STORE_DB (default core/cache/scores.sqlite3),
+    or None when SCORE_STORE_DB is set empty.
+    """
+    global _store
+    path = os.getenv("SCORE_STORE_DB", DEFAULT_SCORE_STORE_DB)
+    if not path:
+        return None
+    with _store_lock:
+        if _store is None or _store.path != path:
+            _store = ScoreStore(path)
+        return _store
@@ -0,0 +1,301 @@
+#IMPORT IN ACTUAL
+
+# Local extractors that answer common quantitative and boolean parameters
+# straight from the resume text. Every extractor returns
+# {"value", "confidence", "evidence"} or None when it does not apply; the
+# scoring engine only trusts results above its confidence threshold and
+# sends everything else to the LLM.
+
+import re
+from datetime import date
+from typing import Any, Dict, Optional
+from core.ModelInitializers.ResumeSections import SplitSections
+
+MONTHS = {
+    "jan": 1, "feb": 2, "mar": 3, "apr": 4, "may": 5, "jun": 6,
+    "jul": 7, "aug": 8, "sep": 9, "oct": 10, "nov": 11, "dec": 12
+}
+
+MONTH_NAME = r"(?:jan(?:uary)?|feb(?:ruary)?|mar(?:ch)?|apr(?:il)?|may|june?|july?|aug(?:ust)?|sept?(?:ember)?|" \
+             r"oct(?:ober)?|nov(?:ember)?|dec(?:ember)?)"
+# Month name or number and year, or a year alone; anchored so "Inc 2020" or "120/2020" are not dates
+DATE_TOKEN = rf"(?:\b{MONTH_NAME}\.?,?\s+(?:19|20)\d{{2}}|(?<!\d)(?:0?[1-9]|1[0-2])\s*[/.]\s*(?:19|20)\d{{2}}|" \
+             rf"\b(?:19|20)\d{{2}})(?!\d)"
+DATE_RANGE_PATTERN = re.compile(
+    rf"({DATE_TOKEN})\s*(?:-|–|—|to|till|until)\s*({DATE_TOKEN}|present|current|now|today|ongoing|till date|date)",
+    re.IGNORECASE
+)
+STATED_EXPERIENCE_PATTERN = re.compile(
+    r"(\d{1,2}(?:\.\d)?)\s*\+?\s*(?:years?|yrs?)\.?\s+(?:of\s+)?"
+    r"(?:professional\s+|industry\s+|industrial\s+|work\s+|total\s+|overall\s+|hands-on\s+)?experience",
+    re.IGNORECASE
+)
+
+NUMBER = r"(\d{1,2}(?:\.\d{1,2})?)"
+GPA_LABEL = r"(?:c\.?g\.?p\.?a|g\.?p\.?a|cpi|grade point average)"
+GPA_PATTERNS = [
+    re.compile(rf"\b{GPA_LABEL}\b\s*(?:of|:|-|=|is)?\s*{NUMBER}(?:\s*(?:/|out of)\s*{NUMBER})?", re.IGNORECASE),
+    re.compile(rf"{NUMBER}(?:\s*(?:/|out of)\s*{NUMBER})?\s*{GPA_LABEL}\b", re.IGNORECASE),
+]
+
+# Words a plain "Years of Experience" parameter may contain; anything else
+# ("... in Python") asks about a specific skill and goes to the LLM
+EXPERIENCE_WORDS = {"years", "year", "yrs", "of", "experience", "total", "professional", "work", "industry",
+                    "overall", "relevant", "number", "the", "no"}
+
+BOOLEAN_PREFIX = re.compile(
+    r"^(?:has|have|having|knows|know|is|are|does|do|did|can|with|possesses)\s+(?:an?\s+|the\s+)?",
+    re.IGNORECASE
+)
+BOOLEAN_FILLER = re.compile(
+    r"\b(?:certifications?|certified|certificates?|experience\s+(?:in|with)|knowledge\s+(?:of|in)|"
+    r"proficiency\s+in|proficient\s+in|skills?\s+in|familiar(?:ity)?\s+with|worked\s+(?:on|with)|"
+    r"hands-on|working|any|a|an|the|in|of|with)\b",
+    re.IGNORECASE
+)
+
+# Term -> spellings that count as the same skill or certification
+SYNONYMS = {
+    "aws": ["amazon web services"],
+    "gcp": ["google cloud", "google cloud platform"],
+    "azure": ["microsoft azure"],
+    "kubernetes": ["k8s"],
+    "javascript": ["js", "ecmascript"],
+    "node.js": ["nodejs"],
+    "react": ["react.js", "reactjs"],
+    "postgresql": ["postgres"],
+    "machine learning": ["ml"],
+    "natural language processing": ["nlp"],
+    "ci/cd": ["continuous integration", "continuous delivery", "jenkins", "github actions", "gitlab ci"],
+    "devops": ["dev ops"],
+    "c++": ["cpp"],
+    "c#": ["csharp"],
+    "go": ["golang"],
+    "pmp": ["project management professional"],
+    "scrum": ["csm", "certified scrum master"],
+}
+# Concrete tools and skills that a resume would name if the candidate had them
+KNOWN_TERMS = {
+    "python", "java", "docker", "typescript", "sql", "mysql", "mongodb", "redis", "kafka", "spark", "hadoop", "terraform", "ansible",
+    "linux", "git", "tensorflow", "pytorch", "keras", "pandas", "numpy", "django", "flask", "spring", "angular",
+    "vue", "graphql", "rust", "scala", "kotlin", "swift", "php", "ruby", "tableau", "power bi", "excel",
+    "snowflake", "airflow", "elasticsearch", "html", "css", "figma", "salesforce", "sap", "ccna", "cissp",
+} | set(SYNONYMS) | {alias for aliases in SYNONYMS.values() for alias in aliases}
+
+
+# Skill names that are also everyday words ("go live", "excel at", "Spring
+# 2021"); like terms of two characters or fewer ("C/C++", "R&D") they are
+# never matched confidently and the LLM decides
+AMBIGUOUS_TERMS = {"go", "swift", "spring", "rust", "ruby", "excel", "express", "dart", "julia"}
+
+
+def _is_ambiguous(term: str) -> bool:
+    return len(term) <= 2 or term in AMBIGUOUS_TERMS
+
+
+def _result(value, confidence, evidence="") -> Dict[str, Any]:
+    return {"value": value, "confidence": confidence, "evidence": evidence.strip()[:200]}
+
+
+def _month_index(token: str, today: date, end: bool = False) -> int:
+    token = token.strip().lower().rstrip(".")
+    if token in ("present", "current", "now", "today", "ongoing", "till date", "date"):
+        return today.year * 12 + today.month - 1
+
+    year = int(re.search(r"(?:19|20)\d{2}", token).group(0))
+    numeric = re.match(r"(\d{1,2})\s*[/.]", token)
+    if numeric:
+        month = int(numeric.group(1))
+    else:
+        month = MONTHS.get(token[:3]) if token[:3].isalpha() else None
+        if month is None:
+            # Year only: count whole years, "2016 - 2021" is five (July to June, inclusive)
+            month = 6 if end else 7
+    return year * 12 + month - 1
+
+
+def ExtractExperienceYears(resume_text: str, today: Optional[date] = None) -> Optional[Dict[str, Any]]:
+    """
+    Total years of experience: an explicit "N+ years of experience" in the
+    header or summary, otherwise the date ranges of the Experience section
+    with overlaps merged.
+    """
+    today = today or date.today()
+    sections = SplitSections(resume_text)
+
+    summary = "\n".join(line for section, lines in sections if section in ("Header", "Summary") for line in lines)
+    for stated in STATED_EXPERIENCE_PATTERN.finditer(summary):
+        # "3 years of experience in Python" is about one skill, not the whole career
+        if not re.match(r"\s+(?:in|with|on)\s", summary[stated.end():]):
+            return _result(float(stated.group(1)), 0.9, stated.group(0))
+
+    experience_lines = [line for section, lines in sections if section == "Experience" for line in lines]
+    in_section = bool(experience_lines)
+    text = "\n".join(experience_lines) if in_section else resume_text
+
+    intervals = []
+    evidence = []
+    for match in DATE_RANGE_PATTERN.finditer(text):
+        start = _month_index(match.group(1), today)
+        end = _month_index(match.group(2), today, end=True)
+        if end < start:
+            continue
+        intervals.append((start, end))
+        evidence.append(match.group(0))
+    if not intervals:
+        return None
+
+    # Ranges are inclusive: "Jan 2015 - Dec 2018" is 48 months
+    months = 0
+    current_start, current_end = None, None
+    for start, end in sorted(intervals):
+        if current_end is None or start > current_end:
+            if current_end is not None:
+                months += current_end - current_start + 1
+            current_start, current_end = start, end
+        else:
+            current_end = max(current_end, end)
+    months += current_end - current_start + 1
+
+    # Ranges outside an Experience section may be education; let the LLM decide
+    confidence = 0.85 if in_section else 0.5
+    return _result(round(months / 12, 1), confidence, "; ".join(evidence))
+
+
+def ExtractGPA(resume_text: str, max_value: Optional[float] = None) -> Optional[Dict[str, Any]]:
+    """
+    GPA / CGPA stated in the resume, rescaled to max_value when the resume
+    gives its own scale ("3.6/4.0" with max_value 10 becomes 9.0).
+    """
+    found = []
+    for pattern in GPA_PATTERNS:
+        for match in pattern.finditer(resume_text):
+            value = float(match.group(1))
+            scale = float(match.group(2)) if match.group(2) else None
+            if value <= 0 or (scale and value > scale) or (not scale and value > 10):
+                continue
+            found.append((match.start(), value, scale, match.group(0)))
+    if not found:
+        return None
+
+    found.sort()
+    _, value, scale, evidence = found[0]
+    distinct = {(round(v, 2), s) for _, v, s, _ in found}
+
+    if scale and max_value and abs(scale - float(max_value)) > 1e-6:
+        value = value / scale * float(max_value)
+        confidence = 0.9
+    elif scale:
+        confidence = 0.95
+    elif max_value and value <= 4.0 < float(max_value):
+        # Could be a 4-point GPA compared against a 10-point maximum
+        confidence = 0.5
+    else:
+        confidence = 0.85
+
+    # Several different grades (e.g. two degrees): the first is usually the latest, but ask the LLM
+    if len(distinct) > 1:
+        confidence = min(confidence, 0.6)
+    return _result(round(value, 2), confidence, evidence)
+
+
+def _term_pattern(term):
+    # A version number may follow the name: "Python3", "Java8", "Python 3.10"
+    return re.compile(rf"(?<![A-Za-z0-9]){re.escape(term)}(?:v?\d+(?:\.\d+)*)?(?![A-Za-z0-9+#])", re.IGNORECASE)
+
+
+# "Not familiar with Python", "no experience in Docker", "without AWS"
+NEGATION = re.compile(r"\b(?:not|no|never|without|lacks?|lacking|unfamiliar)\b|n't\b", re.IGNORECASE)
+
+
+def _negated(line: str, match) -> bool:
+    """True when the clause leading up to a term match negates it."""
+    clause = re.split(r"[,;:.()|•]", line[:match.start()])[-1]
+    return bool(NEGATION.search(clause))
+
+
+def _search(patterns, line):
+    for pattern in patterns:
+        match = pattern.search(line)
+        if match:
+            return match
+    return None
+
+
+def BooleanSubject(parameter: str):
+    """("aws", True) for "Has AWS Certification?"; subject is None when nothing concrete is asked."""
+    text = parameter.strip().rstrip("?.! ")
+    is_certification = bool(re.search(r"certif", text, re.IGNORECASE))
+    text = BOOLEAN_PREFIX.sub("", text)
+    subject = re.sub(r"\s+", " ", BOOLEAN_FILLER.sub(" ", text)).strip(" ,-").lower()
+    if not subject or len(subject.split()) > 4:
+        return None, is_certification
+    return subject, is_certification
+
+
+def ExtractBoolean(parameter: str, resume_text: str) -> Optional[Dict[str, Any]]:
+    """
+    Keyword and synonym match for skill, tool and certification parameters.
+    A certification only counts on a line mentioning certification or in a
+    Certifications section. Absence is trusted only for well-known terms that
+    do not appear inside another word either ("SQL" in "MySQL", "Docker" in
+    "Dockerized"). Negated mentions ("not familiar with Python"), and short or
+    ambiguous spellings (AMBIGUOUS_TERMS), only ever give a low-confidence
+    answer, so the LLM reads them in context.
+    """
+    subject, is_certification = BooleanSubject(parameter)
+    if subject is None:
+        return None
+
+    aliases = {subject, *SYNONYMS.get(subject, [])}
+    for term, spellings in SYNONYMS.items():
+        if subject in spellings:
+            aliases.update([term, *spellings])
+    ordered = sorted(aliases, key=len, reverse=True)
+    patterns = [_term_pattern(alias) for alias in ordered if not _is_ambiguous(alias)]
+    ambiguous_patterns = [_term_pattern(alias) for alias in ordered if _is_ambiguous(alias)]
+
+    mentioned = None
+    negated = None
+    possible = None
+    for section, lines in SplitSections(resume_text):
+        for line in lines:
+            match = _search(patterns, line)
+            if match is None:
+                if possible is None and _search(ambiguous_patterns, line):
+                    possible = line
+                continue
+            if _negated(line, match):
+                negated = negated or line
+                continue
+            if not is_certification or section == "Certifications" or re.search(r"certif", line, re.IGNORECASE):
+                return _result(True, 0.95 if is_certification else 0.9, line)
+            mentioned = mentioned or line
+
+    if mentioned:
+        # Named, but not as a certification
+        return _result(False, 0.4, mentioned)
+    if negated:
+        # Most likely "does not know", but the LLM should read the sentence
+        return _result(False, 0.5, negated)
+    if possible:
+        # "Go" may be "go live", "C" may be "C/C++": too uncertain either way
+        return _result(True, 0.5, possible)
+    lowered = resume_text.lower()
+    partial = next((alias for alias in ordered if not _is_ambiguous(alias) and alias in lowered), None)
+    if partial:
+        # Only inside another word: "PostgreSQL" for SQL, "Dockerized" for Docker
+        return _result(False, 0.4, f"{partial} only inside another word")
+    known = subject in KNOWN_TERMS
+    return _result(False, 0.85 if known else 0.5, f"no mention of {subject}")
+
+
+def ExtractQuantitative(parameter: str, resume_text: str, max_value: Optional[float] = None) -> Optional[Dict[str, Any]]:
+    """Route a quantitative parameter to the extractor that understands it, if any."""
+    lowered = parameter.lower()
+    words = set(re.findall(r"[a-z]+", lowered))
+    if words & {"gpa", "cgpa", "cpi"} or "grade point" in lowered:
+        return ExtractGPA(resume_text, max_value)
+    if "experience" in words and words <= EXPERIENCE_WORDS:
+        return ExtractExperienceYears(resume_text)
+    return None
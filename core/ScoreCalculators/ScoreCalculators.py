@@ -1,67 +1,104 @@
 #IMPORT IN ACTUAL
 
 import re
-import time
-from llama_index.llms.gemini import Gemini
+import json
 from dotenv import load_dotenv
 import os
 from typing import Dict, Any
+from interfaces.utils.RateLimiter import GetRateLimiter
+from core.ModelInitializers.ClientPool import GetLLMClient
 
 load_dotenv()
 google_api_key = os.getenv('GOOGLE_API_KEY')
 finetuned_api_key = os.getenv('FINETUNED_API_KEY')
 
+# Shared across threads so concurrent scoring stays within the Gemini quota
+rate_limiter = GetRateLimiter("gemini_llm")
+
+
+#RETRIEVAL QUESTIONS, SHARED WITH THE BATCH RETRIEVER PREFETCH
+def QuantitativeQuery(parameter):
+    return f"What is the {parameter}? Return only the numerical value."
+
+def BooleanQuery(parameter):
+    return f"Does the candidate have {parameter}? Answer with True or False only."
+
 
 #SCORING MECHANISM FOR QUANTITATIVE PARAMETERS
+def QuantitativeScoreFromValue(raw_value, max_value, benefit_type):
+    """Map an extracted value onto 0-100 against max_value."""
+    if benefit_type == "higher":
+        return min((raw_value / max_value) * 100, 100)
+    return max((1 - (raw_value / max_value)) * 100, 0)
+
+# The Calculate*Score functions raise when the LLM call itself fails (rate
+# limits, network errors), so ScoreResume reports the parameter in errors
+# instead of scoring it 0. Only an answer without a usable value scores 0.
 def CalculateQuantitativeScore(parameter, max_value, benefit_type, query_engine):
-    
+    query_text = QuantitativeQuery(parameter)
+    rate_limiter.wait_if_needed()
+    response = query_engine.query(query_text)
+
+    if not response:
+        return 0
+
     try:
-        query_text = f"What is the {parameter}? Return only the numerical value."
-        response = query_engine.query(query_text)
-        time.sleep(1)  # Rate limiting delay
-        
-        if not response:
-            return 0
-            
         raw_value = float(str(response))
-        
-        
-        if benefit_type == "higher":
-            score = min((raw_value / max_value) * 100, 100)
-        else:  
-            score = max((1 - (raw_value / max_value)) * 100, 0)
-        
-        return score
-    
-    except Exception as e:
-        print(f"Error in quantitative scoring: {e}")
+    except ValueError:
+        print(f"No numerical value for {parameter}: {response}")
         return 0
+    return QuantitativeScoreFromValue(raw_value, max_value, benefit_type)
  
 #SCORING MECHANISM FOR BOOLEAN PARAMETERS   
 def CalculateBooleanScore(parameter, query_engine):
+    query_text = BooleanQuery(parameter)
+    rate_limiter.wait_if_needed()
+    response = query_engine.query(query_text)
+    answer = str(response).lower()
+    return 100 if "true" in answer or "yes" in answer else 0
     
-    try:
-        query_text = f"Does the candidate have {parameter}? Answer with True or False only."
-        response = query_engine.query(query_text)
-        time.sleep(1)  # Rate limiting delay
-        answer = str(response).lower()
-        return 100 if "true" in answer or "yes" in answer else 0
-    except Exception as e:
-        print(f"Error in boolean scoring: {e}")
-        return 0
     
-    
-#SCORING MECHANISM FOR TEXTUAL PARAMETERS      
-def CalculateTextualScore(parameter: str, resume_text: str) -> float:
-    
-    try:
-        ft_api_key = os.getenv('FINETUNED_API_KEY')  # Get API key 
-        if not ft_api_key:
-            raise ValueError("FINETUNED_API_KEY not found in environment")
-            
-        model = Gemini(api_key=ft_api_key)
+#STRUCTURED OUTPUT PARSING FOR TEXTUAL EVALUATIONS
+def ParseTextualEvaluation(text: str) -> Dict[str, Any]:
+    """
+    Extract score and justification from the evaluator's reply.
+    Expects a JSON object, falls back to a "Score: <number>" line.
+    """
+    cleaned = re.sub(r"```(?:json)?", "", text or "").strip()
+
+    match = re.search(r"\{.*\}", cleaned, re.DOTALL)
+    if match:
+        try:
+            data = json.loads(match.group(0))
+            score = float(data["score"])
+            return {
+                "score": min(max(score, 0.0), 100.0),
+                "justification": str(data.get("justification", "")).strip()
+            }
+        except (ValueError, KeyError, TypeError):
+            pass
+
+    match = re.search(r"score\W*?(\d+(?:\.\d+)?)", cleaned, re.IGNORECASE)
+    if match:
+        justification = re.search(r"justification\W*(.*)", cleaned, re.IGNORECASE | re.DOTALL)
+        return {
+            "score": min(max(float(match.group(1)), 0.0), 100.0),
+            "justification": justification.group(1).strip() if justification else ""
+        }
+
+    raise ValueError(f"Could not find a score in evaluation: {text}")
+
+
+#SCORING MECHANISM FOR TEXTUAL PARAMETERS
+def EvaluateTextualParameter(parameter: str, resume_text: str) -> Dict[str, Any]:
+    """Score a textual parameter and justify it in a single LLM call."""
+    ft_api_key = os.getenv('FINETUNED_API_KEY')  # Get API key 
+    if not ft_api_key:
+        raise ValueError("FINETUNED_API_KEY not found in environment")
         
-        eval_prompt = f"""
+    model = GetLLMClient(ft_api_key)
+    
+    eval_prompt = f"""
         You are an expert evaluator for an AI-powered recruitment system called SmartHire. Your task is to assess a candidate's depth of knowledge in a specific *textual parameter* based on their resume.  
 
 ### Instructions:  
@@ -78,23 +115,15 @@ def CalculateTextualScore(parameter: str, resume_text: str) -> float:
 {parameter}  
 
 ### Output Format:
-*Score:* [1 - 100]  
-*Justification:* [A brief but clear explanation based on resume content]
+Respond with a single JSON object and nothing else:
+{{"score": <number from 0.0 to 100.0>, "justification": "<a brief but clear explanation based on resume content>"}}
 
 Now, evaluate the resume accordingly."""
 
-        evaluation = model.complete(eval_prompt)
-              
-        score_prompt = evaluation.text + "\nBased on the given evaluation\nWhat is the score? Give the correct numerical value with no additional words"
-        score_response = model.complete(score_prompt)
-                
-        try:
-            score = float(score_response.text.strip())
-            return score
-        except ValueError:
-            print(f"Could not convert score text to float: {score_response.text}")
-            return 0.0
-            
-    except Exception as e:
-        print(f"Error in textual scoring: {str(e)}")
-        return 0.0
\ No newline at end of file
+    rate_limiter.wait_if_needed()
+    evaluation = model.complete(eval_prompt)
+    return ParseTextualEvaluation(evaluation.text)
+
+
+def CalculateTextualScore(parameter: str, resume_text: str) -> float:
+    return EvaluateTextualParameter(parameter, resume_text)["score"]
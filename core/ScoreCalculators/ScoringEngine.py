@@ -0,0 +1,267 @@
+#IMPORT IN ACTUAL
+
+import re
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Dict, Any, List, Optional
+from core.ScoreCalculators.ScoreCalculators import (
+    CalculateQuantitativeScore,
+    CalculateBooleanScore,
+    CalculateTextualScore,
+    QuantitativeScoreFromValue,
+    QuantitativeQuery,
+    BooleanQuery
+)
+from core.ScoreCalculators.RuleExtractors import ExtractQuantitative, ExtractBoolean
+from interfaces.utils.ParameterManager import ParameterDefinitionHash
+from interfaces.utils.RateLimiter import RetryOnRateLimit
+
+# Parameter evaluations are network bound, a handful of threads is enough to
+# keep the Gemini quota busy; the shared RateLimiter does the actual throttling.
+MAX_WORKERS = 8
+
+# Rule-based answers at or above this confidence skip the LLM entirely
+RULE_CONFIDENCE_THRESHOLD = 0.8
+
+# Parameter words too generic to tie a parameter to an edited resume line
+GENERIC_PARAMETER_WORDS = {
+    "and", "any", "are", "does", "for", "has", "have", "candidate", "the", "with", "level", "number", "total",
+    "overall", "good", "strong", "ability", "skill", "skills", "knowledge", "proficiency",
+}
+
+
+def ScoreParameter(details: Dict[str, Any], query_engine, resume_text: str) -> float:
+    """Dispatch a single parameter to the scorer for its type."""
+    parameter_type = details["type"].lower()
+
+    if parameter_type == "textual":
+        return CalculateTextualScore(
+            parameter=details["description"],
+            resume_text=resume_text
+        )
+    elif parameter_type == "quantitative":
+        return CalculateQuantitativeScore(
+            parameter=details["description"],
+            max_value=details["max_value"],
+            benefit_type=details["benefit_type"],
+            query_engine=query_engine
+        )
+    elif parameter_type == "boolean":
+        return CalculateBooleanScore(
+            parameter=details["description"],
+            query_engine=query_engine
+        )
+
+    raise ValueError(f"Unknown parameter type: {details['type']}")
+
+
+def RuleBasedScore(details: Dict[str, Any], resume_text: str, min_confidence: float = RULE_CONFIDENCE_THRESHOLD):
+    """
+    Score a quantitative or boolean parameter from the resume text alone.
+    Returns None when no extractor applies or its confidence is below min_confidence.
+    """
+    parameter_type = str(details.get("type", "")).lower()
+    try:
+        if parameter_type == "quantitative":
+            extraction = ExtractQuantitative(details["description"], resume_text, details.get("max_value"))
+            if extraction and extraction["confidence"] >= min_confidence and details.get("max_value"):
+                return QuantitativeScoreFromValue(extraction["value"], float(details["max_value"]), details["benefit_type"])
+        elif parameter_type == "boolean":
+            extraction = ExtractBoolean(details["description"], resume_text)
+            if extraction and extraction["confidence"] >= min_confidence:
+                return 100 if extraction["value"] else 0
+    except Exception as e:
+        print(f"Error in rule-based scoring: {e}")
+    return None
+
+
+# Two-letter words that are never a skill name, even capitalized
+SHORT_STOP_WORDS = {"in", "of", "on", "at", "to", "an", "or", "is", "by", "as", "be", "do", "if", "it", "no"}
+
+
+def _word_stems(text, keep_short=False):
+    """
+    Six-letter stems of the specific words of text. Two-letter words are
+    dropped unless keep_short is set, except capitalized ones in a parameter
+    description ("ML", "AI", "Go").
+    """
+    stems = set()
+    for word in re.findall(r"[A-Za-z0-9+#]+", text):
+        lowered = word.lower()
+        if lowered in GENERIC_PARAMETER_WORDS or len(lowered) < 2:
+            continue
+        if len(lowered) >= 3 or keep_short or (word[0].isupper() and lowered not in SHORT_STOP_WORDS):
+            stems.add(lowered[:6])
+    return stems
+
+
+def ReusableScores(parameter_details: Dict[str, Dict], previous_scores: Dict[str, Dict],
+                   changed_lines: List[str]) -> Dict[str, float]:
+    """
+    Raw LLM scores from a near-identical earlier resume that the edits cannot
+    have changed: same parameter definition, and no changed line mentions
+    the parameter (for quantitative parameters, no changed line has a
+    number). A description with no specific word to look for cannot be
+    shown unaffected, so it is only reused when no line changed.
+    Rule-scored parameters are never reused, they are recomputed from the
+    new text for free.
+    """
+    # Removed lines arrive normalized to lower case, so every short word counts
+    changed_stems = _word_stems(" ".join(changed_lines), keep_short=True)
+    changed_numbers = any(re.search(r"\d", line) for line in changed_lines)
+    reusable = {}
+    for param_name, details in parameter_details.items():
+        previous = previous_scores.get(param_name)
+        if not previous or previous.get("source") not in ("llm", "reused"):
+            continue
+        if previous.get("definition") != ParameterDefinitionHash(details):
+            continue
+        if str(details.get("type", "")).lower() == "quantitative" and changed_numbers:
+            continue
+        stems = _word_stems(details["description"])
+        if changed_lines and (not stems or stems & changed_stems):
+            continue
+        reusable[param_name] = previous["raw_score"]
+    return reusable
+
+
+def ParameterQueries(parameter_details: Dict[str, Dict]) -> list:
+    """Retrieval questions the quantitative and boolean scorers will ask."""
+    queries = []
+    for details in parameter_details.values():
+        parameter_type = str(details.get("type", "")).lower()
+        if parameter_type == "quantitative":
+            queries.append(QuantitativeQuery(details["description"]))
+        elif parameter_type == "boolean":
+            queries.append(BooleanQuery(details["description"]))
+    return queries
+
+
+def PrefetchContexts(parameter_details: Dict[str, Dict], query_engine) -> None:
+    """Retrieve context for all parameter questions up front when the engine supports it."""
+    retriever = getattr(query_engine, "retriever", None)
+    if not hasattr(retriever, "prefetch"):
+        return
+    try:
+        retriever.prefetch(ParameterQueries(parameter_details))
+    except Exception as e:
+        # Scorers fall back to per-question retrieval
+        print(f"Error prefetching parameter contexts: {e}")
+
+
+def ScoreResume(parameter_details: Dict[str, Dict], query_engine, resume_text: str,
+                max_workers: int = MAX_WORKERS, min_rule_confidence: float = RULE_CONFIDENCE_THRESHOLD,
+                reused_scores: Optional[Dict[str, float]] = None) -> Dict[str, Any]:
+    """
+    Evaluate every weighted parameter and combine the results. Parameters the
+    rule-based extractors answer confidently are scored locally, those in
+    reused_scores (see ReusableScores) keep their earlier score, and the rest
+    are evaluated concurrently through the LLM, each retried with backoff
+    while it is rate limited. Pass min_rule_confidence above 1 to send
+    everything to the LLM. query_engine may be a zero-argument function; it
+    is then only called if a quantitative or boolean parameter needs the LLM.
+
+    Returns a dict with:
+      - scores: {param_name: {"raw_score", "weighted_score", "weight", "source", "definition"}} in
+        parameter order, source being "rules", "reused" or "llm" and definition the parameter's
+        ParameterDefinitionHash
+      - total_weighted_score / total_weight
+      - final_score: weighted average, or None if nothing was scored
+      - errors: {param_name: error message} for parameters whose evaluation failed (rate limits that
+        outlasted the retries, network or parsing errors); they are left out of scores
+    """
+    active_parameters = {}
+    errors = {}
+    for param_name, details in parameter_details.items():
+        try:
+            weight = float(details.get("weight", 0) or 0)
+        except (TypeError, ValueError) as e:
+            errors[param_name] = str(e)
+            continue
+        if weight > 0:
+            active_parameters[param_name] = (details, weight)
+
+    raw_scores = {}
+    sources = {}
+    llm_parameters = {}
+    reused_scores = reused_scores or {}
+    for param_name, (details, _) in active_parameters.items():
+        score = RuleBasedScore(details, resume_text, min_rule_confidence)
+        if score is not None:
+            raw_scores[param_name] = score
+            sources[param_name] = "rules"
+        elif param_name in reused_scores:
+            raw_scores[param_name] = reused_scores[param_name]
+            sources[param_name] = "reused"
+        else:
+            llm_parameters[param_name] = details
+
+    if llm_parameters:
+        # Textual parameters read the resume text, only the others need the query engine
+        needs_engine = any(str(details.get("type", "")).lower() != "textual" for details in llm_parameters.values())
+        if needs_engine and not hasattr(query_engine, "query") and callable(query_engine):
+            try:
+                query_engine = RetryOnRateLimit(query_engine)
+            except Exception as e:
+                # Without the resume index only the textual parameters can be evaluated
+                for param_name, details in list(llm_parameters.items()):
+                    if str(details.get("type", "")).lower() != "textual":
+                        errors[param_name] = str(e)
+                        del llm_parameters[param_name]
+    if llm_parameters:
+        PrefetchContexts(llm_parameters, query_engine)
+        with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(llm_parameters)))) as executor:
+            futures = {
+                executor.submit(RetryOnRateLimit, ScoreParameter, details, query_engine, resume_text): param_name
+                for param_name, details in llm_parameters.items()
+            }
+            for future in as_completed(futures):
+                param_name = futures[future]
+                try:
+                    raw_scores[param_name] = future.result()
+                    sources[param_name] = "llm"
+                except Exception as e:
+                    errors[param_name] = str(e)
+
+    combined = CombineScores(parameter_details, raw_scores, sources)
+    combined["errors"] = errors
+    return combined
+
+
+def CombineScores(parameter_details: Dict[str, Dict], raw_scores: Dict[str, float],
+                  sources: Dict[str, str]) -> Dict[str, Any]:
+    """
+    Weighted combination of raw scores, as ScoreResume reports it (without
+    errors). Parameters without a positive weight or a raw score are left out.
+    """
+    scores = {}
+    total_weighted_score = 0.0
+    total_weight = 0.0
+    for param_name, details in parameter_details.items():
+        if param_name not in raw_scores:
+            continue
+        try:
+            weight = float(details.get("weight", 0) or 0)
+        except (TypeError, ValueError):
+            continue
+        if weight <= 0:
+            continue
+        score = raw_scores[param_name]
+        weighted_score = score * weight
+        scores[param_name] = {
+            "raw_score": score,
+            "weighted_score": weighted_score,
+            "weight": weight,
+            "source": sources.get(param_name),
+            "definition": ParameterDefinitionHash(details)
+        }
+        total_weighted_score += weighted_score
+        total_weight += weight
+
+    final_score = (total_weighted_score / total_weight) if scores and total_weight > 0 else None
+
+    return {
+        "scores": scores,
+        "total_weighted_score": total_weighted_score,
+        "total_weight": total_weight,
+        "final_score": final_score
+    }
@@ -1,35 +1,159 @@
-#IMPORT IN ACTUAL 
+#IMPORT IN ACTUAL
 
+import json
 import os
+import re
+import tempfile
+from pathlib import Path
+from threading import Lock
 from dotenv import load_dotenv
-from llama_index.llms.gemini import Gemini
+from core.ModelInitializers.ClientPool import GetLLMClient
 
 load_dotenv()
-google_api_key=os.getenv('GOOGLE_API_KEY') 
-llm = Gemini(models='gemini-1.5-pro',api_key=google_api_key)
+google_api_key=os.getenv('GOOGLE_API_KEY')
+
+CATEGORIES = ["Quantitative", "Boolean", "Textual"]
+# Runtime data, kept in the git-ignored core/cache/ with the other caches
+DEFAULT_CLASSIFICATION_CACHE_FILE = os.path.join(os.path.dirname(__file__), '../../core/cache/classification_cache.json')
+CACHE_FILE = Path(os.getenv("CLASSIFICATION_CACHE_FILE", DEFAULT_CLASSIFICATION_CACHE_FILE))
+
+_cache = None
+_cache_lock = Lock()
+
+def GetClassifierLLM():
+    # Created on first classification instead of at import time
+    return GetLLMClient(google_api_key, models='gemini-1.5-pro')
+
+def NormalizeParameterName(parameter):
+    """'  Years of Experience? ' and 'years of  experience' share one cache entry."""
+    return re.sub(r"\s+", " ", parameter.strip().lower()).rstrip("?.! ")
+
+def _load_cache():
+    global _cache
+    if _cache is None:
+        try:
+            with open(CACHE_FILE, 'r') as file:
+                _cache = json.load(file)
+        except (FileNotFoundError, ValueError):
+            _cache = {}
+    return _cache
+
+def _save_cache():
+    CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+    fd, temp_path = tempfile.mkstemp(dir=CACHE_FILE.parent, suffix=".tmp")
+    try:
+        with os.fdopen(fd, 'w') as file:
+            json.dump(_cache, file, indent=4)
+        os.replace(temp_path, CACHE_FILE)
+    except Exception as e:
+        print(f"Error saving classification cache: {e}")
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+
+def _store(classified):
+    with _cache_lock:
+        _load_cache().update(classified)
+        _save_cache()
+
+def _canonical_category(text):
+    for category in CATEGORIES:
+        if category.lower() in text.lower():
+            return category
+    return None
+
+def _cached_category(parameter):
+    with _cache_lock:
+        return _load_cache().get(NormalizeParameterName(parameter))
 
 def ClassifyParameter(parameter):
     # CLASSIFICATION PROMPT TO CLASSIFY THE GIVEN PARAMETER INTO ONE OF THREE CATEGORIES
-    
+    cached = _cached_category(parameter)
+    if cached:
+        return cached
+
     prompt = f"""
-    You are an AI system designed to assist in resume screening. 
+    You are an AI system designed to assist in resume screening.
     Your task is to classify the given parameter into one of three categories:
-    
-    1. Quantitative: A parameter measured numerically (e.g., years of experience, number of projects, GPA).  
+
+    1. Quantitative: A parameter measured numerically (e.g., years of experience, number of projects, GPA).
     2. Boolean: A parameter whose answer is a Yes or No ,they usually begin with 'has','knows','is' words.
-       (e.g., "Has AWS Certification?", "Knows DevOps?").  
+       (e.g., "Has AWS Certification?", "Knows DevOps?").
     3. Textual: A parameter requiring knowledge evaluation,skill-assesment or detailed analysis of the entire
-       resume, they usually look for 'knowledge','proficiency','relevance' (e.g., "Proficiency in Python","Knowledge in ML).  
-    
-    Instructions:  
-    - Carefully analyze the parameter and determine the correct category.  
+       resume, they usually look for 'knowledge','proficiency','relevance' (e.g., "Proficiency in Python","Knowledge in ML).
+
+    Instructions:
+    - Carefully analyze the parameter and determine the correct category.
     - Output must be a single word only and should be exactly any three of these
     'Quantitative','Boolean' or 'Textual'
-    
+
     **Input Parameter:** "{parameter}"
     """
-   
-    response = llm.complete(prompt)
-    return response.text.strip()
+
+    response = GetClassifierLLM().complete(prompt)
+    category = _canonical_category(response.text)
+    if category is None:
+        return response.text.strip()
+
+    _store({NormalizeParameterName(parameter): category})
+    return category
+
+def ClassifyParameters(parameters):
+    """
+    Classify a list of parameters, returning {parameter: category}.
+    Cached names cost nothing; the rest are classified together in one LLM call,
+    with a per-parameter call only for names the batch answer left out.
+    """
+    results = {}
+    pending = []
+    for parameter in parameters:
+        cached = _cached_category(parameter)
+        if cached:
+            results[parameter] = cached
+        elif parameter not in pending:
+            pending.append(parameter)
+
+    if not pending:
+        return results
+
+    numbered = "\n".join(f'{i}. "{parameter}"' for i, parameter in enumerate(pending, start=1))
+    prompt = f"""
+    You are an AI system designed to assist in resume screening.
+    Your task is to classify each of the given parameters into one of three categories:
+
+    1. Quantitative: A parameter measured numerically (e.g., years of experience, number of projects, GPA).
+    2. Boolean: A parameter whose answer is a Yes or No ,they usually begin with 'has','knows','is' words.
+       (e.g., "Has AWS Certification?", "Knows DevOps?").
+    3. Textual: A parameter requiring knowledge evaluation,skill-assesment or detailed analysis of the entire
+       resume, they usually look for 'knowledge','proficiency','relevance' (e.g., "Proficiency in Python","Knowledge in ML).
+
+    Instructions:
+    - Carefully analyze each parameter and determine the correct category.
+    - Output must be a single JSON object mapping each parameter number to exactly one of
+    'Quantitative','Boolean' or 'Textual', e.g. {{"1": "Boolean", "2": "Textual"}}
+
+    **Input Parameters:**
+    {numbered}
+    """
+
+    classified = {}
+    try:
+        response = GetClassifierLLM().complete(prompt)
+        match = re.search(r"\{.*\}", response.text, re.DOTALL)
+        answers = json.loads(match.group(0)) if match else {}
+        for i, parameter in enumerate(pending, start=1):
+            category = _canonical_category(str(answers.get(str(i), "")))
+            if category:
+                results[parameter] = category
+                classified[NormalizeParameterName(parameter)] = category
+    except Exception as e:
+        print(f"Error in batch classification: {e}")
+
+    if classified:
+        _store(classified)
+
+    for parameter in pending:
+        if parameter not in results:
+            results[parameter] = ClassifyParameter(parameter)
+    return results
 
 
@@ -1,51 +1,219 @@
+import hashlib
 import json
 import os
+import stat
+import uuid
 from pathlib import Path
+from threading import Lock
+from types import MappingProxyType
 from typing import Dict
 
+# Compiled plans by resolved file path: (stat signature, ScoringPlan)
+_plans = {}
+_plans_lock = Lock()
+
+PARAMETER_TYPES = ["quantitative", "boolean", "textual"]
+
+
+class ScoringPlan:
+    """
+    Immutable, compiled form of parameters.json shared by every scoring call.
+
+    - version: content hash of the parameter file it was compiled from
+    - details: {param_name: {"type", "weight", "max_value", "benefit_type", "description"}}
+    - names / weights: parameter order and the matching read-only float64 weight vector
+    - groups: {type: (param_name, ...)}
+    - total_weight: sum of the positive weights
+    """
+
+    __slots__ = ("version", "details", "names", "weights", "groups", "total_weight")
+
+    def __init__(self, version, details):
+        import numpy as np  # only needed once a plan is compiled, keeps the module cheap to import
+        names = tuple(details)
+        weights = np.array([float(details[name]["weight"] or 0) for name in names], dtype=np.float64)
+        weights.setflags(write=False)
+        groups = {parameter_type: [] for parameter_type in PARAMETER_TYPES}
+        for name in names:
+            groups.setdefault(str(details[name]["type"]).lower(), []).append(name)
+
+        object.__setattr__(self, "version", version)
+        object.__setattr__(self, "details", MappingProxyType({
+            name: MappingProxyType(dict(details[name])) for name in names
+        }))
+        object.__setattr__(self, "names", names)
+        object.__setattr__(self, "weights", weights)
+        object.__setattr__(self, "groups", MappingProxyType({
+            parameter_type: tuple(group) for parameter_type, group in groups.items()
+        }))
+        object.__setattr__(self, "total_weight", float(weights[weights > 0].sum()))
+
+    def __setattr__(self, name, value):
+        raise AttributeError("ScoringPlan is immutable")
+
+    def __len__(self):
+        return len(self.names)
+
+
+def AsScoringPlan(parameter_details) -> ScoringPlan:
+    """A ScoringPlan as is, or one compiled from a {param_name: details} mapping."""
+    if isinstance(parameter_details, ScoringPlan):
+        return parameter_details
+    return ScoringPlan("inline", parameter_details)
+
+
+def _parameter_list(params):
+    # Convert dict to list if needed
+    if isinstance(params, list):
+        return params
+    return list(params.values())
+
+
+def CompileParameterDetails(params) -> Dict:
+    """Convert stored parameters to the {param_name: details} form the scorers use."""
+    return {
+        param["name"].lower().replace(" ", "_"): {
+            "type": param["category"],
+            "weight": param["weight"],
+            "max_value": param.get("max_value"),
+            "benefit_type": "higher" if param.get("benefit_type") == "High is better" else "lower",
+            "description": param["name"]
+        }
+        for param in _parameter_list(params)
+    }
+
+
+def ParameterDefinitionHash(details) -> str:
+    """
+    Content hash of everything that affects a parameter's raw score. The
+    weight is left out: it changes how scores are combined, not the scores.
+    """
+    definition = {key: details.get(key) for key in ("type", "description", "max_value", "benefit_type")}
+    definition["type"] = str(definition["type"]).lower()
+    return hashlib.sha256(json.dumps(definition, sort_keys=True, default=str).encode("utf-8")).hexdigest()[:16]
+
+
+def DiffParameters(old_details, new_details) -> Dict:
+    """
+    Compare two {param_name: details} mappings by ParameterDefinitionHash:
+    {"added", "changed", "removed", "reweighted", "unchanged"}, each a list of
+    parameter names. Only added and changed parameters need their raw scores
+    evaluated again; reweighted ones only change how scores are combined.
+    """
+    diff = {"added": [], "changed": [], "removed": [], "reweighted": [], "unchanged": []}
+    for name, details in new_details.items():
+        previous = old_details.get(name)
+        if previous is None:
+            diff["added"].append(name)
+        elif ParameterDefinitionHash(previous) != ParameterDefinitionHash(details):
+            diff["changed"].append(name)
+        elif previous.get("weight") != details.get("weight"):
+            diff["reweighted"].append(name)
+        else:
+            diff["unchanged"].append(name)
+    diff["removed"] = [name for name in old_details if name not in new_details]
+    return diff
+
+
+def _file_mode(path):
+    """Permission bits of path, or None if it does not exist yet."""
+    try:
+        return stat.S_IMODE(os.stat(path).st_mode)
+    except FileNotFoundError:
+        return None
+
+
 class ParameterManager:
     def __init__(self):
         self.file_path = Path(os.path.dirname(__file__)).parent / "parameters.json"
         # Start with empty default parameters
         self.default_parameters = []
-    
+
     def load_parameters(self):
         """Load parameters from JSON file"""
         try:
             if self.file_path.exists():
                 with open(self.file_path, 'r') as file:
-                    params = json.load(file)
-                    # Convert list to dictionary if needed
-                    if isinstance(params, list):
-                        return params
-                    return list(params.values())
+                    return _parameter_list(json.load(file))
             return self.default_parameters
         except Exception as e:
             print(f"Error loading parameters: {e}")
             return self.default_parameters
-    
+
     def save_parameters(self, parameters):
-        """Save parameters to JSON file"""
+        """
+        Save parameters to JSON file atomically, so readers never see a partial
+        write. Returns DiffParameters of the previous and the saved parameters.
+        """
         # Ensure parameters is a list
         if isinstance(parameters, dict):
             parameters = list(parameters.values())
-        with open(self.file_path, 'w') as file:
-            json.dump(parameters, file, indent=4)
-    
+        previous_details = dict(self.get_parameter_details())
+        temp_path = self.file_path.with_name(f".{self.file_path.name}.{uuid.uuid4().hex}.tmp")
+        mode = _file_mode(self.file_path)
+        # A new file gets 0666 less the umask, like open() would give it
+        fd = os.open(temp_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o666 if mode is None else 0o600)
+        try:
+            if mode is not None:
+                # Keep the permissions of the file it replaces
+                os.fchmod(fd, mode)
+            with os.fdopen(fd, 'w') as file:
+                json.dump(parameters, file, indent=4)
+                file.flush()
+                os.fsync(file.fileno())
+            os.replace(temp_path, self.file_path)
+        except Exception:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            raise
+        finally:
+            # mtime may not change within the filesystem's timestamp resolution
+            with _plans_lock:
+                _plans.pop(str(self.file_path.resolve()), None)
+        return DiffParameters(previous_details, CompileParameterDetails(parameters))
+
+    def get_scoring_plan(self) -> ScoringPlan:
+        """
+        Return the compiled plan for the current parameter file. Only a stat()
+        is done per call; the file is re-read when its mtime or size changes and
+        recompiled only when its content hash differs.
+        """
+        key = str(self.file_path.resolve())
+        try:
+            file_stat = os.stat(key)
+            signature = (file_stat.st_mtime_ns, file_stat.st_size)
+        except FileNotFoundError:
+            signature = None
+
+        with _plans_lock:
+            cached = _plans.get(key)
+            if cached is not None and cached[0] == signature:
+                return cached[1]
+
+            if signature is None:
+                plan = ScoringPlan("default", CompileParameterDetails(self.default_parameters))
+            else:
+                try:
+                    with open(key, 'rb') as file:
+                        content = file.read()
+                    version = hashlib.sha256(content).hexdigest()[:16]
+                    if cached is not None and cached[1].version == version:
+                        plan = cached[1]
+                    else:
+                        plan = ScoringPlan(version, CompileParameterDetails(json.loads(content)))
+                except Exception as e:
+                    print(f"Error compiling parameters: {e}")
+                    if cached is not None:
+                        return cached[1]
+                    return ScoringPlan("default", CompileParameterDetails(self.default_parameters))
+
+            _plans[key] = (signature, plan)
+            return plan
+
     def get_parameter_details(self) -> Dict:
-        """Load and convert parameters to dictionary format."""
+        """Read-only {param_name: details} mapping from the cached scoring plan."""
         try:
-            params = self.load_parameters()
-            return {
-                param["name"].lower().replace(" ", "_"): {
-                    "type": param["category"],
-                    "weight": param["weight"],
-                    "max_value": param.get("max_value"),
-                    "benefit_type": "higher" if param.get("benefit_type") == "High is better" else "lower",
-                    "description": param["name"]
-                }
-                for param in params
-            }
+            return self.get_scoring_plan().details
         except Exception as e:
             print(f"Error getting parameter details: {e}")
             return {}
@@ -54,10 +222,10 @@ class ParameterManager:
         required_fields = ["name", "category", "weight"]
         if not all(field in param for field in required_fields):
             return False
-            
+
         if param["category"].lower() == "quantitative":
             return "max_value" in param and "benefit_type" in param
         elif param["category"].lower() in ["boolean", "textual"]:
             return True
-            
+
         return False
@@ -1,27 +1,168 @@
+import os
+import random
+import threading
 import time
-from threading import Lock
+
+# Per-key budgets as (max_requests, window_size in seconds)
+DEFAULT_BUDGETS = {
+    "gemini_llm": (50, 60),
+    "gemini_embedding": (100, 60),
+    "github": (5000, 3600),
+}
+
+
+# Retries of a call the API answered with a rate-limit error, and the first
+# backoff in seconds (doubled per retry, with jitter)
+RATE_LIMIT_RETRIES = 3
+RATE_LIMIT_BACKOFF = 1.0
+
+
+def IsRateLimitError(error) -> bool:
+    """True for HTTP 429 / quota-exhausted errors from Gemini, GitHub or the replay backends."""
+    for attribute in ("status_code", "code"):
+        if getattr(error, attribute, None) == 429:
+            return True
+    message = str(error).lower()
+    return "429" in message or "resource has been exhausted" in message or "resource_exhausted" in message \
+        or "rate limit" in message
+
+
+def RetryOnRateLimit(fn, *args, retries=RATE_LIMIT_RETRIES, backoff=RATE_LIMIT_BACKOFF, **kwargs):
+    """
+    Call fn(*args, **kwargs), retrying up to retries times with exponential
+    backoff while it fails with a rate-limit error. Other errors, and the
+    last rate-limit error, are raised to the caller.
+    """
+    for attempt in range(retries + 1):
+        try:
+            return fn(*args, **kwargs)
+        except Exception as e:
+            if attempt == retries or not IsRateLimitError(e):
+                raise
+            time.sleep(backoff * (2 ** attempt) * random.uniform(0.5, 1.5))
+
 
 class RateLimiter:
-    def __init__(self, max_requests=60, window_size=60):
+    """
+    Token bucket allowing bursts of burst requests (max_requests / 10 by
+    default), refilled at (max_requests - burst) / window_size per second, so
+    no window_size interval ever admits more than max_requests, the first
+    one included.
+
+    Callers reserve a token under the lock (O(1)) and sleep outside it, so a
+    thread that has to wait never blocks threads that are within budget.
+    With a shared backend the bucket lives in SQLite and is respected by
+    every process using the same database file.
+    """
+
+    def __init__(self, max_requests=60, window_size=60, key="default", backend=None, burst=None):
         self.max_requests = max_requests
         self.window_size = window_size
-        self.requests = []
-        self.lock = Lock()
+        self.burst = min(burst or max(1, max_requests // 10), max_requests)
+        self.refill_rate = max(max_requests - self.burst, 1) / window_size
+        self.key = key
+        self.backend = backend
+        self.tokens = float(self.burst)
+        self.updated_at = time.monotonic()
+        self.lock = threading.Lock()
+
+    def reserve(self):
+        """Take one token and return how many seconds the caller must wait before using it."""
+        if self.backend is not None:
+            return self.backend.reserve(self.key, self.burst, self.refill_rate)
 
-    def wait_if_needed(self):
         with self.lock:
-            current_time = time.time()
-            
-            # Remove old requests outside the window
-            self.requests = [req_time for req_time in self.requests 
-                           if current_time - req_time <= self.window_size]
-            
-            # If we've hit the limit, wait until oldest request expires
-            if len(self.requests) >= self.max_requests:
-                sleep_time = self.requests[0] + self.window_size - current_time
-                if sleep_time > 0:
-                    time.sleep(sleep_time)
-                self.requests = self.requests[1:]
-            
-            # Add current request
-            self.requests.append(current_time)
+            now = time.monotonic()
+            self.tokens = min(self.burst, self.tokens + (now - self.updated_at) * self.refill_rate)
+            self.updated_at = now
+            self.tokens -= 1
+            return 0.0 if self.tokens >= 0 else -self.tokens / self.refill_rate
+
+    def wait_if_needed(self):
+        sleep_time = self.reserve()
+        if sleep_time > 0:
+            time.sleep(sleep_time)
+
+    async def async_wait_if_needed(self):
+        import asyncio
+        # The SQLite backend blocks on its database lock, keep it off the event loop
+        sleep_time = await asyncio.to_thread(self.reserve)
+        if sleep_time > 0:
+            await asyncio.sleep(sleep_time)
+
+
+class SQLiteRateLimitBackend:
+    """Token buckets stored in a SQLite file so several worker processes share one quota."""
+
+    def __init__(self, path):
+        self.path = path
+        self.local = threading.local()
+        with self._connect() as conn:
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS buckets (key TEXT PRIMARY KEY, tokens REAL NOT NULL, updated_at REAL NOT NULL)"
+            )
+
+    def _connect(self):
+        conn = getattr(self.local, "conn", None)
+        if conn is None:
+            import sqlite3
+            conn = sqlite3.connect(self.path, timeout=30, isolation_level=None)
+            self.local.conn = conn
+        return conn
+
+    def reserve(self, key, capacity, refill_rate):
+        conn = self._connect()
+        # Wall clock, since monotonic clocks are not comparable across processes
+        now = time.time()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            row = conn.execute("SELECT tokens, updated_at FROM buckets WHERE key = ?", (key,)).fetchone()
+            tokens = capacity if row is None else min(capacity, row[0] + max(0.0, now - row[1]) * refill_rate)
+            tokens -= 1
+            conn.execute(
+                "INSERT INTO buckets (key, tokens, updated_at) VALUES (?, ?, ?) "
+                "ON CONFLICT(key) DO UPDATE SET tokens = excluded.tokens, updated_at = excluded.updated_at",
+                (key, tokens, now)
+            )
+            conn.execute("COMMIT")
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+        return 0.0 if tokens >= 0 else -tokens / refill_rate
+
+
+_limiters = {}
+_limiters_lock = threading.Lock()
+_shared_backend = None
+
+
+def GetRateLimiter(key, max_requests=None, window_size=None):
+    """
+    Return the process-wide limiter for key ("gemini_llm", "gemini_embedding",
+    "github", ...). Budgets default to DEFAULT_BUDGETS and are fixed when the
+    limiter is created; asking for a different one later raises ValueError.
+    When RATE_LIMIT_DB is set, buckets are shared through that SQLite file
+    across processes.
+    """
+    global _shared_backend
+    with _limiters_lock:
+        limiter = _limiters.get(key)
+        if limiter is not None:
+            if (max_requests is not None and max_requests != limiter.max_requests) or \
+                    (window_size is not None and window_size != limiter.window_size):
+                raise ValueError(
+                    f"Rate limiter {key!r} already exists with {limiter.max_requests} requests per "
+                    f"{limiter.window_size} s, cannot change it to {max_requests} per {window_size} s"
+                )
+        else:
+            default_requests, default_window = DEFAULT_BUDGETS.get(key, (60, 60))
+            db_path = os.getenv("RATE_LIMIT_DB")
+            if db_path and _shared_backend is None:
+                _shared_backend = SQLiteRateLimitBackend(db_path)
+            _limiters[key] = RateLimiter(
+                max_requests=max_requests or default_requests,
+                window_size=window_size or default_window,
+                key=key,
+                backend=_shared_backend if db_path else None
+            )
+        return _limiters[key]
@@ -1,3 +1,3 @@
-from .RateLimiter import RateLimiter
+from .RateLimiter import RateLimiter, SQLiteRateLimitBackend, GetRateLimiter, IsRateLimitError, RetryOnRateLimit
 
-__all__ = ['RateLimiter']
+__all__ = ['RateLimiter', 'SQLiteRateLimitBackend', 'GetRateLimiter', 'IsRateLimitError', 'RetryOnRateLimit']
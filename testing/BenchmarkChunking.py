@@ -0,0 +1,143 @@
+#IGNORE, BENCHMARK ONLY
+#Embedding calls per resume and retrieval hit rate of the section-aware
+#ResumeNodeParser against the old global 70 / 10 token SentenceSplitter.
+#
+#   python testing/BenchmarkChunking.py --resumes 200 --top-k 2
+#   python testing/BenchmarkChunking.py --embedding gemini --resumes 20
+#
+#By default retrieval uses the offline bag-of-words HashEmbedding, so hit rates
+#compare the chunkers with each other rather than predicting Gemini's numbers.
+#--embedding gemini / local / keyword go through GetEmbeddingClient (gemini
+#honours SMARTHIRE_BACKEND). A question is a hit when every line needed to
+#answer it is in the top-k chunks.
+
+import argparse
+import math
+import os
+import random
+import sys
+
+# Add project root to Python path
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+if project_root not in sys.path:
+    sys.path.append(project_root)
+
+SKILLS = ["Python", "Java", "AWS", "Docker", "Kubernetes", "React", "SQL", "TensorFlow", "Go", "Terraform",
+          "Spark", "Kafka", "PostgreSQL", "Redis", "GraphQL", "Linux"]
+COMPANIES = ["Acme Corp", "Globex", "Initech", "Umbrella", "Stark Industries", "Wayne Enterprises"]
+VERBS = ["Built", "Designed", "Migrated", "Scaled", "Automated", "Led the rewrite of"]
+SYSTEMS = ["the billing pipeline", "an internal search service", "the payments API", "a data ingestion platform",
+           "the customer dashboard", "a recommendation engine"]
+
+# Embedding requests are sent in batches of this size (llama-index default)
+EMBED_BATCH_SIZE = 10
+
+
+def synthetic_resume(seed):
+    """Return (page texts, {question: [lines needed to answer it]})."""
+    rng = random.Random(seed)
+    skills = rng.sample(SKILLS, 8)
+    lines = [f"Candidate {seed}", f"candidate{seed}@example.com | +1 555 01{seed % 100:02d}", "",
+             "SUMMARY", f"Backend engineer focused on {rng.choice(SYSTEMS)} and reliable distributed systems.", "",
+             "PROFESSIONAL EXPERIENCE"]
+    date_lines = []
+    start = rng.randint(2008, 2014)
+    for _ in range(rng.randint(3, 4)):
+        end = start + rng.randint(1, 4)
+        date_line = f"Software Engineer, {rng.choice(COMPANIES)} ({start} - {end})"
+        date_lines.append(date_line)
+        lines.append(date_line)
+        for _ in range(rng.randint(3, 5)):
+            lines.append(f"- {rng.choice(VERBS)} {rng.choice(SYSTEMS)} in {rng.choice(skills)} and "
+                         f"{rng.choice(skills)}, serving {rng.randint(1, 90)}k users and cutting latency "
+                         f"by {rng.randint(10, 60)}%")
+        lines.append("")
+        start = end
+
+    lines.append("PROJECTS")
+    for _ in range(rng.randint(2, 4)):
+        lines.append(f"- {rng.choice(SYSTEMS).capitalize()} clone: side project written in {rng.choice(skills)}")
+    lines.append("")
+
+    cgpa_line = f"- B.Tech Computer Science, State University, CGPA {rng.uniform(6, 10):.2f}/10"
+    lines += ["EDUCATION", cgpa_line, f"- Higher Secondary, {rng.randint(80, 98)}%", ""]
+
+    skills_line = "- " + ", ".join(skills)
+    lines += ["TECHNICAL SKILLS", skills_line, ""]
+
+    questions = {
+        ("quantitative", "Years of Experience"): date_lines,
+        ("quantitative", "CGPA"): [cgpa_line],
+        ("boolean", "Docker"): [skills_line] if "Docker" in skills else None,
+    }
+    aws_line = "- AWS Certified Solutions Architect - Associate"
+    if rng.random() < 0.5:
+        lines += ["CERTIFICATIONS", aws_line]
+        questions[("boolean", "AWS Certification")] = [aws_line]
+
+    # Two "pages" like SimpleDirectoryReader produces for a two-page PDF
+    middle = len(lines) // 2
+    pages = ["\n".join(lines[:middle]), "\n".join(lines[middle:])]
+    return pages, {key: value for key, value in questions.items() if value}
+
+
+def run_benchmark(resumes, top_k, embedding):
+    from llama_index.core import Document
+    from llama_index.core.node_parser import SentenceSplitter
+    from llama_index.core.schema import MetadataMode
+    from llama_index.core.utils import get_tokenizer
+    from core.Backends.EmbeddingBackends import HashEmbedding
+    from core.ModelInitializers.ResumeChunker import ResumeNodeParser
+    from core.ModelInitializers.Retrieval import BatchRetriever
+    from core.ScoreCalculators.ScoreCalculators import QuantitativeQuery, BooleanQuery
+
+    if embedding != "hash":
+        from core.ModelInitializers.Embedding import GetIndexEmbedding
+        embed_model = GetIndexEmbedding(embedding)
+    else:
+        embed_model = HashEmbedding()
+    tokenizer = get_tokenizer()
+    parsers = {
+        "sentence 70/10": SentenceSplitter(chunk_size=70, chunk_overlap=10),
+        "resume sections": ResumeNodeParser(),
+    }
+    queries = {"quantitative": QuantitativeQuery, "boolean": BooleanQuery}
+
+    print(f"{'chunker':<18}{'nodes/resume':>14}{'batches/resume':>16}{'tokens/node':>13}  hit rate by question (top-{top_k})")
+    for label, parser in parsers.items():
+        total_nodes = total_batches = total_tokens = 0
+        hits, asked = {}, {}
+        for seed in range(resumes):
+            pages, questions = synthetic_resume(seed)
+            documents = [Document(text=page, metadata={"file_name": f"resume_{seed}.pdf", "page_label": str(i + 1)})
+                         for i, page in enumerate(pages)]
+            nodes = parser.get_nodes_from_documents(documents)
+            embeddings = embed_model.get_text_embedding_batch(
+                [node.get_content(metadata_mode=MetadataMode.EMBED) for node in nodes]
+            )
+            for node, node_embedding in zip(nodes, embeddings):
+                node.embedding = node_embedding
+            total_nodes += len(nodes)
+            total_batches += math.ceil(len(nodes) / EMBED_BATCH_SIZE)
+            total_tokens += sum(len(tokenizer(node.get_content())) for node in nodes)
+
+            retriever = BatchRetriever(nodes, embed_model, similarity_top_k=top_k)
+            for (parameter_type, parameter), needed in questions.items():
+                results = retriever.retrieve(queries[parameter_type](parameter))
+                context = "\n".join(result.node.get_content() for result in results)
+                asked[parameter] = asked.get(parameter, 0) + 1
+                hits[parameter] = hits.get(parameter, 0) + all(line in context for line in needed)
+
+        rates = ", ".join(f"{parameter} {hits[parameter] / asked[parameter]:.0%}" for parameter in asked)
+        overall = sum(hits.values()) / sum(asked.values())
+        print(f"{label:<18}{total_nodes / resumes:>14.1f}{total_batches / resumes:>16.1f}"
+              f"{total_tokens / total_nodes:>13.0f}  {overall:.0%} ({rates})")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Compare resume chunkers on embedding calls and retrieval hit rate.")
+    parser.add_argument("--resumes", type=int, default=100)
+    parser.add_argument("--top-k", type=int, default=2, help="Chunks retrieved per question (the engine uses 2)")
+    parser.add_argument("--embedding", choices=["hash", "gemini", "local", "keyword"], default="hash")
+    args = parser.parse_args()
+    run_benchmark(args.resumes, args.top_k, args.embedding)
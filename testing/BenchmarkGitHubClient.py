@@ -0,0 +1,140 @@
+#IGNORE, BENCHMARK ONLY
+#Shared GitHubClient against the previous one-requests.get-per-call approach,
+#run against the local stub in testing/GitHubStubServer.py (no token or network).
+#
+#   python testing/BenchmarkGitHubClient.py --repos 250 --links 40 --latency-ms 30
+#
+#Reports:
+#  - pagination: repos returned by an unpaginated GET vs get_all()
+#  - fan-out: wall time and TCP connections for fetching --links repo details
+#    one after another with fresh connections vs GitHubClient.map()
+#  - crawl: RepoCrawler over the stub's linked-repo tree (--depth levels) with
+#    one request in flight vs --workers, and with a request budget
+#  - response cache: GitHub quota used by a cold run, a warm run and a run
+#    after every entry went stale (revalidated with ETags, 304s are free)
+#  - rate limit: with a tiny quota and a short window the client waits for
+#    X-RateLimit-Reset instead of returning 403s
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+# Add project root to Python path
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+if project_root not in sys.path:
+    sys.path.append(project_root)
+
+
+def run_benchmark(repos, links, latency_ms, workers, depth):
+    import requests
+    from core.GitHub import GitHubClient, CrawlLinkedRepos
+    from testing.GitHubStubServer import StartStubServer
+
+    server, base_url = StartStubServer(repos=repos, latency=latency_ms / 1000)
+    state = server.state
+    client = GitHubClient(base_url=base_url, max_workers=workers, use_cache=False)
+
+    # Pagination
+    unpaginated = requests.get(f"{base_url}/users/candidate/repos").json()
+    paginated = client.get_all("users/candidate/repos")
+    print(f"Pagination: plain GET {len(unpaginated)} repos, get_all {len(paginated)} of {repos}")
+
+    names = [f"repo-{i}" for i in range(links)]
+
+    # Sequential, a new connection per request
+    before_connections = len(state.connections)
+    start = time.perf_counter()
+    sequential = [requests.get(f"{base_url}/repos/candidate/{name}").json() for name in names]
+    sequential_time = time.perf_counter() - start
+    sequential_connections = len(state.connections) - before_connections
+
+    # Pooled and concurrent
+    before_connections = len(state.connections)
+    start = time.perf_counter()
+    concurrent = client.map(lambda name: client.get_json(f"repos/candidate/{name}"), names)
+    concurrent_time = time.perf_counter() - start
+    concurrent_connections = len(state.connections) - before_connections
+    assert [repo["name"] for repo in concurrent] == [repo["name"] for repo in sequential]
+
+    print(f"Fan-out of {links} repo lookups at {latency_ms:.0f} ms latency:")
+    print(f"  sequential requests.get  {sequential_time:7.3f}s  {sequential_connections} connections")
+    print(f"  GitHubClient.map ({workers} workers) {concurrent_time:7.3f}s  {concurrent_connections} connections"
+          f"  ({sequential_time / concurrent_time:.1f}x)")
+
+    # Crawl from repo-0's links; READMEs also link back to parents and to themselves
+    seeds = ["https://github.com/candidate/repo-1", "github.com/Candidate/repo-2.git"]
+    print(f"Crawl to depth {depth} from repo-0:")
+    timings = {}
+    for label, concurrency in (("1 in flight", 1), (f"{workers} in flight", workers)):
+        start = time.perf_counter()
+        graph = CrawlLinkedRepos(seeds, root="candidate/repo-0", client=client, max_depth=depth,
+                                 max_concurrency=concurrency, max_requests=10000)
+        timings[label] = time.perf_counter() - start
+        print(f"  {label:<14}{timings[label]:7.3f}s  {len(graph['nodes'])} repos, {len(graph['edges'])} links, "
+              f"{graph['requests']} requests")
+    print(f"  speed-up {timings['1 in flight'] / timings[f'{workers} in flight']:.1f}x")
+    graph = CrawlLinkedRepos(seeds, root="candidate/repo-0", client=client, max_depth=depth, max_requests=20)
+    fetched = sum(1 for node in graph["nodes"].values() if node["details"])
+    print(f"  budget 20: {graph['requests']} requests, {fetched} repos fetched, budget_exhausted={graph['budget_exhausted']}")
+    server.shutdown()
+
+    run_cache_benchmark(repos, latency_ms, workers)
+
+    # Rate limit: 5 requests per 2 s window, 12 requests
+    server, base_url = StartStubServer(repos=repos, quota=5, window=2.0)
+    client = GitHubClient(base_url=base_url, max_workers=1, use_cache=False)
+    start = time.perf_counter()
+    statuses = [client.get(f"repos/candidate/repo-{i}").status_code for i in range(12)]
+    print(f"Rate limit (quota 5 per 2s): 12 requests, statuses {sorted(set(statuses))}, "
+          f"{time.perf_counter() - start:.1f}s, stub saw {server.state.requests} requests")
+    server.shutdown()
+
+
+def run_cache_benchmark(repos, latency_ms, workers):
+    """Repo list, then details, commits and README of every repo, three times over one cache."""
+    from core.GitHub import GitHubClient
+    from core.GitHub.ResponseCache import GitHubResponseCache
+    from testing.GitHubStubServer import StartStubServer
+
+    server, base_url = StartStubServer(repos=repos, latency=latency_ms / 1000)
+    state = server.state
+    with tempfile.TemporaryDirectory() as directory:
+        cache = GitHubResponseCache(os.path.join(directory, "github.sqlite3"))
+        client = GitHubClient(base_url=base_url, max_workers=workers, cache=cache)
+
+        def fetch_all(_):
+            names = [repo["name"] for repo in client.get_all("users/candidate/repos")]
+            client.map(lambda name: (client.get(f"repos/candidate/{name}"),
+                                     client.get_all(f"repos/candidate/{name}/commits", params={"author": "candidate"}),
+                                     client.get(f"repos/candidate/{name}/contents/README.md")), names)
+
+        print(f"Response cache ({repos} repos: list, details, commits, README):")
+        for label in ("cold", "warm", "stale"):
+            if label == "stale":
+                cache._connect().execute("UPDATE responses SET expires_at = 0")
+            requests_before, quota_before, not_modified_before = state.requests, state.remaining, state.not_modified
+            start = time.perf_counter()
+            fetch_all(None)
+            print(f"  {label:<6}{time.perf_counter() - start:7.3f}s  {state.requests - requests_before:5d} requests, "
+                  f"{state.not_modified - not_modified_before:5d} answered 304, "
+                  f"{quota_before - state.remaining:5d} quota used")
+        stats = cache.stats()
+        print(f"  cache: {stats['fresh_hits']} fresh hits, {stats['revalidated']} revalidated, {stats['misses']} misses, "
+              f"quota saved {stats['hit_rate']:.0%}")
+    server.shutdown()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark the shared GitHub client against a local stub.")
+    parser.add_argument("--repos", type=int, default=250)
+    parser.add_argument("--links", type=int, default=40)
+    parser.add_argument("--latency-ms", type=float, default=30)
+    parser.add_argument("--workers", type=int, default=8)
+    parser.add_argument("--depth", type=int, default=4, help="Crawl depth for the linked-repo crawl")
+    args = parser.parse_args()
+    # The stub enforces its own quota; lift the local "github" budget so runs are not paced by it
+    from interfaces.utils.RateLimiter import GetRateLimiter
+    GetRateLimiter("github", max_requests=10**9, window_size=1)
+    run_benchmark(args.repos, args.links, args.latency_ms, args.workers, args.depth)
@@ -0,0 +1,103 @@
+#IGNORE, BENCHMARK ONLY
+#Cold-start import cost of the scoring stack, measured with `python -X importtime`
+#in a fresh interpreter per module. Exits non-zero when a module goes over its
+#budget or pulls in something that must stay deferred, so it can gate CI;
+#tests/test_import_time.py runs the same check under pytest.
+#
+#   python testing/BenchmarkImportTime.py
+#   python testing/BenchmarkImportTime.py --top 15 --budget-scale 2
+
+import argparse
+import os
+import subprocess
+import sys
+
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+
+# Module -> cumulative import budget in milliseconds
+BUDGETS_MS = {
+    "core.ModelInitializers.Model": 400,
+    "core.ScoreCalculators.ScoreCalculators": 400,
+    "core.ScoreCalculators.ScoringEngine": 400,
+    "interfaces.admin.ClassificationModel": 400,
+    "interfaces.utils.ParameterManager": 150,
+}
+
+# Heavy or server-irrelevant modules that must only load when a client is first used
+DEFERRED_MODULES = [
+    "IPython",
+    "google.generativeai",
+    "llama_index.llms.gemini",
+    "llama_index.embeddings.gemini",
+    "llama_index.core",
+]
+
+
+def measure_import(module):
+    """Return ({imported module: cumulative microseconds}, total microseconds) for one cold import."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=project_root, capture_output=True, text=True
+    )
+    if result.returncode != 0:
+        raise RuntimeError(f"Importing {module} failed:\n{result.stderr[-2000:]}")
+
+    # Lines are in post-order: a module's own imports are listed just before it, indented deeper
+    rows = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        fields = line[len("import time:"):].split("|")
+        try:
+            cumulative_us = int(fields[1].strip())
+        except ValueError:
+            continue  # header line
+        name = fields[2].rstrip()
+        rows.append((len(name) - len(name.lstrip()), name.strip(), cumulative_us))
+
+    target = max(i for i, (_, name, _) in enumerate(rows) if name == module)
+    target_indent = rows[target][0]
+    cumulative = {module: rows[target][2]}
+    i = target - 1
+    # Interpreter start-up imports (site, encodings, ...) are not attributed to the module
+    while i >= 0 and rows[i][0] > target_indent:
+        cumulative[rows[i][1]] = rows[i][2]
+        i -= 1
+    return cumulative, cumulative[module]
+
+
+def run_benchmark(top, budget_scale):
+    failures = []
+    for module, budget_ms in BUDGETS_MS.items():
+        cumulative, total_us = measure_import(module)
+        budget_ms *= budget_scale
+        print(f"{module}: {total_us / 1000:.1f} ms (budget {budget_ms:.0f} ms)")
+
+        heaviest = sorted(
+            ((name, us) for name, us in cumulative.items() if name != module),
+            key=lambda item: item[1], reverse=True
+        )[:top]
+        for name, us in heaviest:
+            print(f"    {us / 1000:8.1f} ms  {name}")
+
+        if total_us / 1000 > budget_ms:
+            failures.append(f"{module} took {total_us / 1000:.1f} ms, budget {budget_ms:.0f} ms")
+        for deferred in DEFERRED_MODULES:
+            if deferred in cumulative:
+                failures.append(f"{module} imports {deferred} at import time")
+
+    if failures:
+        print("\nImport-time regressions:")
+        for failure in failures:
+            print(f"  - {failure}")
+        return 1
+    print("\nAll modules within their import budgets.")
+    return 0
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Measure cold-start import time of the scoring stack.")
+    parser.add_argument("--top", type=int, default=5, help="Heaviest dependencies listed per module")
+    parser.add_argument("--budget-scale", type=float, default=1.0, help="Multiply every budget, for slow CI machines")
+    args = parser.parse_args()
+    sys.exit(run_benchmark(args.top, args.budget_scale))
@@ -0,0 +1,105 @@
+#IGNORE, BENCHMARK ONLY
+#In-memory PDF parsing (DataIngestion.IterPdfDocuments) against the old
+#write-temp_upload.pdf-then-read-it-back path, on synthetic resumes.
+#
+#   python testing/BenchmarkIngestion.py --resumes 200 --workers 8
+#
+#The old path is reproduced with PyPDF2 reading the fixed-name file, since
+#SimpleDirectoryReader needs llama-index-readers-file for PDFs; "+ Documents"
+#adds building the llama-index Documents LoadDocument returns. "mixed up"
+#counts results whose text belongs to a different resume when uploads are
+#ingested concurrently.
+
+import argparse
+import io
+import os
+import sys
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+# Add project root to Python path
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+if project_root not in sys.path:
+    sys.path.append(project_root)
+
+
+def _escape(text):
+    return text.replace("\\", "\\\\").replace("(", "\\(").replace(")", "\\)").encode("latin-1", "replace").decode("latin-1")
+
+
+def make_pdf(pages):
+    """Minimal text-only PDF, one Helvetica text block per page."""
+    objects = ["<< /Type /Catalog /Pages 2 0 R >>",
+               f"<< /Type /Pages /Kids [{' '.join(f'{3 + 2 * i} 0 R' for i in range(len(pages)))}] /Count {len(pages)} >>"]
+    font = 3 + 2 * len(pages)
+    for i, page in enumerate(pages):
+        content = "BT /F1 10 Tf 40 800 Td 12 TL " + " ".join(f"({_escape(line)}) '" for line in page.splitlines()) + " ET"
+        objects.append(f"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 842] /Contents {4 + 2 * i} 0 R "
+                       f"/Resources << /Font << /F1 {font} 0 R >> >> >>")
+        objects.append(f"<< /Length {len(content)} >>\nstream\n{content}\nendstream")
+    objects.append("<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>")
+
+    out, offsets = "%PDF-1.4\n", []
+    for number, body in enumerate(objects, 1):
+        offsets.append(len(out))
+        out += f"{number} 0 obj\n{body}\nendobj\n"
+    xref = len(out)
+    out += f"xref\n0 {len(objects) + 1}\n0000000000 65535 f \n" + "".join(f"{offset:010d} 00000 n \n" for offset in offsets)
+    out += f"trailer\n<< /Size {len(objects) + 1} /Root 1 0 R >>\nstartxref\n{xref}\n%%EOF\n"
+    return out.encode("latin-1")
+
+
+def run_benchmark(resumes, workers):
+    from PyPDF2 import PdfReader
+    from core.ModelInitializers.DataIngestion import IterPdfDocuments
+    from testing.BenchmarkChunking import synthetic_resume
+
+    uploads = [make_pdf(synthetic_resume(seed)[0]) for seed in range(resumes)]
+    directory = tempfile.mkdtemp()
+    fixed_path = os.path.join(directory, "temp_upload.pdf")
+
+    def temp_file(data):
+        with open(fixed_path, "wb") as f:
+            f.write(data)
+        texts = [page.extract_text() for page in PdfReader(fixed_path).pages]
+        try:
+            os.remove(fixed_path)
+        except FileNotFoundError:
+            pass
+        return texts
+
+    def in_memory(data):
+        return [page.extract_text() for page in PdfReader(io.BytesIO(data)).pages]
+
+    def documents(data):
+        return [doc.text for doc in IterPdfDocuments(io.BytesIO(data))]
+
+    print(f"{'path':<12}{'sequential':>12}{'concurrent':>12}{'mixed up':>10}")
+    for label, load in (("temp file", temp_file), ("in memory", in_memory), ("+ Documents", documents)):
+        start = time.perf_counter()
+        for data in uploads:
+            load(data)
+        sequential = time.perf_counter() - start
+
+        def safe_load(data):
+            try:
+                return load(data)
+            except Exception:
+                return []
+
+        start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            results = list(executor.map(safe_load, uploads))
+        concurrent = time.perf_counter() - start
+        mixed = sum(1 for seed, texts in enumerate(results) if not texts or f"Candidate {seed}\n" not in texts[0] + "\n")
+        print(f"{label:<12}{sequential / resumes * 1000:>10.2f}ms{concurrent / resumes * 1000:>10.2f}ms{mixed:>10}")
+    os.rmdir(directory)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Compare in-memory PDF ingestion with the temp-file path.")
+    parser.add_argument("--resumes", type=int, default=200)
+    parser.add_argument("--workers", type=int, default=8)
+    args = parser.parse_args()
+    run_benchmark(args.resumes, args.workers)
@@ -0,0 +1,192 @@
+#IGNORE, BENCHMARK ONLY
+#End-to-end scoring throughput against the offline replay backends, no network needed.
+#
+#   python testing/BenchmarkPipeline.py --resumes 50 --workers 4 --latency-ms 300 --jitter-ms 100 --rate-429 0.02
+#
+#Responses recorded with SMARTHIRE_BACKEND=record are replayed from --cassette;
+#anything not recorded is answered by the deterministic stand-ins.
+#--resubmissions N then scores N lightly edited copies of the resumes (an added
+#bullet or a changed date), once through the near-duplicate index and once
+#from scratch, and compares backend calls.
+
+import argparse
+import os
+import random
+import statistics
+import sys
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+# Add project root to Python path
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+if project_root not in sys.path:
+    sys.path.append(project_root)
+
+os.environ["SMARTHIRE_BACKEND"] = "replay"
+
+SKILLS = ["Python", "Java", "AWS", "Docker", "Kubernetes", "React", "SQL", "TensorFlow", "Go", "Terraform"]
+COMPANIES = ["Acme Corp", "Globex", "Initech", "Umbrella", "Stark Industries"]
+
+PARAMETERS = {
+    "years_of_experience": {"type": "quantitative", "weight": 8.0, "max_value": 10.0, "benefit_type": "higher", "description": "Years of Experience"},
+    "gpa": {"type": "quantitative", "weight": 4.0, "max_value": 10.0, "benefit_type": "higher", "description": "GPA"},
+    "has_aws_certification": {"type": "boolean", "weight": 5.0, "max_value": None, "benefit_type": "lower", "description": "Has AWS Certification"},
+    "knows_docker": {"type": "boolean", "weight": 3.0, "max_value": None, "benefit_type": "lower", "description": "Knows Docker"},
+    "proficiency_in_python": {"type": "textual", "weight": 6.0, "max_value": None, "benefit_type": "lower", "description": "Proficiency in Python"},
+    "knowledge_in_ml": {"type": "textual", "weight": 4.0, "max_value": None, "benefit_type": "lower", "description": "Knowledge in ML"},
+}
+
+
+def synthetic_resume(seed):
+    rng = random.Random(seed)
+    skills = rng.sample(SKILLS, 5)
+    lines = [f"Candidate {seed}", "EXPERIENCE"]
+    for _ in range(rng.randint(2, 4)):
+        lines.append(f"- Software Engineer at {rng.choice(COMPANIES)}, {rng.randint(2012, 2020)} - {rng.randint(2021, 2024)}")
+        lines.append(f"- Built services in {rng.choice(skills)} and {rng.choice(skills)} serving {rng.randint(1, 90)}k users")
+    lines += ["EDUCATION", f"- B.Tech Computer Science, CGPA {rng.uniform(6, 10):.2f}/10"]
+    lines += ["SKILLS", "- " + ", ".join(skills)]
+    if rng.random() < 0.4:
+        lines += ["CERTIFICATIONS", "- AWS Certified Solutions Architect"]
+    return "\n".join(lines)
+
+
+EDITS = [
+    lambda text: text.replace("\nEDUCATION", "\n- Organised team offsites and onboarding sessions\nEDUCATION"),
+    lambda text: text.replace("\nPROJECTS", "\n- Mentored two interns through their first production launch\nPROJECTS"),
+]
+
+
+def full_resume(seed):
+    """A full-length two-page resume (the short synthetic_resume above is too small to edit realistically)."""
+    from testing.BenchmarkChunking import synthetic_resume as chunking_resume
+    return "\n".join(chunking_resume(seed)[0])
+
+
+def run_benchmark(resumes, workers, parameter_workers, resubmissions=0):
+    from llama_index.core import Document
+    from core.Backends import GetSimulatedNetwork
+    from core.ModelInitializers.EmbeddingCache import GetEmbeddingStore
+    from core.ModelInitializers.Model import LoadModel
+    from core.ModelInitializers.Embedding import DownloadGeminiEmbedding
+    from core.ScoreCalculators.ScoringEngine import ScoreResume
+
+    os.environ.setdefault("FINETUNED_API_KEY", "replay")
+    model = LoadModel()
+
+    def score_one(seed):
+        start = time.perf_counter()
+        documents = [Document(text=synthetic_resume(seed))]
+        resume_text = " ".join([doc.text for doc in documents])
+        # Passed as a factory so ScoreResume retries simulated 429s while indexing
+        query_engine = lambda: DownloadGeminiEmbedding(model, documents, persist_root=None)
+        result = ScoreResume(PARAMETERS, query_engine, resume_text, max_workers=parameter_workers)
+        return time.perf_counter() - start, result
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        results = list(executor.map(score_one, range(resumes)))
+    elapsed = time.perf_counter() - start
+
+    latencies = sorted(latency for latency, _ in results)
+    network = GetSimulatedNetwork().stats()
+    print(f"Resumes:            {resumes} ({workers} in parallel, {parameter_workers} parameter workers each)")
+    print(f"Wall time:          {elapsed:.2f} s")
+    print(f"Throughput:         {resumes / elapsed:.2f} resumes/s")
+    print(f"Latency p50 / p95:  {statistics.median(latencies):.3f} s / {latencies[int(0.95 * (len(latencies) - 1))]:.3f} s")
+    print(f"Backend calls:      {network['calls']} ({network['calls'] / resumes:.1f} per resume)")
+    print(f"Simulated 429s:     {network['rate_limited']}")
+    failed = sum(len(result["errors"]) for _, result in results)
+    print(f"Failed parameters:  {failed} (429s that outlasted the retries)")
+    scored = [details for _, result in results for details in result["scores"].values()]
+    from_rules = sum(1 for details in scored if details.get("source") == "rules")
+    print(f"Rule fast path:     {from_rules} of {len(scored)} parameters answered without the LLM")
+    embedding_store = GetEmbeddingStore()
+    if embedding_store is not None:
+        cache = embedding_store.stats()
+        print(f"Embedding cache:    {cache['hit_rate']:.0%} of {cache['requested']} embeddings served without a call")
+
+    if resubmissions:
+        run_resubmissions(model, resubmissions, parameter_workers)
+
+
+def run_resubmissions(model, count, parameter_workers):
+    """
+    Score full-length resumes into a near-duplicate index, then score edited
+    copies of them with and without reusing the originals' scores.
+    """
+    from llama_index.core import Document
+    from core.Backends import GetSimulatedNetwork
+    from core.ModelInitializers.Embedding import DownloadGeminiEmbedding
+    from core.Pipeline.NearDuplicates import NearDuplicateIndex
+    from core.ScoreCalculators.ScoringEngine import ScoreResume, ReusableScores
+
+    def engine_for(text):
+        return lambda: DownloadGeminiEmbedding(model, [Document(text=text)], persist_root=None)
+
+    index = NearDuplicateIndex(os.path.join(tempfile.mkdtemp(), "near_duplicates.sqlite3"))
+    originals = 1000 + max(1, count // 2)
+    for seed in range(1000, originals):
+        text = full_resume(seed)
+        result = ScoreResume(PARAMETERS, engine_for(text), text, max_workers=parameter_workers)
+        index.add(f"resume-{seed}", text, result["scores"])
+    edited = [EDITS[i % len(EDITS)](full_resume(1000 + i % (originals - 1000))) for i in range(count)]
+
+    network = GetSimulatedNetwork()
+    calls = network.stats()["calls"]
+    matched = reused = 0
+    for text in edited:
+        match = index.find(text)
+        reused_scores = ReusableScores(PARAMETERS, match["scores"], match["changed_lines"]) if match else {}
+        matched += match is not None
+        reused += len(reused_scores)
+        ScoreResume(PARAMETERS, engine_for(text), text, max_workers=parameter_workers, reused_scores=reused_scores)
+    with_index = network.stats()["calls"] - calls
+
+    calls = network.stats()["calls"]
+    for text in edited:
+        ScoreResume(PARAMETERS, engine_for(text), text, max_workers=parameter_workers)
+    from_scratch = network.stats()["calls"] - calls
+
+    print(f"Resubmissions:      {count} edited copies, {matched} matched as near-duplicates, "
+          f"{reused} parameter scores reused")
+    print(f"  backend calls:    {with_index / count:.1f} per resume with the index, {from_scratch / count:.1f} from scratch")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark the scoring pipeline offline.")
+    parser.add_argument("--resumes", type=int, default=20)
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--parameter-workers", type=int, default=8)
+    parser.add_argument("--latency-ms", type=float, default=200.0)
+    parser.add_argument("--jitter-ms", type=float, default=50.0)
+    parser.add_argument("--rate-429", type=float, default=0.0)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--resubmissions", type=int, default=0,
+                        help="Also score this many edited copies with and without the near-duplicate index")
+    parser.add_argument("--cassette", help="Recorded responses to replay")
+    parser.add_argument("--embedding-cache", default="fresh",
+                        help="'fresh' (empty temporary cache), 'off', or the path of an embedding cache to use")
+    parser.add_argument("--respect-rate-limits", action="store_true",
+                        help="Keep the production RateLimiter budgets instead of lifting them")
+    args = parser.parse_args()
+
+    os.environ["SMARTHIRE_REPLAY_LATENCY_MS"] = str(args.latency_ms)
+    os.environ["SMARTHIRE_REPLAY_JITTER_MS"] = str(args.jitter_ms)
+    os.environ["SMARTHIRE_REPLAY_429_RATE"] = str(args.rate_429)
+    os.environ["SMARTHIRE_REPLAY_SEED"] = str(args.seed)
+    if args.cassette:
+        os.environ["SMARTHIRE_CASSETTE"] = args.cassette
+    if args.embedding_cache == "fresh":
+        os.environ["EMBEDDING_CACHE_DB"] = os.path.join(tempfile.mkdtemp(), "embeddings.sqlite3")
+    else:
+        os.environ["EMBEDDING_CACHE_DB"] = "" if args.embedding_cache == "off" else args.embedding_cache
+
+    if not args.respect_rate_limits:
+        # Limiters are created on first use, so lift the budgets before the scorers import them
+        from interfaces.utils.RateLimiter import GetRateLimiter
+        for key in ("gemini_llm", "gemini_embedding"):
+            GetRateLimiter(key, max_requests=10**9, window_size=1)
+
+    run_benchmark(args.resumes, args.workers, args.parameter_workers, args.resubmissions)
@@ -0,0 +1,95 @@
+#IGNORE, BENCHMARK ONLY
+#Ranking candidate pools with CandidateRanking, from 1k to 1M candidates.
+#
+#   python testing/BenchmarkRanking.py --pools 1000 10000 100000 1000000 --parameters 20 --top 50
+#
+#Random raw scores (2% missing, every third parameter boolean). Times weighted
+#totals, top-K with a required boolean parameter, and per-parameter percentile
+#ranks, and compares top-K with sorting the pool in Python (up to 100k).
+
+import argparse
+import heapq
+import os
+import sys
+import time
+
+# Add project root to Python path
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+if project_root not in sys.path:
+    sys.path.append(project_root)
+
+TYPES = ["quantitative", "boolean", "textual"]
+
+
+def make_pool(candidates, parameters, seed=0):
+    import numpy as np
+    rng = np.random.default_rng(seed)
+    details = {
+        f"parameter_{i}": {"type": TYPES[i % 3], "weight": float(rng.integers(1, 11)), "max_value": 10.0,
+                           "benefit_type": "higher", "description": f"Parameter {i}"}
+        for i in range(parameters)
+    }
+    matrix = rng.uniform(0, 100, (candidates, parameters))
+    for column, name in enumerate(details):
+        if details[name]["type"] == "boolean":
+            matrix[:, column] = np.where(matrix[:, column] > 40, 100.0, 0.0)
+    matrix[rng.random(matrix.shape) < 0.02] = np.nan
+    return [f"candidate-{i}" for i in range(candidates)], details, matrix
+
+
+def timed(fn, repeat):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn()
+        best = min(best, time.perf_counter() - start)
+    return best * 1000, result
+
+
+def run_benchmark(pools, parameters, top):
+    import numpy as np
+    from core.Pipeline.CandidateRanking import CandidateRanking
+
+    print(f"{'candidates':>10}{'totals':>10}{'top-K':>10}{'filtered':>10}{'percentiles':>13}{'python sort':>13}")
+    for candidates in pools:
+        ids, details, matrix = make_pool(candidates, parameters)
+        ranking = CandidateRanking(ids, details, matrix)
+        required = next(name for name in details if details[name]["type"] == "boolean")
+        repeat = 5 if candidates <= 100000 else 2
+
+        totals_ms, totals = timed(lambda: ranking.totals(ranking.weights * 1.0), repeat)
+        top_ms, best = timed(lambda: ranking.top_k(top), repeat)
+        filtered_ms, _ = timed(lambda: ranking.top_k(top, require=[required]), repeat)
+        percentile_ms, _ = timed(ranking.percentile_ranks, 1)
+
+        python_ms = float("nan")
+        if candidates <= 100000:
+            rows = matrix.tolist()
+            weights = ranking.weights.tolist()
+
+            def python_top():
+                scored = []
+                for i, row in enumerate(rows):
+                    weighted = total = 0.0
+                    for score, weight in zip(row, weights):
+                        if score == score and weight > 0:
+                            weighted += score * weight
+                            total += weight
+                    if total:
+                        scored.append((weighted / total, -i))
+                return heapq.nlargest(top, scored)
+            python_ms, python_best = timed(python_top, 1)
+            assert [ids[-i] for _, i in python_best] == [entry["candidate"] for entry in best]
+
+        assert np.allclose(totals, ranking.totals(), equal_nan=True)
+        print(f"{candidates:>10}{totals_ms:>8.1f}ms{top_ms:>8.1f}ms{filtered_ms:>8.1f}ms{percentile_ms:>11.1f}ms"
+              f"{python_ms:>11.1f}ms")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark vectorized candidate ranking.")
+    parser.add_argument("--pools", type=int, nargs="+", default=[1000, 10000, 100000, 1000000])
+    parser.add_argument("--parameters", type=int, default=20)
+    parser.add_argument("--top", type=int, default=50)
+    args = parser.parse_args()
+    run_benchmark(args.pools, args.parameters, args.top)
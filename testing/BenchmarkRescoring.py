@@ -0,0 +1,124 @@
+#IGNORE, BENCHMARK ONLY
+#Incremental re-scoring of stored candidates after a parameter change, against
+#the offline replay backends.
+#
+#   python testing/BenchmarkRescoring.py --resumes 30 --latency-ms 200 --jitter-ms 50
+#
+#Scores full-length resumes on 20 parameters into a temporary ScoreStore, then
+#applies three parameter changes (one added, one edited, weights only) and
+#compares IncrementalRescoring with scoring every candidate from scratch.
+
+import argparse
+import copy
+import os
+import sys
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+# Add project root to Python path
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+if project_root not in sys.path:
+    sys.path.append(project_root)
+
+os.environ["SMARTHIRE_BACKEND"] = "replay"
+
+
+def parameter_set(count=20):
+    from testing.BenchmarkPipeline import PARAMETERS, SKILLS
+    parameters = copy.deepcopy(PARAMETERS)
+    for skill in SKILLS:
+        for name, details in ((f"proficiency_in_{skill.lower()}", {"type": "textual", "weight": 3.0,
+                                                                   "description": f"Proficiency in {skill}"}),
+                              (f"knows_{skill.lower()}", {"type": "boolean", "weight": 2.0, "description": f"Knows {skill}"})):
+            if len(parameters) < count:
+                parameters.setdefault(name, dict(details, max_value=None, benefit_type="lower"))
+    return parameters
+
+
+def run_benchmark(resumes, workers):
+    from llama_index.core import Document
+    from core.Backends import GetSimulatedNetwork
+    from core.ModelInitializers.Embedding import DownloadGeminiEmbedding
+    from core.ModelInitializers.Model import LoadModel
+    from core.Pipeline.IncrementalRescoring import RescoreStoredResumes
+    from core.Pipeline.ScoreStore import ScoreStore
+    from core.ScoreCalculators.ScoringEngine import ScoreResume
+    from interfaces.utils.ParameterManager import DiffParameters
+    from testing.BenchmarkPipeline import full_resume
+
+    os.environ.setdefault("FINETUNED_API_KEY", "replay")
+    model = LoadModel()
+    network = GetSimulatedNetwork()
+    store = ScoreStore(os.path.join(tempfile.mkdtemp(), "scores.sqlite3"))
+    texts = {f"resume-{seed}": full_resume(seed) for seed in range(resumes)}
+
+    def score_all(parameters, store_scores):
+        def score_one(item):
+            resume_hash, text = item
+            engine = lambda: DownloadGeminiEmbedding(model, [Document(text=text)], persist_root=None)
+            result = ScoreResume(parameters, engine, text, max_workers=4)
+            if store_scores:
+                store.put_scores(resume_hash, result["scores"], text=text)
+            return result
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(score_one, texts.items()))
+
+    parameters = parameter_set()
+    start = time.perf_counter()
+    score_all(parameters, store_scores=True)
+    print(f"Initial scoring:    {resumes} resumes x {len(parameters)} parameters in {time.perf_counter() - start:.2f} s")
+
+    added = dict(parameters, leadership_experience={"type": "textual", "weight": 4.0, "max_value": None,
+                                                    "benefit_type": "lower", "description": "Leadership Experience"})
+    edited = copy.deepcopy(added)
+    edited["gpa"]["max_value"] = 4.0
+    reweighted = copy.deepcopy(edited)
+    for name in list(reweighted)[:5]:
+        reweighted[name]["weight"] = reweighted[name]["weight"] * 2
+
+    print(f"{'change':<14}{'evaluations':>13}{'calls':>8}{'seconds':>9}   {'from scratch':>12}{'calls':>8}{'seconds':>9}")
+    previous = parameters
+    for label, changed in (("add one", added), ("edit one", edited), ("weights only", reweighted)):
+        diff = DiffParameters(previous, changed)
+        calls = network.stats()["calls"]
+        start = time.perf_counter()
+        summary = RescoreStoredResumes(changed, score_store=store, model=model, max_workers=workers)
+        incremental = (time.perf_counter() - start, network.stats()["calls"] - calls)
+
+        calls = network.stats()["calls"]
+        start = time.perf_counter()
+        scratch = score_all(changed, store_scores=False)
+        from_scratch = (time.perf_counter() - start, network.stats()["calls"] - calls)
+        evaluations = sum(len(result["scores"]) + len(result["errors"]) for result in scratch)
+
+        # The merged scores must match scoring from scratch
+        _, totals = store.weighted_totals(changed)
+        expected = sorted(result["final_score"] for result in scratch)
+        assert max(abs(a - b) for a, b in zip(sorted(totals), expected)) < 1e-6
+
+        print(f"{label:<14}{summary['evaluations'] / resumes:>10.1f}/cv{incremental[1]:>8}{incremental[0]:>9.2f}   "
+              f"{evaluations / resumes:>9.1f}/cv{from_scratch[1]:>8}{from_scratch[0]:>9.2f}   "
+              f"({', '.join(f'{key} {len(names)}' for key, names in diff.items() if names and key != 'unchanged')})")
+        previous = changed
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark incremental re-scoring after parameter changes.")
+    parser.add_argument("--resumes", type=int, default=30)
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--latency-ms", type=float, default=200.0)
+    parser.add_argument("--jitter-ms", type=float, default=50.0)
+    args = parser.parse_args()
+
+    os.environ["SMARTHIRE_REPLAY_LATENCY_MS"] = str(args.latency_ms)
+    os.environ["SMARTHIRE_REPLAY_JITTER_MS"] = str(args.jitter_ms)
+    os.environ["EMBEDDING_CACHE_DB"] = ""
+    os.environ["SCORE_STORE_DB"] = ""
+
+    # Limiters are created on first use, so lift the budgets before the scorers import them
+    from interfaces.utils.RateLimiter import GetRateLimiter
+    for key in ("gemini_llm", "gemini_embedding"):
+        GetRateLimiter(key, max_requests=10**9, window_size=1)
+
+    run_benchmark(args.resumes, args.workers)
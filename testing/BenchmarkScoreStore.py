@@ -0,0 +1,86 @@
+#IGNORE, BENCHMARK ONLY
+#Re-ranking stored candidates under new weights from the ScoreStore, no LLM calls.
+#
+#   python testing/BenchmarkScoreStore.py --candidates 5000 --parameters 20 --reweights 100
+#
+#Fills a temporary store with random raw scores (a few missing), then times the
+#first matrix load (one SQL query), re-weighting from the cached matrix, and the
+#same re-weighting done per candidate in Python for comparison.
+
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+
+# Add project root to Python path
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+if project_root not in sys.path:
+    sys.path.append(project_root)
+
+TYPES = ["quantitative", "boolean", "textual"]
+
+
+def run_benchmark(candidates, parameters, reweights):
+    import numpy as np
+    from core.Pipeline.ScoreStore import ScoreStore
+    from interfaces.utils.ParameterManager import ParameterDefinitionHash
+
+    rng = random.Random(0)
+    details = {
+        f"parameter_{i}": {"type": TYPES[i % 3], "weight": float(rng.randint(1, 10)), "max_value": 10.0,
+                           "benefit_type": "higher", "description": f"Parameter {i}"}
+        for i in range(parameters)
+    }
+    definitions = {name: ParameterDefinitionHash(parameter) for name, parameter in details.items()}
+
+    store = ScoreStore(os.path.join(tempfile.mkdtemp(), "scores.sqlite3"))
+    start = time.perf_counter()
+    stored = {}
+    for candidate in range(candidates):
+        scores = {name: {"raw_score": rng.uniform(0, 100), "definition": definitions[name], "source": "llm"}
+                  for name in details if rng.random() > 0.02}
+        stored[f"{candidate:064x}"] = scores
+        store.put_scores(f"{candidate:064x}", scores, model_id="benchmark")
+    print(f"Stored {candidates} candidates x {parameters} parameters in {time.perf_counter() - start:.2f} s")
+
+    start = time.perf_counter()
+    store.score_matrix(details, model_id="benchmark")
+    print(f"First matrix load:       {(time.perf_counter() - start) * 1000:8.1f} ms (one query)")
+
+    weight_sets = [{name: float(rng.randint(0, 10)) for name in details} for _ in range(reweights)]
+    start = time.perf_counter()
+    for weights in weight_sets:
+        resume_hashes, totals = store.weighted_totals(details, weights, model_id="benchmark")
+        ranking = np.argsort(-np.nan_to_num(totals, nan=-1.0))
+    vectorized = (time.perf_counter() - start) / reweights
+    print(f"Re-weight and rank:      {vectorized * 1000:8.2f} ms per weight vector (cached matrix)")
+
+    start = time.perf_counter()
+    for weights in weight_sets[:max(1, reweights // 10)]:
+        python_totals = {}
+        for resume_hash, scores in stored.items():
+            weighted = total = 0.0
+            for name, entry in scores.items():
+                if weights[name] > 0:
+                    weighted += entry["raw_score"] * weights[name]
+                    total += weights[name]
+            python_totals[resume_hash] = weighted / total if total else None
+        sorted(python_totals, key=lambda key: -(python_totals[key] or -1))
+    per_candidate = (time.perf_counter() - start) / max(1, reweights // 10)
+    print(f"Per-candidate Python:    {per_candidate * 1000:8.2f} ms per weight vector ({per_candidate / vectorized:.0f}x slower)")
+
+    last = weight_sets[max(1, reweights // 10) - 1]
+    resume_hashes, totals = store.weighted_totals(details, last, model_id="benchmark")
+    assert all(abs(total - python_totals[resume_hash]) < 1e-9 for resume_hash, total in zip(resume_hashes, totals)
+               if python_totals[resume_hash] is not None)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark weight-only re-ranking from the score store.")
+    parser.add_argument("--candidates", type=int, default=5000)
+    parser.add_argument("--parameters", type=int, default=20)
+    parser.add_argument("--reweights", type=int, default=100)
+    args = parser.parse_args()
+    run_benchmark(args.candidates, args.parameters, args.reweights)
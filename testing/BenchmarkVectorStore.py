@@ -0,0 +1,112 @@
+#IGNORE, BENCHMARK ONLY
+#Compares load time and resident memory of the JSON SimpleVectorStore against
+#the memory-mapped MemmapVectorStore.
+#
+#   python testing/BenchmarkVectorStore.py --nodes 1000 10000 50000 --dim 768
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+# Add project root to Python path
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+if project_root not in sys.path:
+    sys.path.append(project_root)
+
+STORES = ["json", "memmap"]
+
+
+def resident_memory_mb():
+    """Current RSS of this process in MB (Linux), falling back to peak RSS."""
+    try:
+        with open("/proc/self/status", "r") as file:
+            for line in file:
+                if line.startswith("VmRSS:"):
+                    return int(line.split()[1]) / 1024
+    except OSError:
+        pass
+    import resource
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def build_store(store_type, persist_dir, nodes, dim):
+    import numpy as np
+    from llama_index.core.vector_stores import SimpleVectorStore
+    from core.ModelInitializers.VectorStore import MemmapVectorStore
+
+    store = SimpleVectorStore() if store_type == "json" else MemmapVectorStore()
+    rng = np.random.default_rng(0)
+    embeddings = rng.standard_normal((nodes, dim), dtype=np.float32)
+    for i in range(nodes):
+        node_id = f"node-{i}"
+        store.data.embedding_dict[node_id] = embeddings[i].tolist()
+        store.data.text_id_to_ref_doc_id[node_id] = "resume"
+        store.data.metadata_dict[node_id] = {}
+    store.persist(os.path.join(persist_dir, "default__vector_store.json"))
+
+
+def measure_load(store_type, persist_dir, dim):
+    """Runs in a fresh interpreter so RSS only reflects this one store."""
+    import numpy as np
+    from llama_index.core.vector_stores import SimpleVectorStore
+    from llama_index.core.vector_stores.types import VectorStoreQuery
+    from core.ModelInitializers.VectorStore import MemmapVectorStore
+
+    store_cls = SimpleVectorStore if store_type == "json" else MemmapVectorStore
+    rss_before = resident_memory_mb()
+    start = time.perf_counter()
+    store = store_cls.from_persist_dir(persist_dir)
+    load_seconds = time.perf_counter() - start
+    rss_loaded = resident_memory_mb()
+
+    query = VectorStoreQuery(query_embedding=np.ones(dim, dtype=np.float32).tolist(), similarity_top_k=2)
+    start = time.perf_counter()
+    store.query(query)
+    query_seconds = time.perf_counter() - start
+
+    return {
+        "load_ms": load_seconds * 1000,
+        "first_query_ms": query_seconds * 1000,
+        "rss_after_load_mb": rss_loaded - rss_before,
+        "rss_after_query_mb": resident_memory_mb() - rss_before
+    }
+
+
+def disk_size_kb(persist_dir):
+    return sum(
+        os.path.getsize(os.path.join(persist_dir, name))
+        for name in os.listdir(persist_dir)
+        if name.startswith("default__vector_store")
+    ) / 1024
+
+
+def run_benchmark(node_counts, dim):
+    print(f"{'store':<8}{'nodes':>8}{'disk KB':>12}{'load ms':>12}{'query ms':>12}{'RSS load MB':>14}{'RSS query MB':>14}")
+    for nodes in node_counts:
+        for store_type in STORES:
+            with tempfile.TemporaryDirectory() as persist_dir:
+                build_store(store_type, persist_dir, nodes, dim)
+                output = subprocess.run(
+                    [sys.executable, __file__, "--measure", store_type, persist_dir, "--dim", str(dim)],
+                    check=True, capture_output=True, text=True
+                ).stdout
+                result = json.loads(output.strip().splitlines()[-1])
+                print(f"{store_type:<8}{nodes:>8}{disk_size_kb(persist_dir):>12.1f}{result['load_ms']:>12.1f}"
+                      f"{result['first_query_ms']:>12.1f}{result['rss_after_load_mb']:>14.1f}{result['rss_after_query_mb']:>14.1f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark vector store persistence formats.")
+    parser.add_argument("--nodes", type=int, nargs="+", default=[100, 1000, 10000])
+    parser.add_argument("--dim", type=int, default=768)
+    parser.add_argument("--measure", nargs=2, metavar=("STORE", "DIR"), help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.measure:
+        print(json.dumps(measure_load(args.measure[0], args.measure[1], args.dim)))
+    else:
+        run_benchmark(args.nodes, args.dim)
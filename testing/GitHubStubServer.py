@@ -0,0 +1,192 @@
+#IGNORE, BENCHMARK ONLY
+#Local stand-in for the GitHub REST API, for exercising core.GitHub without a
+#token or network access.
+#
+#   python testing/GitHubStubServer.py --port 8765 --repos 250 --latency-ms 20
+#   GITHUB_API_ENDPOINT=http://127.0.0.1:8765 python GitAnalyser/gitSingle.py
+#
+#Serves /users/<user>/repos and /repos/<owner>/<repo>/commits as Link-header
+#paginated lists, /repos/<owner>/<repo> and /repos/<owner>/<repo>/contents/README.md.
+#READMEs link repo-i to repo-(2i+1) and repo-(2i+2), plus back to their parent
+#and themselves in other URL spellings, for crawling.
+#Every response carries X-RateLimit-Limit / -Remaining / -Reset; once the quota
+#is spent requests get 403 until the window resets. Successful responses have an
+#ETag, and a matching If-None-Match gets a 304 that costs no quota, like GitHub. Keep-alive is supported, and
+#the server counts distinct client connections so pooling can be checked.
+
+import argparse
+import base64
+import hashlib
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlencode, urlparse
+
+LAST_MODIFIED = "Mon, 06 Jan 2025 09:00:00 GMT"
+
+
+class StubState:
+    def __init__(self, repos=250, commits=120, latency=0.0, quota=5000, window=3600.0):
+        self.repos = repos
+        self.commits = commits
+        self.latency = latency
+        self.quota = quota
+        self.window = window
+        self.lock = threading.Lock()
+        self.requests = 0
+        self.not_modified = 0
+        self.connections = set()
+        self.reset_window()
+
+    def reset_window(self):
+        self.remaining = self.quota
+        self.reset_at = time.time() + self.window
+
+    def arrive(self, connection):
+        """Count a request; returns False when the quota is spent."""
+        with self.lock:
+            self.requests += 1
+            self.connections.add(connection)
+            if time.time() >= self.reset_at:
+                self.reset_window()
+            return self.remaining > 0
+
+    def charge(self, not_modified=False):
+        """Take one request from the quota unless it was answered with 304; returns (remaining, reset_at)."""
+        with self.lock:
+            if not_modified:
+                self.not_modified += 1
+            else:
+                self.remaining = max(0, self.remaining - 1)
+            return self.remaining, self.reset_at
+
+
+def _repo(owner, index):
+    links = ""
+    if index % 10 == 0:
+        links = f" See https://github.com/{owner}/repo-{index + 1} and https://github.com/{owner}/repo-{index + 2}"
+    return {
+        "name": f"repo-{index}",
+        "full_name": f"{owner}/repo-{index}",
+        "owner": {"login": owner},
+        "description": f"Service {index} built with Python and Docker.{links}",
+        "language": "Python",
+        "size": 100 + index,
+        "stargazers_count": index % 17,
+        "forks_count": index % 5,
+        "watchers_count": index % 11,
+    }
+
+
+def _readme(owner, index, repos):
+    """README linking to itself, its parent and two children, so linked repos form a tree with back links."""
+    lines = [f"# repo-{index}", "", f"Clone: https://github.com/{owner}/repo-{index}.git"]
+    if index:
+        lines.append(f"Part of https://github.com/{owner.upper()}/repo-{(index - 1) // 2}/tree/main")
+    for child in (2 * index + 1, 2 * index + 2):
+        if child < repos:
+            lines.append(f"- Uses https://github.com/{owner}/repo-{child}")
+    return "\n".join(lines) + "\n"
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, format, *args):
+        pass
+
+    def do_GET(self):
+        state = self.server.state
+        if state.latency:
+            time.sleep(state.latency)
+        if not state.arrive(self.client_address):
+            return self.send_json(403, {"message": "API rate limit exceeded"}, {})
+
+        url = urlparse(self.path)
+        query = {key: values[0] for key, values in parse_qs(url.query).items()}
+        parts = [part for part in url.path.split("/") if part]
+
+        if len(parts) == 3 and parts[0] == "users" and parts[2] == "repos":
+            owner = parts[1]
+            return self.send_page([_repo(owner, i) for i in range(state.repos)], url.path, query)
+        if len(parts) == 4 and parts[0] == "repos" and parts[3] == "commits":
+            author = query.get("author", parts[1])
+            commits = [{"sha": f"{i:040x}", "author": {"login": author}} for i in range(state.commits)]
+            return self.send_page(commits, url.path, query)
+        if len(parts) >= 3 and parts[0] == "repos":
+            owner, name = parts[1], parts[2]
+            if not name.startswith("repo-") or not name[5:].isdigit() or int(name[5:]) >= state.repos:
+                return self.send_json(404, {"message": "Not Found"})
+            repo = _repo(owner, int(name[5:]))
+            if len(parts) == 3:
+                return self.send_json(200, repo)
+            if parts[3:] == ["contents", "README.md"]:
+                content = base64.b64encode(_readme(owner, int(name[5:]), state.repos).encode("utf-8")).decode("ascii")
+                return self.send_json(200, {"name": "README.md", "encoding": "base64", "content": content})
+        return self.send_json(404, {"message": "Not Found"})
+
+    def send_page(self, items, path, query):
+        per_page = min(int(query.get("per_page", 30)), 100)
+        page = int(query.get("page", 1))
+        last = max(1, -(-len(items) // per_page))
+        links = []
+        for rel, number in (("next", page + 1), ("last", last)):
+            if number <= last and (rel != "next" or page < last):
+                link_query = urlencode({**query, "per_page": per_page, "page": number})
+                links.append(f'<http://{self.headers["Host"]}{path}?{link_query}>; rel="{rel}"')
+        headers = {"Link": ", ".join(links)} if links else {}
+        self.send_json(200, items[(page - 1) * per_page:page * per_page], headers)
+
+    def send_json(self, status, payload, headers=None):
+        state = self.server.state
+        body = json.dumps(payload).encode("utf-8")
+        etag = f'"{hashlib.sha1(body).hexdigest()}"'
+        not_modified = status == 200 and self.headers.get("If-None-Match") == etag
+        if status == 403:
+            remaining, reset_at = 0, state.reset_at
+        else:
+            remaining, reset_at = state.charge(not_modified)
+        if not_modified:
+            status, body = 304, b""
+
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.send_header("X-RateLimit-Limit", str(state.quota))
+        self.send_header("X-RateLimit-Remaining", str(remaining))
+        self.send_header("X-RateLimit-Reset", str(int(reset_at) + 1))
+        if status in (200, 304):
+            self.send_header("ETag", etag)
+            self.send_header("Last-Modified", LAST_MODIFIED)
+        for key, value in (headers or {}).items():
+            self.send_header(key, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+
+def StartStubServer(port=0, **state_kwargs):
+    """Serve the stub in a background thread; returns (server, base_url). server.state holds the counters."""
+    server = ThreadingHTTPServer(("127.0.0.1", port), StubHandler)
+    server.daemon_threads = True
+    server.state = StubState(**state_kwargs)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, f"http://127.0.0.1:{server.server_address[1]}"
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Serve a local GitHub REST API stub.")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--repos", type=int, default=250)
+    parser.add_argument("--commits", type=int, default=120)
+    parser.add_argument("--latency-ms", type=float, default=20)
+    parser.add_argument("--quota", type=int, default=5000)
+    args = parser.parse_args()
+    server, base_url = StartStubServer(args.port, repos=args.repos, commits=args.commits,
+                                       latency=args.latency_ms / 1000, quota=args.quota)
+    print(f"GitHub stub listening on {base_url} (Ctrl+C to stop)")
+    try:
+        while True:
+            time.sleep(3600)
+    except KeyboardInterrupt:
+        server.shutdown()
@@ -10,15 +10,15 @@ project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
 if project_root not in sys.path:
     sys.path.append(project_root)
 
-from core.ModelInitializers.DataIngestion import LoadDocument
-from core.ScoreCalculators.ScoreCalculators import (
-    CalculateQuantitativeScore, 
-    CalculateBooleanScore,
-    CalculateTextualScore
-)
+from core.ModelInitializers.DataIngestion import LoadDocument, GetDocumentHash
+from core.Pipeline.BulkScreening import PASSING_SCORE
+from core.Pipeline.CandidateRanking import CandidateRanking
+from core.Pipeline.IncrementalRescoring import RescoreStoredResumes
+from core.Pipeline.ScoreStore import GetScoreStore
+from core.ScoreCalculators.ScoringEngine import ScoreResume
 from core.ModelInitializers.Model import LoadModel
 from core.ModelInitializers.Embedding import DownloadGeminiEmbedding
-from interfaces.admin.ClassificationModel import ClassifyParameter
+from interfaces.admin.ClassificationModel import ClassifyParameters
 import time
 from interfaces.utils.ParameterManager import ParameterManager
 
@@ -82,43 +82,45 @@ def admin_interface():
     # Reset parameters button
     if st.button("Reset Parameters"):
         st.session_state.current_session_parameters = []
+        st.session_state.pending_quantitative = []
         st.rerun()
     
+    # Quantitative parameters waiting for their maximum value and benefit type
+    if 'pending_quantitative' not in st.session_state:
+        st.session_state.pending_quantitative = []
+    
     with st.form("parameter_form"):
-        st.write("### Add New Parameter")
-        name = st.text_input("Parameter Name (e.g., 'Years of Experience')")
+        st.write("### Add New Parameters")
+        names = st.text_area("Parameter Names, one per line (e.g., 'Years of Experience')")
         weight = st.slider("Parameter Weight", min_value=0.0, max_value=20.0, value=5.0, step=0.1)
         
-        if st.form_submit_button("Process Parameter"):
-            if name:  # Only process if name is not empty
-                category = ClassifyParameter(name).strip().lower()
-                if category == "quantitative":
-                    st.session_state.new_param = {
-                        "name": name,
-                        "category": category,
-                        "weight": weight,
-                        "max_value": None,
-                        "benefit_type": None
-                    }
-                else:
+        if st.form_submit_button("Process Parameters"):
+            names = [name.strip() for name in names.splitlines() if name.strip()]
+            if names:  # Only process if a name was entered
+                # All names are classified together in one LLM call
+                categories = ClassifyParameters(names)
+                for name in names:
                     new_param = {
                         "name": name,
-                        "category": category,
+                        "category": categories[name].strip().lower(),
                         "weight": weight,
                         "max_value": None,
                         "benefit_type": None
                     }
-                    st.session_state.current_session_parameters.append(new_param)
+                    if new_param["category"] == "quantitative":
+                        st.session_state.pending_quantitative.append(new_param)
+                    else:
+                        st.session_state.current_session_parameters.append(new_param)
                 st.rerun()
     
-    if 'new_param' in st.session_state:
-        st.write("### Set Quantitative Parameter Details")
-        st.session_state.new_param["max_value"] = st.number_input("Maximum Value", min_value=0.1, value=10.0, step=0.1)
-        st.session_state.new_param["benefit_type"] = st.selectbox("Benefit Type", ["High is better", "Low is better"])
+    if st.session_state.pending_quantitative:
+        new_param = st.session_state.pending_quantitative[0]
+        st.write(f"### Set Quantitative Parameter Details: {new_param['name']}")
+        new_param["max_value"] = st.number_input("Maximum Value", min_value=0.1, value=10.0, step=0.1)
+        new_param["benefit_type"] = st.selectbox("Benefit Type", ["High is better", "Low is better"])
         
         if st.button("Save Quantitative Parameter"):
-            st.session_state.current_session_parameters.append(st.session_state.new_param)
-            del st.session_state.new_param
+            st.session_state.current_session_parameters.append(st.session_state.pending_quantitative.pop(0))
             st.rerun()
     
     if st.session_state.current_session_parameters:
@@ -156,12 +158,26 @@ def admin_interface():
         col1, col2 = st.columns([1, 4])
         with col1:
             if st.button("Save All Parameters", key="save_params"):
-                param_manager.save_parameters(st.session_state.current_session_parameters)
+                st.session_state.parameter_diff = param_manager.save_parameters(st.session_state.current_session_parameters)
                 st.success("Parameters saved successfully!")
                 # Keep the parameters in session until explicitly reset
         with col2:
             st.info("Click 'Reset Parameters' at the top to start fresh.")
 
+    # Stored candidates only need the added or edited parameters evaluated
+    diff = st.session_state.get("parameter_diff")
+    score_store = GetScoreStore()
+    if diff and (diff["added"] or diff["changed"]) and score_store is not None and score_store.count():
+        st.info(f"{len(diff['added'])} added and {len(diff['changed'])} edited parameters have not been scored "
+                f"for the {score_store.count()} stored candidates yet.")
+        if st.button("Update Stored Candidates", key="rescore_stored"):
+            with st.spinner("Scoring the new parameters..."):
+                summary = RescoreStoredResumes()
+            st.success(f"Rescored {summary['rescored']} candidates with {summary['evaluations']} parameter evaluations.")
+            if summary["unavailable"]:
+                st.warning(f"{summary['unavailable']} candidates could not be rescored: their resume text is no longer stored.")
+            del st.session_state.parameter_diff
+
 def user_interface():
     param_manager = ParameterManager()
     
@@ -186,70 +202,33 @@ def user_interface():
                 # Extract resume text
                 resume_text = " ".join([doc.text for doc in documents])
                 
-                parameter_details = param_manager.get_parameter_details()
+                plan = param_manager.get_scoring_plan()
+                parameter_details = plan.details
                 if not parameter_details:
                     st.warning("No parameters configured. Please set up parameters in the Admin Section first.")
                     return
                     
-                scores = {}
-                total_weighted_score = 0.0
-                total_weight = 0.0
-                
-                for param_name, details in parameter_details.items():
+                result = ScoreResume(parameter_details, query_engine, resume_text)
+
+                # Keep the raw scores so weights can be changed later without re-scoring
+                file_hash = GetDocumentHash(documents)
+                score_store = GetScoreStore()
+                if score_store is not None and file_hash and result["scores"]:
                     try:
-                        parameter_type = details["type"].lower()
-                        weight = float(details.get("weight", 0))
-                        
-                        if weight <= 0:
-                            continue
-                            
-                        if parameter_type == "textual":
-                            if debug_mode:
-                                st.write(f"---\nProcessing textual parameter: {param_name}")
-                                st.write("Parameter details:", details)
-                                st.write("Resume text sample:", resume_text[:500] + "...")
-                                
-                            score = CalculateTextualScore(
-                                parameter=details["description"],
-                                resume_text=resume_text
-                            )
-                            
-                            if debug_mode:
-                                st.write(f"Response is calculated")
-                                st.write("---")
-                                
-                        elif parameter_type == "quantitative":
-                            score = CalculateQuantitativeScore(
-                                parameter=details["description"],
-                                max_value=details["max_value"],
-                                benefit_type=details["benefit_type"],
-                                query_engine=query_engine
-                            )
-                        elif parameter_type == "boolean":
-                            score = CalculateBooleanScore(
-                                parameter=details["description"],
-                                query_engine=query_engine
-                            )
-                        
-                        weighted_score = score * weight
-                        scores[param_name] = {
-                            "raw_score": score,
-                            "weighted_score": weighted_score,
-                            "weight": weight
-                        }
-                        
-                        if debug_mode:
-                            st.write(f"Final weighted score for {param_name}: {weighted_score}")
-                        
-                        total_weighted_score += weighted_score
-                        total_weight += weight
-                        
+                        score_store.put_scores(file_hash, result["scores"], label=uploaded_file.name, text=resume_text)
                     except Exception as e:
-                        st.warning(f"Error processing parameter {param_name}: {str(e)}")
-                        if debug_mode:
-                            st.error(f"Full error details for {param_name}: {str(e)}")
-                            st.exception(e)
-                        continue
+                        print(f"Error storing scores: {e}")
+                scores = result["scores"]
+                total_weighted_score = result["total_weighted_score"]
+                total_weight = result["total_weight"]
+                
+                if debug_mode:
+                    st.write("Resume text sample:", resume_text[:500] + "...")
+                    for param_name, details in scores.items():
+                        st.write(f"Final weighted score for {param_name}: {details['weighted_score']}")
+                
+                for param_name, error in result["errors"].items():
+                    st.warning(f"Error processing parameter {param_name}: {error}")
                 
                 # Only calculate final score if we have valid scores
                 if scores and total_weight > 0:
@@ -259,8 +238,7 @@ def user_interface():
                     
                     # Calculate final score as percentage
                     final_score = float((total_weighted_score / total_weight))
-                    passing_score = 70.0
-                    status = "PASS" if final_score >= passing_score else "FAIL"
+                    status = "PASS" if final_score >= PASSING_SCORE else "FAIL"
                     
                     # Create professional score display with darker background
                     st.markdown(f"""
@@ -273,6 +251,16 @@ def user_interface():
                         </div>
                     </div>
                     """, unsafe_allow_html=True)
+
+                    # Compare against every stored candidate, not just the fixed passing score
+                    if score_store is not None:
+                        try:
+                            ranking = CandidateRanking.from_score_store(score_store, plan)
+                            if len(ranking) > 1:
+                                percentile = ranking.total_percentiles([final_score])[0]
+                                st.info(f"Scores at or above {percentile:.0f}% of the {len(ranking)} stored candidates.")
+                        except Exception as e:
+                            print(f"Error ranking against stored candidates: {e}")
                     
                     # Display key metrics with darker background
                     col1, col2, col3 = st.columns(3)
@@ -303,7 +291,7 @@ def user_interface():
                             <h3 style='color: #ffffff;'>Passing Score</h3>
                         """, unsafe_allow_html=True)
                         st.markdown(f"""
-                            <h2 style='color: #ffffff;'>{passing_score:.2f}</h2>
+                            <h2 style='color: #ffffff;'>{PASSING_SCORE:.2f}</h2>
                         </div>
                         """, unsafe_allow_html=True)
                     
@@ -342,14 +330,47 @@ def user_interface():
             st.error(f"An error occurred: {str(e)}")
             st.exception(e)  # Show detailed error in development
 
+def ranking_interface():
+    param_manager = ParameterManager()
+
+    st.title("Candidate Ranking")
+
+    plan = param_manager.get_scoring_plan()
+    score_store = GetScoreStore()
+    if not len(plan) or score_store is None or not score_store.count():
+        st.warning("No scored candidates yet. Upload resumes in the User Section or run a bulk screening first.")
+        return
+
+    ranking = CandidateRanking.from_score_store(score_store, plan)
+    required = st.multiselect("Required", list(plan.groups["boolean"]))
+    top = st.number_input("Show top", min_value=1, max_value=max(1, len(ranking)), value=min(20, len(ranking)))
+
+    labels = score_store.labels()
+    best = ranking.top_k(int(top), require=required)
+    if not best:
+        st.info("No candidates pass the selected filters.")
+        return
+    st.dataframe(pd.DataFrame([
+        {
+            "Rank": entry["rank"],
+            "Candidate": labels.get(entry["candidate"], entry["candidate"][:16]),
+            "Score": f"{entry['total']:.2f}",
+            "Percentile": f"{entry['percentile']:.0f}"
+        }
+        for entry in best
+    ]), hide_index=True, use_container_width=True)
+    st.caption(f"{len(ranking)} stored candidates")
+
 def main():
     setup_page_config()
     
     st.sidebar.title("Navigation")
-    page = st.sidebar.selectbox("Go to", ["Admin Section", "User Section"])
+    page = st.sidebar.selectbox("Go to", ["Admin Section", "User Section", "Candidate Ranking"])
     
     if page == "Admin Section":
         admin_interface()
+    elif page == "Candidate Ranking":
+        ranking_interface()
     else:
         user_interface()
 
@@ -0,0 +1,57 @@
+import numpy as np
+import pytest
+
+from core.Pipeline.CandidateRanking import CandidateRanking
+from interfaces.utils.ParameterManager import CompileParameterDetails
+
+PARAMETERS = CompileParameterDetails([
+    {"name": "Knows Docker", "category": "boolean", "weight": 1.0},
+    {"name": "Proficiency in Python", "category": "textual", "weight": 3.0},
+])
+NAN = np.nan
+
+
+def ranking(matrix):
+    return CandidateRanking([f"c{i}" for i in range(len(matrix))], PARAMETERS, np.array(matrix, dtype=np.float64))
+
+
+def ranked(results):
+    return [result["candidate"] for result in results]
+
+
+def test_top_k_is_best_first():
+    pool = ranking([[100, 40], [0, 90], [100, 80], [NAN, NAN], [0, 10]])
+
+    best = pool.top_k(2)
+
+    assert ranked(best) == ["c2", "c1"]
+    assert [result["rank"] for result in best] == [1, 2]
+    assert best[0]["total"] == pytest.approx(85.0)
+    # Unscored candidates are never ranked
+    assert ranked(pool.top_k(10)) == ["c2", "c1", "c0", "c4"]
+
+
+def test_top_k_reweights_without_rescoring():
+    pool = ranking([[100, 40], [0, 90], [100, 80]])
+
+    assert ranked(pool.top_k(3, weights={"knows_docker": 10.0})) == ["c2", "c0", "c1"]
+    assert ranked(pool.top_k(3, weights=[0.0, 1.0])) == ["c1", "c2", "c0"]
+    # The configured weights are unchanged
+    assert ranked(pool.top_k(3)) == ["c2", "c1", "c0"]
+
+
+def test_ties_at_the_cut_keep_pool_order():
+    pool = ranking([[0, 50]] * 50 + [[100, 90]])
+    expected = ["c50"] + [f"c{i}" for i in range(9)]
+
+    assert ranked(pool.top_k(10)) == expected
+    assert ranked(pool.top_k(10, weights=[0.0, 1.0])) == expected
+
+
+def test_required_parameters_filter():
+    pool = ranking([[100, 40], [0, 90], [NAN, 95]])
+
+    assert ranked(pool.top_k(3, require=["knows_docker"])) == ["c0"]
+    assert ranked(pool.top_k(3, min_scores={"proficiency_in_python": 90})) == ["c2", "c1"]
+    with pytest.raises(KeyError):
+        pool.filter_mask(require=["knows_kubernetes"])
@@ -0,0 +1,66 @@
+import pytest
+
+from core.GitHub import CrawlLinkedRepos, GitHubClient, GitHubResponseCache
+from testing.GitHubStubServer import StartStubServer
+
+
+class CountingLimiter:
+    def __init__(self):
+        self.calls = 0
+
+    def wait_if_needed(self):
+        self.calls += 1
+
+
+@pytest.fixture
+def stub():
+    server, base_url = StartStubServer(repos=250)
+    yield server, base_url
+    server.shutdown()
+    server.server_close()
+
+
+def test_get_all_follows_link_header(stub):
+    server, base_url = stub
+    client = GitHubClient(base_url=base_url, use_cache=False)
+
+    repos = client.get_all("users/candidate/repos")
+
+    assert [repo["name"] for repo in repos] == [f"repo-{i}" for i in range(250)]
+    assert server.state.requests == 3
+    assert len(client.get_all("users/candidate/repos", max_pages=2)) == 200
+
+
+def test_not_modified_is_served_from_the_cache(stub, tmp_path):
+    server, base_url = stub
+    cache = GitHubResponseCache(str(tmp_path / "github.sqlite3"))
+    client = GitHubClient(base_url=base_url, cache=cache)
+    client.rate_limiter = CountingLimiter()
+
+    first = client.get_json("repos/candidate/repo-1")
+    assert client.get_json("repos/candidate/repo-1") == first
+    assert server.state.requests == 1
+
+    cache._connect().execute("UPDATE responses SET expires_at = 0")
+    response = client.get("repos/candidate/repo-1")
+
+    assert response.status_code == 200
+    assert response.json() == first
+    assert server.state.requests == 2
+    assert server.state.not_modified == 1
+    assert cache.stats()["revalidated"] == 1
+    # The revalidation could have come back as a 200, so it took a limiter token too
+    assert client.rate_limiter.calls == 2
+
+
+def test_crawler_stops_at_its_budget(stub):
+    server, base_url = stub
+    client = GitHubClient(base_url=base_url, use_cache=False)
+
+    graph = CrawlLinkedRepos(["candidate/repo-1", "candidate/repo-2"], root="candidate/repo-0", client=client,
+                             max_depth=4, max_requests=5)
+
+    assert graph["requests"] == 5
+    assert graph["budget_exhausted"]
+    assert server.state.requests == 5
+    assert any(node.get("error") == "Request budget exhausted" for node in graph["nodes"].values())
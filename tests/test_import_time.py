@@ -0,0 +1,16 @@
+import os
+
+import pytest
+
+from testing.BenchmarkImportTime import BUDGETS_MS, DEFERRED_MODULES, measure_import
+
+# Same knob as --budget-scale, for slow CI machines
+BUDGET_SCALE = float(os.getenv("IMPORT_BUDGET_SCALE", "1"))
+
+
+@pytest.mark.parametrize("module", list(BUDGETS_MS))
+def test_module_imports_within_budget(module):
+    cumulative, total_us = measure_import(module)
+
+    assert [name for name in DEFERRED_MODULES if name in cumulative] == []
+    assert total_us / 1000 <= BUDGETS_MS[module] * BUDGET_SCALE
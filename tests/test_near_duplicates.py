@@ -0,0 +1,57 @@
+import pytest
+
+from core.Pipeline.NearDuplicates import ChangedLines, NearDuplicateIndex, NormalizedLines
+from core.ScoreCalculators.ScoringEngine import ReusableScores
+from interfaces.utils.ParameterManager import ParameterDefinitionHash
+
+PARAMETERS = {
+    "proficiency_in_python": {"type": "textual", "weight": 6.0, "max_value": None, "benefit_type": "lower",
+                              "description": "Proficiency in Python"},
+    "knowledge_in_ml": {"type": "textual", "weight": 4.0, "max_value": None, "benefit_type": "lower",
+                        "description": "Knowledge in ML"},
+}
+
+RESUME = "\n".join(
+    ["Jane Doe", "EXPERIENCE", "5 years Python"]
+    + [f"- Shipped release {i} of the billing platform to customers in region {i}" for i in range(40)]
+)
+
+
+def stored_scores():
+    return {name: {"raw_score": 80.0, "source": "llm", "definition": ParameterDefinitionHash(details)}
+            for name, details in PARAMETERS.items()}
+
+
+@pytest.fixture
+def index(tmp_path):
+    return NearDuplicateIndex(str(tmp_path / "near_duplicates.sqlite3"))
+
+
+def test_changed_lines_include_removed_lines():
+    previous = NormalizedLines("Jane Doe\n5 years Python\nDocker")
+    assert ChangedLines("Jane Doe\n5 years Java\nDocker", previous) == ["5 years Java", "5 years python"]
+    assert ChangedLines("Jane Doe\nDocker", previous) == ["5 years python"]
+
+
+def test_edited_away_skill_is_rescored(index):
+    index.add("original", RESUME, stored_scores())
+    match = index.find(RESUME.replace("5 years Python", "5 years Java"))
+
+    assert match["resume_hash"] == "original"
+    assert ReusableScores(PARAMETERS, match["scores"], match["changed_lines"]) == {"knowledge_in_ml": 80.0}
+
+
+def test_short_skill_names_are_not_reused_when_mentioned():
+    scores = stored_scores()
+    assert ReusableScores(PARAMETERS, scores, ["- Built ML and AI pipelines"]) == {"proficiency_in_python": 80.0}
+    # Removed lines come back lower-cased
+    assert ReusableScores(PARAMETERS, scores, ["built ml pipelines"]) == {"proficiency_in_python": 80.0}
+
+
+def test_description_without_specific_words_is_never_reused():
+    parameters = {"skills": {"type": "textual", "weight": 1.0, "max_value": None, "benefit_type": "lower",
+                             "description": "Skills"}}
+    scores = {"skills": {"raw_score": 50.0, "source": "llm", "definition": ParameterDefinitionHash(parameters["skills"])}}
+
+    assert ReusableScores(parameters, scores, ["- Led a team of 8"]) == {}
+    assert ReusableScores(parameters, scores, []) == {"skills": 50.0}
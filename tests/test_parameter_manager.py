@@ -0,0 +1,64 @@
+import os
+import stat
+
+import pytest
+
+from interfaces.utils.ParameterManager import ParameterManager
+
+PARAMETERS = [{"name": "Knows Docker", "category": "boolean", "weight": 3.0}]
+
+
+@pytest.fixture
+def manager(tmp_path):
+    manager = ParameterManager()
+    manager.file_path = tmp_path / "parameters.json"
+    return manager
+
+
+def file_mode(path):
+    return stat.S_IMODE(os.stat(path).st_mode)
+
+
+def test_save_keeps_the_file_permissions(manager):
+    manager.file_path.write_text("[]")
+    os.chmod(manager.file_path, 0o644)
+
+    manager.save_parameters(PARAMETERS)
+
+    assert file_mode(manager.file_path) == 0o644
+    assert manager.load_parameters() == PARAMETERS
+
+
+def test_new_file_gets_the_umask_permissions(manager):
+    umask = os.umask(0o022)
+    try:
+        manager.save_parameters(PARAMETERS)
+    finally:
+        os.umask(umask)
+
+    assert file_mode(manager.file_path) == 0o644
+
+
+def test_scoring_plan_follows_saves(manager):
+    diff = manager.save_parameters(PARAMETERS)
+
+    assert diff["added"] == ["knows_docker"]
+    assert list(manager.get_parameter_details()) == ["knows_docker"]
+    assert len(manager.get_scoring_plan()) == 1
+
+
+def test_scoring_plan_vectors(manager):
+    manager.save_parameters(PARAMETERS + [
+        {"name": "Years of experience", "category": "Quantitative", "weight": 2.0, "max_value": 10,
+         "benefit_type": "High is better"},
+        {"name": "Has a degree", "category": "boolean", "weight": 0},
+    ])
+    plan = manager.get_scoring_plan()
+
+    assert plan.names == ("knows_docker", "years_of_experience", "has_a_degree")
+    assert plan.weights.tolist() == [3.0, 2.0, 0.0]
+    assert not plan.weights.flags.writeable
+    assert plan.groups["boolean"] == ("knows_docker", "has_a_degree")
+    assert plan.groups["quantitative"] == ("years_of_experience",)
+    assert plan.groups["textual"] == ()
+    assert plan.total_weight == 5.0
@@ -0,0 +1,97 @@
+import asyncio
+import importlib
+
+import pytest
+
+RateLimiterModule = importlib.import_module("interfaces.utils.RateLimiter")
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_first_window_admits_at_most_max_requests(monkeypatch):
+    monkeypatch.setattr(RateLimiterModule.time, "monotonic", FakeClock())
+    limiter = RateLimiterModule.RateLimiter(max_requests=50, window_size=60)
+
+    # 200 callers arrive at once; each may start after its reserved wait
+    waits = [limiter.reserve() for _ in range(200)]
+    assert sum(1 for wait in waits if wait < 60) <= 50
+    assert waits[:5] == [0.0] * 5
+
+
+def test_shared_bucket_starts_at_the_burst(monkeypatch, tmp_path):
+    monkeypatch.setattr(RateLimiterModule.time, "time", FakeClock())
+    backend = RateLimiterModule.SQLiteRateLimitBackend(str(tmp_path / "buckets.sqlite3"))
+    limiter = RateLimiterModule.RateLimiter(max_requests=50, window_size=60, key="shared", backend=backend)
+
+    waits = [limiter.reserve() for _ in range(200)]
+    assert sum(1 for wait in waits if wait < 60) <= 50
+
+
+def test_waits_once_the_burst_is_spent(monkeypatch):
+    monkeypatch.setattr(RateLimiterModule.time, "monotonic", FakeClock())
+    limiter = RateLimiterModule.RateLimiter(max_requests=10, window_size=10)
+
+    assert limiter.reserve() == 0.0
+    assert limiter.reserve() == pytest.approx(10 / 9)
+
+
+def test_budget_mismatch_raises(monkeypatch):
+    monkeypatch.setattr(RateLimiterModule, "_limiters", {})
+    limiter = RateLimiterModule.GetRateLimiter("test", max_requests=10, window_size=1)
+
+    assert RateLimiterModule.GetRateLimiter("test") is limiter
+    assert RateLimiterModule.GetRateLimiter("test", max_requests=10) is limiter
+    with pytest.raises(ValueError):
+        RateLimiterModule.GetRateLimiter("test", max_requests=20)
+
+
+def test_async_wait_reserves_off_the_event_loop(monkeypatch):
+    limiter = RateLimiterModule.RateLimiter(max_requests=10, window_size=10)
+    loop_threads = []
+    reserve = limiter.reserve
+
+    def recording_reserve():
+        import threading
+        loop_threads.append(threading.current_thread())
+        return reserve()
+
+    monkeypatch.setattr(limiter, "reserve", recording_reserve)
+
+    async def main():
+        import threading
+        await limiter.async_wait_if_needed()
+        return threading.current_thread()
+
+    assert asyncio.run(main()) is not loop_threads[0]
+
+
+def test_rate_limited_embedding_waits_off_the_event_loop():
+    from core.Backends.EmbeddingBackends import HashEmbedding
+    from core.ModelInitializers.RateLimitedEmbedding import RateLimitedEmbedding
+
+    class RecordingLimiter:
+        def __init__(self):
+            self.threads = []
+
+        def wait_if_needed(self):
+            import threading
+            self.threads.append(threading.current_thread())
+
+    limiter = RecordingLimiter()
+    embedding = RateLimitedEmbedding(HashEmbedding(), limiter)
+
+    async def main():
+        import threading
+        await embedding.aget_query_embedding("python")
+        await embedding.aget_text_embedding("docker")
+        return threading.current_thread()
+
+    loop_thread = asyncio.run(main())
+    assert len(limiter.threads) == 2
+    assert loop_thread not in limiter.threads
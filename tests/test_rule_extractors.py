@@ -0,0 +1,91 @@
+from datetime import date
+
+import pytest
+
+from core.ModelInitializers.ResumeSections import DetectSectionHeading
+from core.ScoreCalculators.RuleExtractors import DATE_RANGE_PATTERN, ExtractBoolean, ExtractExperienceYears
+from core.ScoreCalculators.ScoringEngine import RULE_CONFIDENCE_THRESHOLD
+
+TODAY = date(2024, 6, 1)
+
+
+def confident(result):
+    return result["confidence"] >= RULE_CONFIDENCE_THRESHOLD
+
+
+@pytest.mark.parametrize("parameter, resume", [
+    ("Knows SQL", "SKILLS\nMySQL, PostgreSQL, SQLite"),
+    ("Knows Docker", "EXPERIENCE\nDockerized the billing services"),
+    ("Knows Java", "SKILLS\nJavaScript, TypeScript"),
+])
+def test_term_inside_another_word_is_left_to_the_llm(parameter, resume):
+    result = ExtractBoolean(parameter, resume)
+    assert result["value"] is False
+    assert not confident(result)
+
+
+@pytest.mark.parametrize("parameter, resume", [
+    ("Knows Python", "SKILLS\nPython3, Bash"),
+    ("Knows Java", "EXPERIENCE\nJava8 backend developer"),
+    ("Knows Python", "SKILLS\nPython 3.10"),
+    ("Knows Kubernetes", "SKILLS\nDocker, K8s"),
+])
+def test_versioned_and_synonym_mentions_count(parameter, resume):
+    result = ExtractBoolean(parameter, resume)
+    assert result["value"] is True
+    assert confident(result)
+
+
+def test_negated_mention_is_left_to_the_llm():
+    result = ExtractBoolean("Knows Python", "SUMMARY\nNot familiar with Python, mostly Java")
+    assert result["value"] is False
+    assert not confident(result)
+    # A negation in another clause does not cancel the mention
+    assert ExtractBoolean("Knows Python", "SKILLS\nPython, Go; not Rust")["value"] is True
+
+
+def test_absent_known_term_is_confident():
+    result = ExtractBoolean("Knows Docker", "SKILLS\nKubernetes, Terraform")
+    assert result["value"] is False
+    assert confident(result)
+
+
+@pytest.mark.parametrize("parameter, resume", [
+    ("Knows Go", "PROJECTS\nWill go live in May"),
+    ("Knows C", "SKILLS\nC/C++, R&D"),
+])
+def test_ambiguous_terms_are_never_confident(parameter, resume):
+    assert not confident(ExtractBoolean(parameter, resume))
+
+
+def test_certification_needs_a_certification_line():
+    assert ExtractBoolean("Has AWS Certification", "CERTIFICATIONS\nAWS Solutions Architect")["value"] is True
+    result = ExtractBoolean("Has AWS Certification", "EXPERIENCE\nDeployed services on AWS")
+    assert result["value"] is False
+    assert not confident(result)
+
+
+def test_date_tokens_are_anchored():
+    found = [match.group(0) for match in DATE_RANGE_PATTERN.finditer("Acme Inc  2020 - 2022\nSept 2019 - Mar. 2021")]
+    assert found == ["2020 - 2022", "Sept 2019 - Mar. 2021"]
+
+
+@pytest.mark.parametrize("dates, years", [
+    ("Jan 2015 - Dec 2018", 4.0),
+    ("2016 - 2021", 5.0),
+    ("06/2020 - present", 4.1),
+])
+def test_experience_ranges_are_inclusive(dates, years):
+    result = ExtractExperienceYears(f"EXPERIENCE\nEngineer at Acme, {dates}", today=TODAY)
+    assert result["value"] == years
+
+
+def test_overlapping_ranges_are_merged():
+    resume = "EXPERIENCE\nAcme, Jan 2015 - Dec 2018\nGlobex, Jan 2018 - Dec 2019"
+    assert ExtractExperienceYears(resume, today=TODAY)["value"] == 5.0
+
+
+def test_only_whole_line_headings_split_sections():
+    assert DetectSectionHeading("Work Experience") is not None
+    assert DetectSectionHeading("Project Manager") is None
+    assert DetectSectionHeading("Research Assistant") is None
@@ -0,0 +1,86 @@
+import importlib
+
+import pytest
+
+from core.Pipeline.ScoreStore import ScoreStore
+from core.ScoreCalculators.ScoringEngine import ScoreResume
+
+# The package re-exports the RateLimiter class under the module's name
+RateLimiter = importlib.import_module("interfaces.utils.RateLimiter")
+
+PARAMETERS = {
+    "knows_docker": {"type": "boolean", "weight": 3.0, "max_value": None, "benefit_type": "lower",
+                     "description": "Knows Docker"},
+    "years_of_experience": {"type": "quantitative", "weight": 8.0, "max_value": 10.0, "benefit_type": "higher",
+                            "description": "Years of Experience"},
+}
+
+
+class RateLimitedEngine:
+    """Query engine whose every call is rejected with a 429, like an exhausted quota."""
+
+    def __init__(self):
+        self.calls = 0
+
+    def query(self, text):
+        self.calls += 1
+        raise RuntimeError("429 Resource has been exhausted")
+
+
+class AnsweringEngine:
+    def query(self, text):
+        return "True" if text.startswith("Does") else "6"
+
+
+@pytest.fixture
+def store(tmp_path):
+    return ScoreStore(str(tmp_path / "scores.sqlite3"))
+
+
+@pytest.fixture(autouse=True)
+def no_backoff(monkeypatch):
+    monkeypatch.setattr(RateLimiter.time, "sleep", lambda seconds: None)
+
+
+def test_rate_limited_parameters_are_errors_not_zero():
+    engine = RateLimitedEngine()
+    result = ScoreResume(PARAMETERS, engine, "Resume text", min_rule_confidence=2)
+
+    assert result["scores"] == {}
+    assert set(result["errors"]) == set(PARAMETERS)
+    assert result["final_score"] is None
+    # One call plus the bounded retries per parameter
+    assert engine.calls == len(PARAMETERS) * (RateLimiter.RATE_LIMIT_RETRIES + 1)
+
+
+def test_failed_parameters_are_missing_from_the_store(store):
+    result = ScoreResume(PARAMETERS, RateLimitedEngine(), "Resume text", min_rule_confidence=2)
+    store.put_scores("resume", result["scores"], model_id="test", text="Resume text")
+
+    assert store.missing_parameters(PARAMETERS, model_id="test") == {"resume": list(PARAMETERS)}
+    assert store.get_scores("resume", PARAMETERS, model_id="test") == {}
+
+
+def test_partial_failure_only_leaves_the_failed_parameter_missing(store):
+    answered = ScoreResume(PARAMETERS, AnsweringEngine(), "Resume text", min_rule_confidence=2)
+    scores = dict(answered["scores"])
+    failed = scores.pop("years_of_experience")
+    scores["knows_docker"]["raw_score"] = 100
+    store.put_scores("resume", scores, model_id="test")
+    # Rows for unscored entries are never written, even if a caller passes one
+    store.put_scores("resume", {"years_of_experience": dict(failed, raw_score=float("nan"))}, model_id="test")
+
+    assert store.missing_parameters(PARAMETERS, model_id="test") == {"resume": ["years_of_experience"]}
+    _, totals = store.weighted_totals(PARAMETERS, model_id="test")
+    assert totals[0] == pytest.approx(100.0)
+
+
+def test_rescoring_skips_resumes_stored_without_text(store):
+    from core.Pipeline.IncrementalRescoring import RescoreStoredResumes
+
+    answered = ScoreResume(PARAMETERS, AnsweringEngine(), "Resume text", min_rule_confidence=2)
+    store.put_scores("resume", {"knows_docker": answered["scores"]["knows_docker"]}, model_id="test")
+
+    summary = RescoreStoredResumes(PARAMETERS, score_store=store, model=object())
+    assert summary["unavailable"] == 1
+    assert summary["rescored"] == 0